@@ -10,7 +10,7 @@ import os
 sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..')))
 
 from app.database import Base
-from app.models import User, Transaction, Investment, Budget, TaxDeduction
+from app.models import User, Transaction, Investment, Budget, TaxDeduction, MonthlyRollup, PriceSnapshot, PortfolioSummary
 from app.config import get_settings
 
 settings = get_settings()
@@ -1,18 +1,42 @@
 """Database configuration and session management."""
 from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import get_settings
+from app.services.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool, instrument_engine
 
 settings = get_settings()
 
+# asyncio drivers used for each database backend in async mode
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+# Dialect-specific INSERT constructs that support ON CONFLICT clauses
+UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def get_pool_options() -> dict:
+    """Get the create_engine pool arguments from the DB_POOL_* settings."""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
 # Create SQLAlchemy engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
-)
+engine = create_engine(settings.DATABASE_URL, poolclass=InstrumentedQueuePool, **get_pool_options())
+instrument_engine(engine, "sync")
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -21,6 +45,26 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+def get_async_database_url(database_url: str) -> URL:
+    """Get a database URL with its driver swapped for the asyncio one."""
+    url = make_url(database_url)
+    return url.set(drivername=ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername))
+
+
+# Async engine, only created in async mode
+async_engine = None
+if settings.DATABASE_ASYNC:
+    async_engine = create_async_engine(
+        get_async_database_url(settings.DATABASE_URL),
+        poolclass=InstrumentedAsyncQueuePool,
+        **get_pool_options()
+    )
+    instrument_engine(async_engine.sync_engine, "async")
+
+# Attributes stay loaded after commit, since async sessions cannot lazy-load them
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+
 def get_db():
     """Dependency to get database session."""
     db = SessionLocal()
@@ -28,3 +72,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Dependency to get an async database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,16 +1,41 @@
 """Main FastAPI application entry point."""
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import get_settings
-from app.routers import auth, transactions, investments, budget, tax, dashboard, sms_parser, market_data
+from app.utils.etag import ETAG_HEADER
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from app.utils.profiling import PROFILE_ID_HEADER, PROFILE_SKIPPED_HEADER, ProfilingMiddleware, instrument_routes
+from app.utils.request_metrics import RequestMetricsMiddleware
+from app.database import async_engine
+from app.routers import auth, transactions, investments, budget, tax, dashboard, sms_parser, market_data, portfolio, metrics, admin
+from app.routers import async_transactions, async_budget, async_dashboard
+from app.services.password_hasher import password_hasher
+from app.services.price_scheduler import price_scheduler
+from app.services.sms_batch_parser import shutdown_parse_pool
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop application-wide resources."""
+    if settings.PRICE_REFRESH_ENABLED:
+        price_scheduler.start()
+    yield
+    await price_scheduler.stop()
+    shutdown_parse_pool()
+    password_hasher.shutdown()
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="Indian Personal Finance Management App - Combining Rich Dad principles with Indian Tax Planning",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -21,17 +46,35 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, ETAG_HEADER, PROFILE_ID_HEADER, PROFILE_SKIPPED_HEADER],
 )
 
+# Record per-route latency, SQL and response-size metrics
+if settings.REQUEST_METRICS_ENABLED:
+    app.add_middleware(RequestMetricsMiddleware)
+
+# Async routers replace their sync counterparts in async database mode
+transactions_router = async_transactions.router if settings.DATABASE_ASYNC else transactions.router
+budget_router = async_budget.router if settings.DATABASE_ASYNC else budget.router
+dashboard_router = async_dashboard.router if settings.DATABASE_ASYNC else dashboard.router
+
 # Include routers
 app.include_router(auth.router)
-app.include_router(transactions.router)
+app.include_router(transactions_router)
 app.include_router(investments.router)
-app.include_router(budget.router)
+app.include_router(budget_router)
 app.include_router(tax.router)
-app.include_router(dashboard.router)
+app.include_router(dashboard_router)
 app.include_router(sms_parser.router)
 app.include_router(market_data.router)
+app.include_router(portfolio.router)
+app.include_router(metrics.router)
+app.include_router(admin.router)
+
+# Profile requests that ask for it or run slow
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+    instrument_routes(app)
 
 
 @app.get("/")
@@ -4,5 +4,8 @@ from app.models.transaction import Transaction
 from app.models.investment import Investment
 from app.models.budget import Budget
 from app.models.tax_deduction import TaxDeduction
+from app.models.monthly_rollup import MonthlyRollup
+from app.models.price_snapshot import PriceSnapshot
+from app.models.portfolio_summary import PortfolioSummary
 
-__all__ = ["User", "Transaction", "Investment", "Budget", "TaxDeduction"]
+__all__ = ["User", "Transaction", "Investment", "Budget", "TaxDeduction", "MonthlyRollup", "PriceSnapshot", "PortfolioSummary"]
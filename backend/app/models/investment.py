@@ -2,7 +2,7 @@
 import uuid
 from datetime import datetime, date
 from decimal import Decimal
-from sqlalchemy import Column, String, DateTime, Date, Boolean, Enum, Numeric, ForeignKey
+from sqlalchemy import Column, String, DateTime, Date, Boolean, Enum, Numeric, ForeignKey, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
@@ -47,6 +47,19 @@ class Investment(Base):
     """Investment model for tracking investments and assets."""
     
     __tablename__ = "investments"
+    __table_args__ = (
+        # Portfolio listing and per-section tax deduction lookups
+        Index("ix_investments_user_active_section", "user_id", "is_active", "tax_section"),
+        # Portfolio listing ordered by newest first, with keyset pagination
+        Index("ix_investments_user_active_created", "user_id", "is_active", "created_at", "id"),
+        # Market price refresh only touches active holdings with a ticker
+        Index(
+            "ix_investments_active_ticker",
+            "ticker_symbol",
+            postgresql_where=text("is_active AND ticker_symbol IS NOT NULL"),
+            sqlite_where=text("is_active AND ticker_symbol IS NOT NULL"),
+        ),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -0,0 +1,42 @@
+"""Monthly rollup model."""
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, Date, Integer, Enum, Numeric, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from app.database import Base
+from app.models.transaction import TransactionType, RichDadCategory
+
+
+class MonthlyRollup(Base):
+    """Pre-aggregated transaction totals per user, month and category.
+    
+    Kept up to date by the transaction write paths and rebuildable from the
+    transactions table with rollup_service.rebuild_monthly_rollups. Each
+    (user, month, type, category, rich_dad_category) key has exactly one row,
+    enforced by a unique index that treats a missing rich_dad_category as a
+    value of its own, so concurrent writers add to the same row.
+    """
+    
+    __tablename__ = "monthly_rollups"
+    __table_args__ = (
+        Index(
+            "uq_monthly_rollups_key",
+            "user_id", "month", "type", "category", "rich_dad_category",
+            unique=True,
+            postgresql_nulls_not_distinct=True
+        ),
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    month = Column(Date, nullable=False)  # First day of the month
+    type = Column(Enum(TransactionType), nullable=False)
+    category = Column(String, nullable=False)
+    rich_dad_category = Column(Enum(RichDadCategory), nullable=True)
+    total_amount = Column(Numeric(18, 2), default=0, nullable=False)
+    transaction_count = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    # Relationships
+    user = relationship("User", back_populates="monthly_rollups")
@@ -0,0 +1,27 @@
+"""Portfolio summary model."""
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Integer, Numeric, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+from app.database import Base
+
+
+class PortfolioSummary(Base):
+    """Precomputed asset and liability totals of a user's active investments.
+    
+    Recomputed by the investment write paths and after each scheduled price
+    refresh, so the dashboard reads valuations without touching the network
+    or scanning every investment.
+    """
+    
+    __tablename__ = "portfolio_summaries"
+    
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    total_assets_value = Column(Numeric(18, 2), default=0, nullable=False)
+    total_liabilities_value = Column(Numeric(18, 2), default=0, nullable=False)
+    asset_count = Column(Integer, default=0, nullable=False)
+    liability_count = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    # Relationships
+    user = relationship("User", back_populates="portfolio_summary")
@@ -0,0 +1,24 @@
+"""Price snapshot model."""
+import uuid
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, Numeric, Index
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+
+
+class PriceSnapshot(Base):
+    """Market price of a ticker captured by a scheduled price refresh."""
+    
+    __tablename__ = "price_snapshots"
+    __table_args__ = (
+        # Latest snapshot and price history per ticker
+        Index("ix_price_snapshots_ticker_captured", "ticker_symbol", "captured_at"),
+        # Age of the most recent refresh
+        Index("ix_price_snapshots_captured", "captured_at"),
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    ticker_symbol = Column(String, nullable=False)
+    exchange = Column(String, default="NS", nullable=False)
+    price = Column(Numeric(15, 2), nullable=False)
+    captured_at = Column(DateTime, default=datetime.utcnow, nullable=False)
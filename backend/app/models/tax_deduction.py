@@ -2,7 +2,7 @@
 import uuid
 from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import Column, String, DateTime, Numeric, ForeignKey, Enum
+from sqlalchemy import Column, String, DateTime, Numeric, ForeignKey, Enum, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
@@ -28,6 +28,10 @@ class TaxDeduction(Base):
     """Tax deduction model for tracking tax-saving investments."""
     
     __tablename__ = "tax_deductions"
+    __table_args__ = (
+        # Per-year deduction totals for a user
+        Index("ix_tax_deductions_user_year", "user_id", "financial_year"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -2,7 +2,7 @@
 import uuid
 from datetime import datetime, date
 from decimal import Decimal
-from sqlalchemy import Column, String, DateTime, Date, Boolean, Enum, Numeric, ForeignKey
+from sqlalchemy import Column, String, DateTime, Date, Boolean, Enum, Numeric, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import enum
@@ -45,6 +45,15 @@ class Transaction(Base):
     """Transaction model for income and expenses."""
     
     __tablename__ = "transactions"
+    __table_args__ = (
+        # Date-range listing, keyset pagination, dashboard windows and type filters
+        Index("ix_transactions_user_date", "user_id", "transaction_date", "id"),
+        Index("ix_transactions_user_type_date", "user_id", "type", "transaction_date"),
+        # Category filters on listing and category spending
+        Index("ix_transactions_user_category_date", "user_id", "category", "transaction_date"),
+        # Makes SMS imports idempotent; rows without a fingerprint never conflict
+        Index("ux_transactions_user_sms_fingerprint", "user_id", "sms_fingerprint", unique=True),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -57,6 +66,7 @@ class Transaction(Base):
     merchant_name = Column(String, nullable=True)
     source = Column(Enum(TransactionSource), default=TransactionSource.MANUAL, nullable=False)
     account_identifier = Column(String, nullable=True)  # Last 4 digits
+    sms_fingerprint = Column(String(64), nullable=True)  # Dedup key of SMS imports
     transaction_date = Column(Date, default=date.today, nullable=False)
     is_recurring = Column(Boolean, default=False, nullable=False)
     recurring_frequency = Column(Enum(RecurringFrequency), nullable=True)
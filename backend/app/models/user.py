@@ -28,3 +28,5 @@ class User(Base):
     investments = relationship("Investment", back_populates="user", cascade="all, delete-orphan")
     budgets = relationship("Budget", back_populates="user", cascade="all, delete-orphan")
     tax_deductions = relationship("TaxDeduction", back_populates="user", cascade="all, delete-orphan")
+    monthly_rollups = relationship("MonthlyRollup", back_populates="user", cascade="all, delete-orphan")
+    portfolio_summary = relationship("PortfolioSummary", back_populates="user", uselist=False, cascade="all, delete-orphan")
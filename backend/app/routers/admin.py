@@ -0,0 +1,42 @@
+"""Admin router for operational diagnostics."""
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from app.schemas.profiling import RequestProfile, RequestProfileSummary
+from app.utils.profiling import is_admin_token, profile_buffer
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+def require_admin_token(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Reject requests without the configured admin token."""
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin token required"
+        )
+
+
+@router.get("/profiles", response_model=List[RequestProfileSummary], dependencies=[Depends(require_admin_token)])
+def list_profiles():
+    """List the stored request profiles of this worker, newest first."""
+    return [RequestProfileSummary(**profile.model_dump(exclude={"functions", "sql_timeline"})) for profile in profile_buffer.list()]
+
+
+@router.get("/profiles/{profile_id}", response_model=RequestProfile, dependencies=[Depends(require_admin_token)])
+def get_profile(profile_id: int):
+    """Get a stored request profile with its hottest functions and SQL timeline."""
+    profile = profile_buffer.get(profile_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+    
+    return profile
+
+
+@router.delete("/profiles", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(require_admin_token)])
+def clear_profiles():
+    """Drop the stored request profiles of this worker."""
+    profile_buffer.clear()
+    return None
@@ -0,0 +1,114 @@
+"""Budget router on the async database engine (DATABASE_ASYNC mode)."""
+from typing import List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
+from app.database import get_async_db
+from app.models.budget import Budget
+from app.schemas.budget import BudgetCreate, BudgetUpdate, BudgetResponse, BudgetWithSpending
+from app.services.budget_service import budget_spending_query, budget_with_spending
+from app.utils.dependencies import get_current_user_id
+
+router = APIRouter(prefix="/budgets", tags=["Budgets"])
+
+
+async def get_user_budget(db: AsyncSession, budget_id: UUID, user_id: UUID) -> Budget:
+    """Get one of the user's budgets, or raise 404."""
+    budget = await db.scalar(select(Budget).where(
+        Budget.id == budget_id,
+        Budget.user_id == user_id
+    ))
+    
+    if not budget:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Budget not found"
+        )
+    
+    return budget
+
+
+@router.post("/", response_model=BudgetResponse, status_code=status.HTTP_201_CREATED)
+async def create_budget(
+    budget_data: BudgetCreate,
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Create a new budget."""
+    new_budget = Budget(
+        user_id=user_id,
+        **budget_data.dict()
+    )
+    
+    db.add(new_budget)
+    await db.commit()
+    await db.refresh(new_budget)
+    
+    return new_budget
+
+
+@router.get("/", response_model=List[BudgetWithSpending])
+async def get_budgets(
+    financial_year: str = None,
+    month: Optional[date] = None,
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get all budgets for the current user with spending information.
+    
+    Args:
+        financial_year: Only return budgets for this financial year
+        month: Any date in the month to report spending for (default: current month)
+    """
+    month_start = (month or date.today()).replace(day=1)
+    
+    query = budget_spending_query(user_id, month_start, financial_year)
+    return [budget_with_spending(budget, spent) for budget, spent in (await db.execute(query)).all()]
+
+
+@router.get("/{budget_id}", response_model=BudgetResponse)
+async def get_budget(
+    budget_id: UUID,
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a specific budget."""
+    return await get_user_budget(db, budget_id, user_id)
+
+
+@router.put("/{budget_id}", response_model=BudgetResponse)
+async def update_budget(
+    budget_id: UUID,
+    budget_data: BudgetUpdate,
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Update a budget."""
+    budget = await get_user_budget(db, budget_id, user_id)
+    
+    # Update fields
+    update_data = budget_data.dict(exclude_unset=True)
+    for field, value in update_data.items():
+        setattr(budget, field, value)
+    
+    await db.commit()
+    await db.refresh(budget)
+    
+    return budget
+
+
+@router.delete("/{budget_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_budget(
+    budget_id: UUID,
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Delete a budget."""
+    budget = await get_user_budget(db, budget_id, user_id)
+    
+    await db.delete(budget)
+    await db.commit()
+    
+    return None
@@ -0,0 +1,24 @@
+"""Dashboard router on the async database engine (DATABASE_ASYNC mode)."""
+from uuid import UUID
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_async_db
+from app.schemas.dashboard import RichDadDashboard
+from app.services.dashboard_service import get_rich_dad_dashboard
+from app.utils.dependencies import get_current_user_id
+
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+
+
+@router.get("/", response_model=RichDadDashboard)
+async def get_dashboard(
+    months: int = 6,
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get Rich Dad Dashboard data.
+    
+    The dashboard service runs on the async connection through run_sync,
+    so its queries do not block the event loop.
+    """
+    return await db.run_sync(get_rich_dad_dashboard, str(user_id), months)
@@ -0,0 +1,164 @@
+"""Transactions router on the async database engine (DATABASE_ASYNC mode)."""
+from typing import List, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, status, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import date
+from app.database import get_async_db
+from app.models.transaction import Transaction, TransactionType
+from app.routers.transactions import bulk_response, validate_bulk_items
+from app.schemas.transaction import (
+    TransactionCreate,
+    TransactionUpdate,
+    TransactionResponse,
+    TransactionBulkCreate,
+    TransactionBulkResponse,
+)
+from app.services.rollup_service import add_to_rollup, remove_from_rollup
+from app.services.transaction_service import bulk_insert_transactions, next_page_cursor, transaction_page_query
+from app.utils.dependencies import get_current_user_id
+from app.utils.pagination import NEXT_CURSOR_HEADER
+
+router = APIRouter(prefix="/transactions", tags=["Transactions"])
+
+
+async def get_user_transaction(db: AsyncSession, transaction_id: UUID, user_id: UUID) -> Transaction:
+    """Get one of the user's transactions, or raise 404."""
+    transaction = await db.scalar(select(Transaction).where(
+        Transaction.id == transaction_id,
+        Transaction.user_id == user_id
+    ))
+    
+    if not transaction:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transaction not found"
+        )
+    
+    return transaction
+
+
+@router.post("/", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
+async def create_transaction(
+    transaction_data: TransactionCreate,
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Create a new transaction."""
+    new_transaction = Transaction(
+        user_id=user_id,
+        **transaction_data.dict()
+    )
+    
+    db.add(new_transaction)
+    await db.run_sync(add_to_rollup, new_transaction)
+    await db.commit()
+    await db.refresh(new_transaction)
+    
+    return new_transaction
+
+
+@router.post("/bulk", response_model=TransactionBulkResponse)
+async def create_transactions_bulk(
+    bulk_data: TransactionBulkCreate,
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Create many transactions in a single database transaction.
+    
+    Each item is validated on its own and reported with a per-item status.
+    By default valid items are written and invalid ones skipped; with
+    all_or_nothing, any invalid item rejects the whole batch with 422.
+    """
+    results, valid_items = validate_bulk_items(bulk_data)
+    
+    ids = await db.run_sync(bulk_insert_transactions, user_id, valid_items)
+    await db.commit()
+    
+    return bulk_response(results, ids)
+
+
+@router.get("/", response_model=List[TransactionResponse])
+async def get_transactions(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    transaction_type: Optional[TransactionType] = None,
+    category: Optional[str] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get all transactions for the current user with optional filters.
+    
+    Paged by X-Next-Cursor as in the sync router.
+    """
+    try:
+        query = transaction_page_query(
+            user_id, skip, limit, cursor, transaction_type, category, start_date, end_date
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    
+    transactions = (await db.scalars(query)).all()
+    
+    next_cursor = next_page_cursor(transactions, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    
+    return transactions
+
+
+@router.get("/{transaction_id}", response_model=TransactionResponse)
+async def get_transaction(
+    transaction_id: UUID,
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a specific transaction."""
+    return await get_user_transaction(db, transaction_id, user_id)
+
+
+@router.put("/{transaction_id}", response_model=TransactionResponse)
+async def update_transaction(
+    transaction_id: UUID,
+    transaction_data: TransactionUpdate,
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Update a transaction."""
+    transaction = await get_user_transaction(db, transaction_id, user_id)
+    
+    # Update fields, moving the amount between rollup rows if the key changes
+    update_data = transaction_data.dict(exclude_unset=True)
+    await db.run_sync(remove_from_rollup, transaction)
+    for field, value in update_data.items():
+        setattr(transaction, field, value)
+    await db.run_sync(add_to_rollup, transaction)
+    
+    await db.commit()
+    await db.refresh(transaction)
+    
+    return transaction
+
+
+@router.delete("/{transaction_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_transaction(
+    transaction_id: UUID,
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Delete a transaction."""
+    transaction = await get_user_transaction(db, transaction_id, user_id)
+    
+    await db.run_sync(remove_from_rollup, transaction)
+    await db.delete(transaction)
+    await db.commit()
+    
+    return None
@@ -1,25 +1,54 @@
 """Authentication router for registration and login."""
+from typing import Awaitable, TypeVar
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin, UserResponse, Token
-from app.services.auth_service import (
-    get_password_hash,
-    verify_password,
-    create_access_token,
-    create_refresh_token,
-)
+from app.services.auth_service import create_access_token, create_refresh_token
+from app.services.password_hasher import HasherBusyError, password_hasher
 from app.utils.dependencies import get_current_user
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+T = TypeVar("T")
+
+
+async def run_hasher(operation: Awaitable[T]) -> T:
+    """Await a password hashing operation, or fail with 503 if the hasher is full."""
+    try:
+        return await operation
+    except HasherBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many sign-ins in progress, please retry shortly",
+            headers={"Retry-After": "1"},
+        )
+
+
+def find_user_by_email(db: Session, email: str):
+    """Get the user with an email address, or None."""
+    return db.query(User).filter(User.email == email).first()
+
+
+def save_user(db: Session, user: User) -> User:
+    """Add or update a user and commit."""
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def register(user_data: UserCreate, db: Session = Depends(get_db)):
-    """Register a new user."""
+async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+    """Register a new user.
+    
+    The password is hashed on the hashing process pool; database work runs
+    in the threadpool.
+    """
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await run_in_threadpool(find_user_by_email, db, user_data.email)
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -27,7 +56,7 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await run_hasher(password_hasher.hash(user_data.password))
     new_user = User(
         email=user_data.email,
         hashed_password=hashed_password,
@@ -38,25 +67,34 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
         financial_year_start=user_data.financial_year_start,
     )
     
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
-    
-    return new_user
+    return await run_in_threadpool(save_user, db, new_user)
 
 
 @router.post("/login", response_model=Token)
-def login(credentials: UserLogin, db: Session = Depends(get_db)):
-    """Login and get JWT tokens."""
+async def login(credentials: UserLogin, db: Session = Depends(get_db)):
+    """Login and get JWT tokens.
+    
+    A password hash made with outdated cost parameters is replaced with a
+    fresh one once the password is verified.
+    """
     # Find user by email
-    user = db.query(User).filter(User.email == credentials.email).first()
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    user = await run_in_threadpool(find_user_by_email, db, credentials.email)
+    valid, new_hash = False, None
+    if user:
+        valid, new_hash = await run_hasher(
+            password_hasher.verify_and_update(credentials.password, user.hashed_password)
+        )
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    if new_hash:
+        user.hashed_password = new_hash
+        await run_in_threadpool(save_user, db, user)
+    
     # Create tokens
     access_token = create_access_token(data={"sub": str(user.id)})
     refresh_token = create_refresh_token(data={"sub": str(user.id)})
@@ -69,6 +107,6 @@ def login(credentials: UserLogin, db: Session = Depends(get_db)):
 
 
 @router.get("/me", response_model=UserResponse)
-def get_current_user_info(current_user: User = Depends(get_current_user)):
+def get_current_user_info(current_user: UserResponse = Depends(get_current_user)):
     """Get current user information."""
     return current_user
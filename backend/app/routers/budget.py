@@ -1,18 +1,14 @@
 """Budget router for budget management."""
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from decimal import Decimal
 from datetime import date
-from dateutil.relativedelta import relativedelta
 from app.database import get_db
-from app.models.user import User
 from app.models.budget import Budget
-from app.models.transaction import Transaction, TransactionType
 from app.schemas.budget import BudgetCreate, BudgetUpdate, BudgetResponse, BudgetWithSpending
-from app.utils.dependencies import get_current_user
+from app.services.budget_service import budget_spending_query, budget_with_spending
+from app.utils.dependencies import get_current_user_id
 
 router = APIRouter(prefix="/budgets", tags=["Budgets"])
 
@@ -20,12 +16,12 @@ router = APIRouter(prefix="/budgets", tags=["Budgets"])
 @router.post("/", response_model=BudgetResponse, status_code=status.HTTP_201_CREATED)
 def create_budget(
     budget_data: BudgetCreate,
-    current_user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Create a new budget."""
     new_budget = Budget(
-        user_id=current_user.id,
+        user_id=user_id,
         **budget_data.dict()
     )
     
@@ -39,55 +35,32 @@ def create_budget(
 @router.get("/", response_model=List[BudgetWithSpending])
 def get_budgets(
     financial_year: str = None,
-    current_user: User = Depends(get_current_user),
+    month: Optional[date] = None,
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
-    """Get all budgets for the current user with spending information."""
-    query = db.query(Budget).filter(Budget.user_id == current_user.id)
+    """Get all budgets for the current user with spending information.
     
-    if financial_year:
-        query = query.filter(Budget.financial_year == financial_year)
+    Args:
+        financial_year: Only return budgets for this financial year
+        month: Any date in the month to report spending for (default: current month)
+    """
+    month_start = (month or date.today()).replace(day=1)
     
-    budgets = query.all()
-    
-    # Calculate spending for each budget
-    result = []
-    current_month_start = date.today().replace(day=1)
-    current_month_end = (current_month_start + relativedelta(months=1)) - relativedelta(days=1)
-    
-    for budget in budgets:
-        # Get expenses for this category in current month
-        spent = db.query(func.sum(Transaction.amount)).filter(
-            Transaction.user_id == current_user.id,
-            Transaction.type == TransactionType.EXPENSE,
-            Transaction.category == budget.category,
-            Transaction.transaction_date >= current_month_start,
-            Transaction.transaction_date <= current_month_end
-        ).scalar() or Decimal("0")
-        
-        remaining = budget.monthly_limit - spent
-        percentage_used = float((spent / budget.monthly_limit) * 100) if budget.monthly_limit > 0 else 0
-        
-        result.append(BudgetWithSpending(
-            **budget.__dict__,
-            spent=spent,
-            remaining=remaining,
-            percentage_used=percentage_used
-        ))
-    
-    return result
+    query = budget_spending_query(user_id, month_start, financial_year)
+    return [budget_with_spending(budget, spent) for budget, spent in db.execute(query).all()]
 
 
 @router.get("/{budget_id}", response_model=BudgetResponse)
 def get_budget(
     budget_id: UUID,
-    current_user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Get a specific budget."""
     budget = db.query(Budget).filter(
         Budget.id == budget_id,
-        Budget.user_id == current_user.id
+        Budget.user_id == user_id
     ).first()
     
     if not budget:
@@ -103,13 +76,13 @@ def get_budget(
 def update_budget(
     budget_id: UUID,
     budget_data: BudgetUpdate,
-    current_user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Update a budget."""
     budget = db.query(Budget).filter(
         Budget.id == budget_id,
-        Budget.user_id == current_user.id
+        Budget.user_id == user_id
     ).first()
     
     if not budget:
@@ -132,13 +105,13 @@ def update_budget(
 @router.delete("/{budget_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_budget(
     budget_id: UUID,
-    current_user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Delete a budget."""
     budget = db.query(Budget).filter(
         Budget.id == budget_id,
-        Budget.user_id == current_user.id
+        Budget.user_id == user_id
     ).first()
     
     if not budget:
@@ -1,11 +1,11 @@
 """Dashboard router for Rich Dad dashboard data."""
+from uuid import UUID
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.models.user import User
 from app.schemas.dashboard import RichDadDashboard
 from app.services.dashboard_service import get_rich_dad_dashboard
-from app.utils.dependencies import get_current_user
+from app.utils.dependencies import get_current_user_id
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
@@ -13,8 +13,8 @@ router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 @router.get("/", response_model=RichDadDashboard)
 def get_dashboard(
     months: int = 6,
-    current_user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Get Rich Dad Dashboard data."""
-    return get_rich_dad_dashboard(db, str(current_user.id), months)
+    return get_rich_dad_dashboard(db, str(user_id), months)
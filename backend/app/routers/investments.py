@@ -1,13 +1,15 @@
 """Investments router for CRUD operations."""
-from typing import List
+from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.models.user import User
 from app.models.investment import Investment
 from app.schemas.investment import InvestmentCreate, InvestmentUpdate, InvestmentResponse
-from app.utils.dependencies import get_current_user
+from app.services.investment_service import investment_page_query, next_investment_cursor
+from app.services.portfolio_service import recompute_portfolio_summaries
+from app.utils.dependencies import get_current_user_id
+from app.utils.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/investments", tags=["Investments"])
 
@@ -15,16 +17,17 @@ router = APIRouter(prefix="/investments", tags=["Investments"])
 @router.post("/", response_model=InvestmentResponse, status_code=status.HTTP_201_CREATED)
 def create_investment(
     investment_data: InvestmentCreate,
-    current_user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Create a new investment."""
     new_investment = Investment(
-        user_id=current_user.id,
+        user_id=user_id,
         **investment_data.dict()
     )
     
     db.add(new_investment)
+    recompute_portfolio_summaries(db, [user_id])
     db.commit()
     db.refresh(new_investment)
     
@@ -33,32 +36,47 @@ def create_investment(
 
 @router.get("/", response_model=List[InvestmentResponse])
 def get_investments(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     is_active: bool = True,
-    current_user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
-    """Get all investments for the current user."""
-    query = db.query(Investment).filter(
-        Investment.user_id == current_user.id,
-        Investment.is_active == is_active
-    )
+    """Get all investments for the current user.
+    
+    Full pages set an X-Next-Cursor header; pass it back as cursor to
+    continue after the last row by (created_at, id). skip is ignored when
+    cursor is given.
+    """
+    try:
+        query = investment_page_query(user_id, skip, limit, cursor, is_active)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    
+    investments = db.scalars(query).all()
+    
+    next_cursor = next_investment_cursor(investments, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     
-    investments = query.order_by(Investment.created_at.desc()).offset(skip).limit(limit).all()
     return investments
 
 
 @router.get("/{investment_id}", response_model=InvestmentResponse)
 def get_investment(
     investment_id: UUID,
-    current_user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Get a specific investment."""
     investment = db.query(Investment).filter(
         Investment.id == investment_id,
-        Investment.user_id == current_user.id
+        Investment.user_id == user_id
     ).first()
     
     if not investment:
@@ -74,13 +92,13 @@ def get_investment(
 def update_investment(
     investment_id: UUID,
     investment_data: InvestmentUpdate,
-    current_user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Update an investment."""
     investment = db.query(Investment).filter(
         Investment.id == investment_id,
-        Investment.user_id == current_user.id
+        Investment.user_id == user_id
     ).first()
     
     if not investment:
@@ -94,6 +112,7 @@ def update_investment(
     for field, value in update_data.items():
         setattr(investment, field, value)
     
+    recompute_portfolio_summaries(db, [user_id])
     db.commit()
     db.refresh(investment)
     
@@ -103,13 +122,13 @@ def update_investment(
 @router.delete("/{investment_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_investment(
     investment_id: UUID,
-    current_user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Delete an investment."""
     investment = db.query(Investment).filter(
         Investment.id == investment_id,
-        Investment.user_id == current_user.id
+        Investment.user_id == user_id
     ).first()
     
     if not investment:
@@ -119,6 +138,7 @@ def delete_investment(
         )
     
     db.delete(investment)
+    recompute_portfolio_summaries(db, [user_id])
     db.commit()
     
     return None
@@ -1,7 +1,7 @@
 """Market data router for fetching stock and mutual fund data."""
 from typing import Optional
 from fastapi import APIRouter, HTTPException, status
-from app.services.market_data import get_stock_price, get_mutual_fund_nav
+from app.services.market_data import get_stock_price, get_mutual_fund_nav, market_cache
 
 router = APIRouter(prefix="/market", tags=["Market Data"])
 
@@ -34,3 +34,9 @@ def get_mf_nav(scheme_code: str):
     """
     data = get_mutual_fund_nav(scheme_code)
     return data
+
+
+@router.get("/cache-stats")
+def get_cache_stats():
+    """Get market data cache hit, miss and eviction counters."""
+    return market_cache.stats()
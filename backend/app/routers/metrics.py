@@ -0,0 +1,34 @@
+"""Metrics router for operational telemetry."""
+from typing import Dict
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.services.pool_metrics import get_pool_metrics, render_pool_metrics
+from app.utils.request_metrics import REQUEST_METRIC_FAMILIES
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("", response_class=PlainTextResponse)
+def get_metrics() -> PlainTextResponse:
+    """Get request and pool metrics in Prometheus text format.
+    
+    Per route: request counts by status, latency, SQL statements and SQL
+    time per request, and response size. Counted per worker process.
+    """
+    lines = [line for family in REQUEST_METRIC_FAMILIES for line in family.render()]
+    lines += render_pool_metrics()
+    return PlainTextResponse("\n".join(lines) + "\n", media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@router.get("/pool")
+def get_pool_stats() -> Dict[str, Dict]:
+    """Get database connection pool metrics per engine.
+    
+    Current occupancy, counters since startup, and histograms of checkout
+    wait time and of connections checked out and in overflow at each
+    checkout. Counted per worker process.
+    """
+    return get_pool_metrics()
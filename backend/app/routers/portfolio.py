@@ -0,0 +1,83 @@
+"""Portfolio router for performance analytics."""
+from datetime import date
+from typing import Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.schemas.portfolio import PortfolioValueHistory, PortfolioXIRR, PortfolioDrawdown
+from app.services.portfolio_analytics import portfolio_value_series, portfolio_xirr, drawdown
+from app.utils.dependencies import get_current_user_id
+
+router = APIRouter(prefix="/portfolio", tags=["Portfolio"])
+
+
+def check_date_range(start_date: Optional[date], end_date: Optional[date]) -> None:
+    """Reject a window that ends before it starts."""
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date must not be after end_date"
+        )
+
+
+@router.get("/value-history", response_model=PortfolioValueHistory)
+def get_value_history(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    user_id: UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """Get the daily value of active asset holdings over time.
+    
+    Args:
+        start_date: First day (default: first holding's start date)
+        end_date: Last day (default: yesterday's close)
+    """
+    check_date_range(start_date, end_date)
+    series = portfolio_value_series(db, user_id, start_date, end_date)
+    
+    return PortfolioValueHistory(points=[
+        {"date": day, "value": round(value, 2), "invested": round(invested, 2)}
+        for day, value, invested in zip(series.dates.astype(object), series.values.tolist(), series.invested.tolist())
+    ])
+
+
+@router.get("/xirr", response_model=PortfolioXIRR)
+def get_xirr(
+    end_date: Optional[date] = None,
+    user_id: UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """Get the annualized return (XIRR) of active asset holdings.
+    
+    Args:
+        end_date: Value the portfolio as of this day (default: yesterday's close)
+    """
+    series = portfolio_value_series(db, user_id, end_date=end_date)
+    has_data = len(series.dates) > 0
+    
+    return PortfolioXIRR(
+        xirr=portfolio_xirr(series),
+        total_invested=round(sum(amount for _, amount in series.flows), 2),
+        current_value=round(float(series.values[-1]), 2) if has_data else 0.0,
+        as_of=series.dates[-1].astype(object) if has_data else None
+    )
+
+
+@router.get("/drawdown", response_model=PortfolioDrawdown)
+def get_drawdown(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    user_id: UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """Get the maximum and current drawdown of active asset holdings.
+    
+    Args:
+        start_date: First day (default: first holding's start date)
+        end_date: Last day (default: yesterday's close)
+    """
+    check_date_range(start_date, end_date)
+    series = portfolio_value_series(db, user_id, start_date, end_date)
+    return drawdown(series)
@@ -1,7 +1,20 @@
 """SMS parser router for parsing bank SMS messages."""
 from typing import List
-from fastapi import APIRouter, Body
+from uuid import UUID
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from app.config import get_settings
+from app.database import get_db
+from app.schemas.sms import SMSImportRequest, SMSImportResponse
+from app.services.sms_import import import_sms
 from app.services.sms_parser import parse_sms, parse_multiple_sms
+from app.services.sms_batch_parser import iter_body, parse_sms_parallel, stream_parse_sms
+from app.utils.constants import SMS_IMPORT_LIMIT, SMS_STREAM_MAX_BYTES, SMS_STREAM_READ_SIZE
+from app.utils.dependencies import get_current_user_id
+
+settings = get_settings()
 
 router = APIRouter(prefix="/sms", tags=["SMS Parser"])
 
@@ -14,7 +27,77 @@ def parse_single_sms(sms_text: str = Body(..., embed=True)):
 
 
 @router.post("/parse-bulk")
-def parse_bulk_sms(sms_list: List[str] = Body(...)):
-    """Parse multiple SMS messages."""
-    results = parse_multiple_sms(sms_list)
+async def parse_bulk_sms(sms_list: List[str] = Body(...)):
+    """Parse multiple SMS messages.
+    
+    Large batches are split into chunks and parsed on a process pool so a
+    full inbox export does not pin the API worker.
+    """
+    if len(sms_list) >= settings.SMS_PARALLEL_THRESHOLD:
+        return await parse_sms_parallel(sms_list)
+    
+    results = await run_in_threadpool(parse_multiple_sms, sms_list)
     return [result.to_dict() for result in results]
+
+
+async def read_stream_body(request: Request) -> bytearray:
+    """Read a request body, rejecting it once it exceeds SMS_STREAM_MAX_BYTES.
+    
+    Raises:
+        HTTPException: 413 if the body is larger than the limit
+    """
+    too_large = HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Request body must be at most {SMS_STREAM_MAX_BYTES} bytes"
+    )
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > SMS_STREAM_MAX_BYTES:
+        raise too_large
+    
+    body = bytearray()
+    async for data in request.stream():
+        body += data
+        if len(body) > SMS_STREAM_MAX_BYTES:
+            raise too_large
+    return body
+
+
+@router.post("/parse-stream")
+async def parse_stream_sms(request: Request):
+    """Parse an NDJSON stream of SMS messages, streaming NDJSON results.
+    
+    Each request line is a JSON string or an object with "sms_text". Each
+    response line is a parse result for a successfully parsed message, or
+    {"line", "error"} for a line that could not be decoded.
+    
+    The request body is read before the response starts: reading it while
+    the response streams would race the server's disconnect listener for
+    the same receive channel. Bodies over SMS_STREAM_MAX_BYTES are rejected
+    with 413 as soon as the limit is crossed.
+    """
+    body = await read_stream_body(request)
+    return StreamingResponse(
+        stream_parse_sms(iter_body(body, SMS_STREAM_READ_SIZE)),
+        media_type="application/x-ndjson"
+    )
+
+
+@router.post("/import", response_model=SMSImportResponse)
+def import_sms_transactions(
+    import_data: SMSImportRequest,
+    user_id: UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """Parse SMS messages and save them as transactions in one request.
+    
+    Messages are deduplicated by bank reference number (or amount, date and
+    account when there is none), so importing the same inbox again only
+    adds messages that were not imported before.
+    """
+    if len(import_data.messages) > SMS_IMPORT_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {SMS_IMPORT_LIMIT} messages can be imported per request"
+        )
+    
+    return import_sms(db, user_id, import_data.messages)
@@ -1,15 +1,19 @@
 """Tax router for tax calculations and planning."""
-from fastapi import APIRouter, Depends
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 from decimal import Decimal
 from app.database import get_db
-from app.models.user import User
 from app.schemas.tax import (
     Section80CResponse,
     Section80DResponse,
     TaxCalculationResponse,
     TaxComparisonResponse,
     TaxSummaryRequest,
+    TaxSummaryResponse,
+    TaxBatchRequest,
+    TaxBatchResponse,
+    TaxOptimizationResponse,
 )
 from app.services.tax_calculator import (
     calculate_80c,
@@ -17,55 +21,139 @@ from app.services.tax_calculator import (
     calculate_tax_new_regime,
     calculate_tax_old_regime,
     compare_tax_regimes,
+    calculate_tax_summary,
+    calculate_tax_batch,
+    optimize_deductions,
 )
-from app.utils.dependencies import get_current_user
-from app.utils.constants import NEW_REGIME_STANDARD_DEDUCTION
+from app.services.deduction_service import get_deduction_totals
+from app.services.tax_rules import TaxRules, UnknownFinancialYearError, get_tax_rules
+from app.utils.dependencies import get_current_user_id
+from app.utils.etag import etag_response
+from app.utils.constants import TAX_BATCH_LIMIT
 
 router = APIRouter(prefix="/tax", tags=["Tax Planning"])
 
 
+def check_financial_year(financial_year: str) -> TaxRules:
+    """Get the tax rules of a financial year, rejecting years without rules."""
+    try:
+        return get_tax_rules(financial_year)
+    except UnknownFinancialYearError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
 @router.get("/section-80c", response_model=Section80CResponse)
 def get_section_80c(
     financial_year: str = "2025-26",
-    current_user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Get Section 80C utilization and tax savings."""
-    return calculate_80c(db, str(current_user.id), financial_year)
+    check_financial_year(financial_year)
+    return calculate_80c(db, str(user_id), financial_year)
 
 
 @router.get("/section-80d", response_model=Section80DResponse)
 def get_section_80d(
     financial_year: str = "2025-26",
     is_senior: bool = False,
-    current_user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Get Section 80D utilization and tax savings."""
-    return calculate_80d(db, str(current_user.id), financial_year, is_senior)
+    check_financial_year(financial_year)
+    return calculate_80d(db, str(user_id), financial_year, is_senior)
 
 
 @router.post("/calculate", response_model=TaxCalculationResponse)
 def calculate_tax(
     tax_request: TaxSummaryRequest,
-    current_user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Calculate tax for given gross income and regime."""
+    rules = check_financial_year(tax_request.financial_year)
     if tax_request.regime.upper() == "NEW":
-        return calculate_tax_new_regime(tax_request.gross_income, NEW_REGIME_STANDARD_DEDUCTION)
+        return calculate_tax_new_regime(
+            tax_request.gross_income,
+            rules.new_regime_standard_deduction,
+            tax_request.financial_year
+        )
     else:
         # For old regime, get deductions
-        section_80c = calculate_80c(db, str(current_user.id), tax_request.financial_year)
-        return calculate_tax_old_regime(tax_request.gross_income, section_80c.utilized)
+        section_80c = calculate_80c(db, str(user_id), tax_request.financial_year)
+        return calculate_tax_old_regime(tax_request.gross_income, section_80c.utilized, tax_request.financial_year)
+
+
+@router.get("/summary", response_model=TaxSummaryResponse)
+def get_tax_summary(
+    request: Request,
+    gross_income: Decimal,
+    financial_year: str = "2025-26",
+    is_senior: bool = False,
+    user_id: UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """Get 80C and 80D utilization and the regime comparison in one response.
+    
+    Deductions are read once for all three. The response carries an ETag;
+    send it back in If-None-Match to get 304 Not Modified while nothing
+    has changed.
+    """
+    check_financial_year(financial_year)
+    summary = calculate_tax_summary(db, user_id, gross_income, financial_year, is_senior)
+    return etag_response(request, summary)
+
+
+@router.post("/calculate-batch", response_model=TaxBatchResponse)
+def calculate_tax_for_incomes(
+    batch_request: TaxBatchRequest,
+    user_id: UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """Calculate tax under both regimes for many gross incomes at once.
+    
+    Meant for drawing tax curves: every income is evaluated against
+    precomputed slab tables in one pass, with amounts rounded to the paisa.
+    """
+    check_financial_year(batch_request.financial_year)
+    if len(batch_request.gross_incomes) > TAX_BATCH_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {TAX_BATCH_LIMIT} incomes can be calculated per request"
+        )
+    
+    deductions = batch_request.old_regime_deductions
+    if deductions is None:
+        deductions = calculate_80c(db, str(user_id), batch_request.financial_year).utilized
+    
+    return calculate_tax_batch(batch_request.gross_incomes, deductions, batch_request.financial_year)
 
 
 @router.get("/compare", response_model=TaxComparisonResponse)
 def compare_regimes(
     gross_income: Decimal,
     financial_year: str = "2025-26",
-    current_user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Compare tax under new and old regimes."""
-    return compare_tax_regimes(db, str(current_user.id), gross_income, financial_year)
+    check_financial_year(financial_year)
+    return compare_tax_regimes(db, str(user_id), gross_income, financial_year)
+
+
+@router.get("/optimize", response_model=TaxOptimizationResponse)
+def optimize_tax(
+    gross_income: Decimal,
+    financial_year: str = "2025-26",
+    is_senior: bool = False,
+    user_id: UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """Get the deductions at which the old regime breaks even, and how to use the 80C/80CCD(1B)/80D limits."""
+    check_financial_year(financial_year)
+    claimed = get_deduction_totals(db, user_id, financial_year)
+    return optimize_deductions(gross_income, claimed, is_senior, financial_year)
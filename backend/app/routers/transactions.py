@@ -1,74 +1,172 @@
 """Transactions router for CRUD operations."""
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 from datetime import date
 from app.database import get_db
-from app.models.user import User
 from app.models.transaction import Transaction, TransactionType
-from app.schemas.transaction import TransactionCreate, TransactionUpdate, TransactionResponse
-from app.utils.dependencies import get_current_user
+from pydantic import ValidationError
+from app.schemas.transaction import (
+    TransactionCreate,
+    TransactionUpdate,
+    TransactionResponse,
+    TransactionBulkCreate,
+    TransactionBulkItemResult,
+    TransactionBulkResponse,
+)
+from app.services.rollup_service import add_to_rollup, remove_from_rollup
+from app.services.transaction_service import bulk_insert_transactions, next_page_cursor, transaction_page_query
+from app.utils.constants import BULK_TRANSACTION_LIMIT
+from app.utils.dependencies import get_current_user_id
+from app.utils.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter(prefix="/transactions", tags=["Transactions"])
 
 
+def validate_bulk_items(bulk_data: TransactionBulkCreate) -> Tuple[List[TransactionBulkItemResult], List[TransactionCreate]]:
+    """Validate each item of a bulk create request on its own.
+    
+    Returns:
+        Per-item results and the valid payloads, in input order
+    
+    Raises:
+        HTTPException: 400 if the batch is too large, or 422 listing every
+            item if any is invalid and the batch is all_or_nothing
+    """
+    if len(bulk_data.transactions) > BULK_TRANSACTION_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {BULK_TRANSACTION_LIMIT} transactions can be created per request"
+        )
+    
+    results = []
+    valid_items = []
+    for index, item in enumerate(bulk_data.transactions):
+        try:
+            valid_items.append(TransactionCreate.model_validate(item))
+            results.append(TransactionBulkItemResult(index=index, status="created"))
+        except ValidationError as e:
+            error = "; ".join(
+                f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors()
+            )
+            results.append(TransactionBulkItemResult(index=index, status="invalid", error=error))
+    
+    if len(valid_items) < len(results) and bulk_data.all_or_nothing:
+        for result in results:
+            if result.status == "created":
+                result.status = "skipped"
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[result.model_dump(mode="json") for result in results]
+        )
+    
+    return results, valid_items
+
+
+def bulk_response(results: List[TransactionBulkItemResult], ids: List[UUID]) -> TransactionBulkResponse:
+    """Fill in the ids of created items and summarize a bulk create."""
+    created = iter(ids)
+    for result in results:
+        if result.status == "created":
+            result.id = next(created)
+    
+    return TransactionBulkResponse(
+        created=len(ids),
+        failed=len(results) - len(ids),
+        results=results
+    )
+
+
 @router.post("/", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
 def create_transaction(
     transaction_data: TransactionCreate,
-    current_user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Create a new transaction."""
     new_transaction = Transaction(
-        user_id=current_user.id,
+        user_id=user_id,
         **transaction_data.dict()
     )
     
     db.add(new_transaction)
+    add_to_rollup(db, new_transaction)
     db.commit()
     db.refresh(new_transaction)
     
     return new_transaction
 
 
+@router.post("/bulk", response_model=TransactionBulkResponse)
+def create_transactions_bulk(
+    bulk_data: TransactionBulkCreate,
+    user_id: UUID = Depends(get_current_user_id),
+    db: Session = Depends(get_db)
+):
+    """Create many transactions in a single database transaction.
+    
+    Each item is validated on its own and reported with a per-item status.
+    By default valid items are written and invalid ones skipped; with
+    all_or_nothing, any invalid item rejects the whole batch with 422.
+    """
+    results, valid_items = validate_bulk_items(bulk_data)
+    
+    ids = bulk_insert_transactions(db, user_id, valid_items)
+    db.commit()
+    
+    return bulk_response(results, ids)
+
+
 @router.get("/", response_model=List[TransactionResponse])
 def get_transactions(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     transaction_type: Optional[TransactionType] = None,
     category: Optional[str] = None,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
-    current_user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
-    """Get all transactions for the current user with optional filters."""
-    query = db.query(Transaction).filter(Transaction.user_id == current_user.id)
-    
-    if transaction_type:
-        query = query.filter(Transaction.type == transaction_type)
-    if category:
-        query = query.filter(Transaction.category == category)
-    if start_date:
-        query = query.filter(Transaction.transaction_date >= start_date)
-    if end_date:
-        query = query.filter(Transaction.transaction_date <= end_date)
-    
-    transactions = query.order_by(Transaction.transaction_date.desc()).offset(skip).limit(limit).all()
+    """Get all transactions for the current user with optional filters.
+    
+    Full pages set an X-Next-Cursor header. Passing it back as cursor
+    continues after the last row by (transaction_date, id) instead of
+    skipping rows, which stays fast on deep pages and is not shifted by
+    newly inserted transactions. skip is ignored when cursor is given.
+    """
+    try:
+        query = transaction_page_query(
+            user_id, skip, limit, cursor, transaction_type, category, start_date, end_date
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    
+    transactions = db.scalars(query).all()
+    
+    next_cursor = next_page_cursor(transactions, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    
     return transactions
 
 
 @router.get("/{transaction_id}", response_model=TransactionResponse)
 def get_transaction(
     transaction_id: UUID,
-    current_user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Get a specific transaction."""
     transaction = db.query(Transaction).filter(
         Transaction.id == transaction_id,
-        Transaction.user_id == current_user.id
+        Transaction.user_id == user_id
     ).first()
     
     if not transaction:
@@ -84,13 +182,13 @@ def get_transaction(
 def update_transaction(
     transaction_id: UUID,
     transaction_data: TransactionUpdate,
-    current_user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Update a transaction."""
     transaction = db.query(Transaction).filter(
         Transaction.id == transaction_id,
-        Transaction.user_id == current_user.id
+        Transaction.user_id == user_id
     ).first()
     
     if not transaction:
@@ -99,10 +197,12 @@ def update_transaction(
             detail="Transaction not found"
         )
     
-    # Update fields
+    # Update fields, moving the amount between rollup rows if the key changes
     update_data = transaction_data.dict(exclude_unset=True)
+    remove_from_rollup(db, transaction)
     for field, value in update_data.items():
         setattr(transaction, field, value)
+    add_to_rollup(db, transaction)
     
     db.commit()
     db.refresh(transaction)
@@ -113,13 +213,13 @@ def update_transaction(
 @router.delete("/{transaction_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_transaction(
     transaction_id: UUID,
-    current_user: User = Depends(get_current_user),
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db)
 ):
     """Delete a transaction."""
     transaction = db.query(Transaction).filter(
         Transaction.id == transaction_id,
-        Transaction.user_id == current_user.id
+        Transaction.user_id == user_id
     ).first()
     
     if not transaction:
@@ -128,6 +228,7 @@ def delete_transaction(
             detail="Transaction not found"
         )
     
+    remove_from_rollup(db, transaction)
     db.delete(transaction)
     db.commit()
     
@@ -0,0 +1,32 @@
+"""Portfolio performance schemas."""
+from datetime import date
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class PortfolioValuePoint(BaseModel):
+    """Portfolio value on one day."""
+    date: date
+    value: float
+    invested: float
+
+
+class PortfolioValueHistory(BaseModel):
+    """Portfolio value over time."""
+    points: List[PortfolioValuePoint]
+
+
+class PortfolioXIRR(BaseModel):
+    """Annualized return of a portfolio's cash flows."""
+    xirr: Optional[float]  # Fraction, e.g. 0.12 for 12%
+    total_invested: float
+    current_value: float
+    as_of: Optional[date]
+
+
+class PortfolioDrawdown(BaseModel):
+    """Drawdown of a portfolio's time-weighted returns."""
+    max_drawdown: float  # Fraction, e.g. -0.2 for a 20% fall
+    current_drawdown: float
+    peak_date: Optional[date]
+    trough_date: Optional[date]
@@ -0,0 +1,38 @@
+"""Request profiling schemas."""
+from datetime import datetime
+from typing import List
+from pydantic import BaseModel
+
+
+class ProfileFunctionStat(BaseModel):
+    """Time spent in one function during a profiled request."""
+    function: str  # file:line(name)
+    calls: int
+    total_ms: float  # In the function itself
+    cumulative_ms: float  # Including functions it called
+
+
+class ProfileSqlStatement(BaseModel):
+    """One SQL statement on a profiled request's timeline."""
+    start_ms: float  # Since the request started
+    duration_ms: float
+    statement: str
+
+
+class RequestProfileSummary(BaseModel):
+    """A stored request profile, without its details."""
+    id: int
+    method: str
+    path: str
+    status_code: int
+    trigger: str  # "header" or "threshold"
+    started_at: datetime
+    duration_ms: float
+    sql_statements: int
+    sql_ms: float
+
+
+class RequestProfile(RequestProfileSummary):
+    """A stored request profile with its hottest functions and SQL timeline."""
+    functions: List[ProfileFunctionStat]
+    sql_timeline: List[ProfileSqlStatement]
@@ -0,0 +1,17 @@
+"""SMS import schemas."""
+from typing import List
+from pydantic import BaseModel, Field
+from uuid import UUID
+
+
+class SMSImportRequest(BaseModel):
+    """SMS import request schema."""
+    messages: List[str] = Field(..., min_length=1)
+
+
+class SMSImportResponse(BaseModel):
+    """SMS import response schema."""
+    imported: int
+    duplicates: int
+    unparsed: int
+    transaction_ids: List[UUID]
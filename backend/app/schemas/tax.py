@@ -1,8 +1,9 @@
 """Tax schemas."""
 from decimal import Decimal
-from typing import List, Optional
-from pydantic import BaseModel
+from typing import Annotated, List, Optional
+from pydantic import BaseModel, Field
 from app.models.tax_deduction import TaxDeductionSection
+from app.utils.constants import TAX_BATCH_MAX_INCOME
 
 
 class Section80CResponse(BaseModel):
@@ -59,8 +60,68 @@ class TaxComparisonResponse(BaseModel):
     savings_with_recommended: Decimal
 
 
+class TaxSummaryResponse(BaseModel):
+    """Full tax summary for one financial year."""
+    financial_year: str
+    section_80c: Section80CResponse
+    section_80d: Section80DResponse
+    comparison: TaxComparisonResponse
+
+
 class TaxSummaryRequest(BaseModel):
     """Tax summary request."""
     financial_year: str
     gross_income: Decimal
     regime: str = "NEW"  # "NEW" or "OLD"
+
+
+class TaxBatchRequest(BaseModel):
+    """Batch tax calculation request."""
+    financial_year: str = "2025-26"
+    gross_incomes: List[Annotated[Decimal, Field(ge=0, le=TAX_BATCH_MAX_INCOME)]] = Field(..., min_length=1)
+    old_regime_deductions: Optional[Decimal] = Field(None, ge=0)  # Default: utilized 80C
+
+
+class TaxBatchRegimeResult(BaseModel):
+    """Batch tax results of one regime, one list entry per income."""
+    total_deductions: Decimal
+    taxable_income: List[Decimal]
+    tax_before_rebate: List[Decimal]
+    rebate_87a: List[Decimal]
+    total_tax: List[Decimal]
+    cess: List[Decimal]
+    final_tax: List[Decimal]
+
+
+class TaxBatchResponse(BaseModel):
+    """Batch tax calculation response, rounded to the paisa."""
+    gross_income: List[Decimal]
+    new_regime: TaxBatchRegimeResult
+    old_regime: TaxBatchRegimeResult
+    recommended_regime: List[str]
+    savings_with_recommended: List[Decimal]
+
+
+class TaxSectionAllocation(BaseModel):
+    """Suggested additional investment in one deduction section."""
+    section: str
+    limit: Decimal
+    claimed: Decimal
+    additional: Decimal
+
+
+class TaxOptimizationResponse(BaseModel):
+    """Regime break-even and deduction optimization response."""
+    gross_income: Decimal
+    new_regime_tax: Decimal
+    old_regime_tax: Decimal  # With current deductions
+    current_deductions: Decimal
+    max_deductions: Decimal
+    marginal_rate: Decimal  # Old regime slab rate on the next rupee of deduction
+    break_even_deduction: Decimal  # Total deductions at which the old regime wins
+    break_even_achievable: bool
+    allocations: List[TaxSectionAllocation]
+    optimized_deductions: Decimal
+    recommended_regime: str
+    optimized_tax: Decimal
+    savings: Decimal  # Versus the cheaper regime with current deductions
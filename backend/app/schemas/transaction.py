@@ -1,7 +1,7 @@
 """Transaction schemas."""
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field
 from uuid import UUID
 from app.models.transaction import (
@@ -59,3 +59,28 @@ class TransactionResponse(TransactionBase):
     
     class Config:
         from_attributes = True
+
+
+class TransactionBulkCreate(BaseModel):
+    """Bulk transaction creation schema.
+    
+    Items are validated individually against TransactionCreate so one bad
+    item is reported in the results instead of rejecting the whole batch.
+    """
+    transactions: List[Dict[str, Any]] = Field(..., min_length=1)
+    all_or_nothing: bool = False
+
+
+class TransactionBulkItemResult(BaseModel):
+    """Per-item result of a bulk transaction creation."""
+    index: int
+    status: str  # "created", "invalid" or "skipped"
+    id: Optional[UUID] = None
+    error: Optional[str] = None
+
+
+class TransactionBulkResponse(BaseModel):
+    """Bulk transaction creation response."""
+    created: int
+    failed: int
+    results: List[TransactionBulkItemResult]
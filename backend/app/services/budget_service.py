@@ -0,0 +1,48 @@
+"""Budget service for spending against monthly budgets."""
+from datetime import date
+from decimal import Decimal
+from typing import Optional
+from sqlalchemy import Select, func, select
+from app.models.budget import Budget
+from app.models.monthly_rollup import MonthlyRollup
+from app.models.transaction import TransactionType
+from app.schemas.budget import BudgetResponse, BudgetWithSpending
+
+
+def budget_spending_query(user_id, month_start: date, financial_year: Optional[str] = None) -> Select:
+    """Build the query for a user's budgets with the month's spending.
+    
+    Expenses per category are summed from the monthly rollups and joined
+    to every budget in one query. Each row is (Budget, spent), with spent
+    None for categories without expenses.
+    """
+    spending = select(
+        MonthlyRollup.category,
+        func.sum(MonthlyRollup.total_amount).label("spent")
+    ).where(
+        MonthlyRollup.user_id == user_id,
+        MonthlyRollup.type == TransactionType.EXPENSE,
+        MonthlyRollup.month == month_start
+    ).group_by(MonthlyRollup.category).subquery()
+    
+    query = select(Budget, spending.c.spent).outerjoin(
+        spending, spending.c.category == Budget.category
+    ).where(Budget.user_id == user_id)
+    
+    if financial_year:
+        query = query.where(Budget.financial_year == financial_year)
+    return query
+
+
+def budget_with_spending(budget: Budget, spent: Optional[Decimal]) -> BudgetWithSpending:
+    """Combine a budget with the amount spent against it."""
+    spent = spent or Decimal("0")
+    remaining = budget.monthly_limit - spent
+    percentage_used = float((spent / budget.monthly_limit) * 100) if budget.monthly_limit > 0 else 0
+    
+    return BudgetWithSpending(
+        **BudgetResponse.model_validate(budget).model_dump(),
+        spent=spent,
+        remaining=remaining,
+        percentage_used=percentage_used
+    )
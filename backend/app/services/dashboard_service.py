@@ -3,27 +3,85 @@ from decimal import Decimal
 from datetime import date, datetime
 from dateutil.relativedelta import relativedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
+from sqlalchemy import func, extract, select, or_, union_all
 from typing import List
 from app.models.transaction import Transaction, TransactionType, RichDadCategory
+from app.models.monthly_rollup import MonthlyRollup
 from app.models.investment import Investment, AssetLiabilityCategory
+from app.models.portfolio_summary import PortfolioSummary
 from app.schemas.dashboard import (
     IncomeExpenseSummary,
     AssetLiabilitySummary,
     MonthlyTrend,
     RichDadDashboard,
 )
+from app.services.rollup_service import month_start
 
 
-def calculate_income_expense_summary(db: Session, user_id: str, start_date: date, end_date: date) -> IncomeExpenseSummary:
-    """Calculate income and expense summary."""
-    # Get all transactions in the period
-    transactions = db.query(Transaction).filter(
+def aggregate_transactions(db: Session, user_id: str, start_date: date, end_date: date) -> list:
+    """Sum transaction amounts per month, type and Rich Dad category.
+    
+    Whole months inside the window are read from the monthly rollups and
+    only the partial months at either edge are aggregated from raw
+    transactions, combined in a single UNION ALL round trip. Each returned
+    row has year, month, type, rich_dad_category and total; a month may
+    appear in more than one row and callers are expected to add them up.
+    """
+    first_full_month = start_date if start_date.day == 1 else month_start(start_date) + relativedelta(months=1)
+    next_month = month_start(end_date) + relativedelta(months=1)
+    end_of_full_months = next_month if end_date + relativedelta(days=1) == next_month else month_start(end_date)
+    
+    txn_year = extract("year", Transaction.transaction_date)
+    txn_month = extract("month", Transaction.transaction_date)
+    raw_query = select(
+        txn_year.label("year"),
+        txn_month.label("month"),
+        Transaction.type,
+        Transaction.rich_dad_category,
+        func.sum(Transaction.amount).label("total")
+    ).where(
         Transaction.user_id == user_id,
         Transaction.transaction_date >= start_date,
         Transaction.transaction_date <= end_date
-    ).all()
+    ).group_by(
+        txn_year,
+        txn_month,
+        Transaction.type,
+        Transaction.rich_dad_category
+    )
     
+    if first_full_month >= end_of_full_months:
+        return db.execute(raw_query).all()
+    
+    raw_query = raw_query.where(or_(
+        Transaction.transaction_date < first_full_month,
+        Transaction.transaction_date >= end_of_full_months
+    ))
+    
+    rollup_year = extract("year", MonthlyRollup.month)
+    rollup_month = extract("month", MonthlyRollup.month)
+    rollup_query = select(
+        rollup_year.label("year"),
+        rollup_month.label("month"),
+        MonthlyRollup.type,
+        MonthlyRollup.rich_dad_category,
+        func.sum(MonthlyRollup.total_amount).label("total")
+    ).where(
+        MonthlyRollup.user_id == user_id,
+        MonthlyRollup.month >= first_full_month,
+        MonthlyRollup.month < end_of_full_months
+    ).group_by(
+        rollup_year,
+        rollup_month,
+        MonthlyRollup.type,
+        MonthlyRollup.rich_dad_category
+    )
+    
+    return db.execute(union_all(rollup_query, raw_query)).all()
+
+
+def build_income_expense_summary(rows: list) -> IncomeExpenseSummary:
+    """Build the income and expense summary from aggregated rows."""
     total_income = Decimal("0")
     active_income = Decimal("0")
     passive_income = Decimal("0")
@@ -32,21 +90,22 @@ def calculate_income_expense_summary(db: Session, user_id: str, start_date: date
     liability_expenses = Decimal("0")
     necessity_expenses = Decimal("0")
     
-    for txn in transactions:
-        if txn.type == TransactionType.INCOME:
-            total_income += txn.amount
-            if txn.rich_dad_category == RichDadCategory.ACTIVE_INCOME:
-                active_income += txn.amount
-            elif txn.rich_dad_category == RichDadCategory.PASSIVE_INCOME:
-                passive_income += txn.amount
-        elif txn.type == TransactionType.EXPENSE:
-            total_expenses += txn.amount
-            if txn.rich_dad_category == RichDadCategory.ASSET_EXPENSE:
-                asset_expenses += txn.amount
-            elif txn.rich_dad_category == RichDadCategory.LIABILITY_EXPENSE:
-                liability_expenses += txn.amount
-            elif txn.rich_dad_category == RichDadCategory.NECESSITY:
-                necessity_expenses += txn.amount
+    for row in rows:
+        amount = Decimal(row.total or 0)
+        if row.type == TransactionType.INCOME:
+            total_income += amount
+            if row.rich_dad_category == RichDadCategory.ACTIVE_INCOME:
+                active_income += amount
+            elif row.rich_dad_category == RichDadCategory.PASSIVE_INCOME:
+                passive_income += amount
+        elif row.type == TransactionType.EXPENSE:
+            total_expenses += amount
+            if row.rich_dad_category == RichDadCategory.ASSET_EXPENSE:
+                asset_expenses += amount
+            elif row.rich_dad_category == RichDadCategory.LIABILITY_EXPENSE:
+                liability_expenses += amount
+            elif row.rich_dad_category == RichDadCategory.NECESSITY:
+                necessity_expenses += amount
     
     return IncomeExpenseSummary(
         total_income=total_income,
@@ -59,8 +118,56 @@ def calculate_income_expense_summary(db: Session, user_id: str, start_date: date
     )
 
 
+def build_monthly_trends(rows: list, end_date: date, months: int) -> List[MonthlyTrend]:
+    """Build monthly trends for the N months ending at end_date from aggregated rows."""
+    totals = {}
+    for row in rows:
+        key = (int(row.year), int(row.month))
+        income, expenses = totals.get(key, (Decimal("0"), Decimal("0")))
+        amount = Decimal(row.total or 0)
+        if row.type == TransactionType.INCOME:
+            income += amount
+        elif row.type == TransactionType.EXPENSE:
+            expenses += amount
+        totals[key] = (income, expenses)
+    
+    trends = []
+    for i in range(months):
+        month_start = (end_date - relativedelta(months=i)).replace(day=1)
+        income, expenses = totals.get((month_start.year, month_start.month), (Decimal("0"), Decimal("0")))
+        
+        trends.insert(0, MonthlyTrend(
+            month=month_start.strftime("%b %Y"),
+            income=income,
+            expenses=expenses,
+            savings=income - expenses
+        ))
+    
+    return trends
+
+
+def calculate_income_expense_summary(db: Session, user_id: str, start_date: date, end_date: date) -> IncomeExpenseSummary:
+    """Calculate income and expense summary."""
+    rows = aggregate_transactions(db, user_id, start_date, end_date)
+    return build_income_expense_summary(rows)
+
+
 def calculate_asset_liability_summary(db: Session, user_id: str) -> AssetLiabilitySummary:
-    """Calculate assets and liabilities summary."""
+    """Calculate assets and liabilities summary.
+    
+    Reads the precomputed portfolio summary, falling back to summing active
+    investments for users whose summary has not been computed yet.
+    """
+    summary = db.query(PortfolioSummary).filter(PortfolioSummary.user_id == user_id).first()
+    if summary:
+        return AssetLiabilitySummary(
+            total_assets_value=summary.total_assets_value,
+            total_liabilities_value=summary.total_liabilities_value,
+            net_worth=summary.total_assets_value - summary.total_liabilities_value,
+            asset_count=summary.asset_count,
+            liability_count=summary.liability_count
+        )
+    
     # Get all active investments
     investments = db.query(Investment).filter(
         Investment.user_id == user_id,
@@ -94,35 +201,13 @@ def calculate_asset_liability_summary(db: Session, user_id: str) -> AssetLiabili
 
 def calculate_monthly_trends(db: Session, user_id: str, months: int = 6) -> List[MonthlyTrend]:
     """Calculate monthly trends for the past N months."""
-    trends = []
     end_date = date.today()
+    if months <= 0:
+        return []
     
-    for i in range(months):
-        month_start = (end_date - relativedelta(months=i)).replace(day=1)
-        if i == 0:
-            month_end = end_date
-        else:
-            month_end = month_start + relativedelta(months=1) - relativedelta(days=1)
-        
-        # Calculate income and expenses for this month
-        transactions = db.query(Transaction).filter(
-            Transaction.user_id == user_id,
-            Transaction.transaction_date >= month_start,
-            Transaction.transaction_date <= month_end
-        ).all()
-        
-        income = sum(txn.amount for txn in transactions if txn.type == TransactionType.INCOME)
-        expenses = sum(txn.amount for txn in transactions if txn.type == TransactionType.EXPENSE)
-        savings = income - expenses
-        
-        trends.insert(0, MonthlyTrend(
-            month=month_start.strftime("%b %Y"),
-            income=income,
-            expenses=expenses,
-            savings=savings
-        ))
-    
-    return trends
+    start_date = (end_date - relativedelta(months=months - 1)).replace(day=1)
+    rows = aggregate_transactions(db, user_id, start_date, end_date)
+    return build_monthly_trends(rows, end_date, months)
 
 
 def get_rich_dad_dashboard(db: Session, user_id: str, months: int = 6) -> RichDadDashboard:
@@ -130,10 +215,14 @@ def get_rich_dad_dashboard(db: Session, user_id: str, months: int = 6) -> RichDa
     end_date = date.today()
     start_date = end_date - relativedelta(months=months)
     
+    # One grouped query covers both the summary window and every trend month,
+    # since the trend months all start on or after start_date
+    rows = aggregate_transactions(db, user_id, start_date, end_date)
+    
     # Calculate summaries
-    income_expense_summary = calculate_income_expense_summary(db, user_id, start_date, end_date)
+    income_expense_summary = build_income_expense_summary(rows)
     asset_liability_summary = calculate_asset_liability_summary(db, user_id)
-    monthly_trends = calculate_monthly_trends(db, user_id, months)
+    monthly_trends = build_monthly_trends(rows, end_date, months)
     
     # Calculate financial freedom ratio
     # Financial Freedom Ratio = (Passive Income / Total Expenses) × 100
@@ -0,0 +1,86 @@
+"""Deduction aggregation across investments and recorded tax deductions."""
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import String, cast, exists, func, literal, select, union_all
+from app.models.investment import Investment, TaxSection
+from app.models.tax_deduction import TaxDeduction, TaxDeductionSection
+
+# Deduction section of each investment tax section; NPS investments (80CCD)
+# count towards the additional 80CCD(1B) limit
+INVESTMENT_DEDUCTION_SECTIONS = {
+    TaxSection.SEC_80C.name: TaxDeductionSection.SEC_80C.value,
+    TaxSection.SEC_80CCC.name: TaxDeductionSection.SEC_80CCC.value,
+    TaxSection.SEC_80CCD.name: TaxDeductionSection.SEC_80CCD_1B.value,
+    TaxSection.SEC_80D.name: TaxDeductionSection.SEC_80D.value,
+    TaxSection.SEC_80E.name: TaxDeductionSection.SEC_80E.value,
+    TaxSection.SEC_80G.name: TaxDeductionSection.SEC_80G.value,
+}
+
+
+def financial_year_bounds(financial_year: str) -> Tuple[date, date]:
+    """Get the first and last day of a financial year (e.g., "2025-26")."""
+    start_year = int(financial_year[:4])
+    return date(start_year, 4, 1), date(start_year + 1, 3, 31)
+
+
+def get_deduction_totals(db: Session, user_id, financial_year: str) -> Dict[str, Decimal]:
+    """Total deductions per section for a financial year, in one query.
+    
+    Combines active investments started in the financial year with the
+    user's recorded tax deductions for it. An investment that a recorded
+    deduction of the same year points to is counted through that
+    deduction only.
+    
+    Args:
+        db: Database session
+        user_id: User ID
+        financial_year: Financial year (e.g., "2025-26")
+    
+    Returns:
+        Dictionary of section (TaxDeductionSection value, e.g. "80C") to
+        total amount; sections without any amount are left out
+    """
+    start, end = financial_year_bounds(financial_year)
+    
+    recorded = exists().where(
+        TaxDeduction.investment_id == Investment.id,
+        TaxDeduction.financial_year == financial_year
+    )
+    investments = select(
+        literal("investment").label("source"),
+        cast(Investment.tax_section, String).label("section"),
+        Investment.amount_invested.label("amount")
+    ).where(
+        Investment.user_id == user_id,
+        Investment.is_active == True,
+        Investment.tax_section != TaxSection.NONE,
+        Investment.start_date.between(start, end),
+        ~recorded
+    )
+    deductions = select(
+        literal("deduction").label("source"),
+        cast(TaxDeduction.section, String).label("section"),
+        TaxDeduction.amount.label("amount")
+    ).where(
+        TaxDeduction.user_id == user_id,
+        TaxDeduction.financial_year == financial_year
+    )
+    
+    combined = union_all(investments, deductions).subquery()
+    rows = db.execute(
+        select(combined.c.source, combined.c.section, func.sum(combined.c.amount))
+        .group_by(combined.c.source, combined.c.section)
+    )
+    
+    totals: Dict[str, Decimal] = {}
+    for source, section, total in rows:
+        # Enum columns store member names
+        if source == "investment":
+            section = INVESTMENT_DEDUCTION_SECTIONS[section]
+        else:
+            section = TaxDeductionSection[section].value
+        totals[section] = totals.get(section, Decimal("0")) + Decimal(total or 0)
+    
+    return totals
@@ -0,0 +1,47 @@
+"""Investment service for paged investment reads."""
+import uuid
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import Select, select, tuple_
+from app.models.investment import Investment
+from app.utils.pagination import encode_cursor, decode_cursor
+
+
+def investment_page_query(
+    user_id,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    is_active: bool = True
+) -> Select:
+    """Build the query for one page of a user's investments, newest first.
+    
+    With a cursor, the page continues after the last row by
+    (created_at, id) and skip is ignored.
+    
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    query = select(Investment).where(
+        Investment.user_id == user_id,
+        Investment.is_active == is_active
+    )
+    
+    if cursor:
+        last_created_at, last_id = decode_cursor(cursor, 2)
+        last_key = (datetime.fromisoformat(last_created_at), uuid.UUID(last_id))
+        query = query.where(tuple_(Investment.created_at, Investment.id) < last_key)
+        skip = 0
+    
+    return query.order_by(
+        Investment.created_at.desc(),
+        Investment.id.desc()
+    ).offset(skip).limit(limit)
+
+
+def next_investment_cursor(investments: List[Investment], limit: int) -> Optional[str]:
+    """Get the cursor of the page after a full page of investments, or None."""
+    if investments and len(investments) == limit:
+        last = investments[-1]
+        return encode_cursor(last.created_at.isoformat(), last.id)
+    return None
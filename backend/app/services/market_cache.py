@@ -0,0 +1,351 @@
+"""Bounded, thread-safe cache for market data lookups."""
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional
+from app.config import get_settings
+
+settings = get_settings()
+
+
+class CacheEntry:
+    """A cached value with the time it was stored (None caches a miss)."""
+    
+    __slots__ = ("value", "stored_at")
+    
+    def __init__(self, value: Optional[Dict], stored_at: float):
+        self.value = value
+        self.stored_at = stored_at
+
+
+class CacheBackend(ABC):
+    """Storage for cache entries; implementations must be thread-safe."""
+    
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get the entry stored under a key, if any."""
+    
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry, expire_seconds: float) -> int:
+        """Store an entry, which may be dropped after expire_seconds.
+        
+        Returns:
+            Number of other entries evicted to stay within the size bound
+        """
+    
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete the entry stored under a key."""
+    
+    @abstractmethod
+    def clear(self) -> None:
+        """Delete all entries."""
+    
+    @abstractmethod
+    def size(self) -> int:
+        """Get the number of stored entries."""
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """Per-process LRU storage in an OrderedDict."""
+    
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+    
+    def set(self, key: str, entry: CacheEntry, expire_seconds: float) -> int:
+        with self._lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            evicted = 0
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+                evicted += 1
+            return evicted
+    
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self.entries.pop(key, None)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self.entries.clear()
+    
+    def size(self) -> int:
+        with self._lock:
+            return len(self.entries)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Storage in a SQLite file shared by every worker process on a host.
+    
+    Values are stored as JSON. Beyond max_entries, expired entries and then
+    the oldest stored entries are evicted.
+    """
+    
+    def __init__(self, path: str, max_entries: int = 1024):
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS market_cache ("
+            "key TEXT PRIMARY KEY, value TEXT, stored_at REAL NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._connection().execute(
+            "CREATE INDEX IF NOT EXISTS ix_market_cache_stored_at ON market_cache (stored_at)"
+        )
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, opening it on first use."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            # Autocommit, with WAL so readers in other workers are not blocked by writes
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+        return connection
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        row = self._connection().execute(
+            "SELECT value, stored_at FROM market_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return CacheEntry(json.loads(row[0]), row[1])
+    
+    def set(self, key: str, entry: CacheEntry, expire_seconds: float) -> int:
+        connection = self._connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO market_cache (key, value, stored_at, expires_at) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(entry.value), entry.stored_at, entry.stored_at + expire_seconds)
+        )
+        excess = self.size() - self.max_entries
+        if excess <= 0:
+            return 0
+        
+        connection.execute("DELETE FROM market_cache WHERE expires_at <= ?", (entry.stored_at,))
+        excess = self.size() - self.max_entries
+        if excess > 0:
+            connection.execute(
+                "DELETE FROM market_cache WHERE key IN "
+                "(SELECT key FROM market_cache WHERE key != ? ORDER BY stored_at LIMIT ?)",
+                (key, excess)
+            )
+        return max(excess, 0)
+    
+    def delete(self, key: str) -> None:
+        self._connection().execute("DELETE FROM market_cache WHERE key = ?", (key,))
+    
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM market_cache")
+    
+    def size(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM market_cache").fetchone()[0]
+
+
+class RedisCacheBackend(CacheBackend):
+    """Storage in Redis, shared by every worker and host.
+    
+    Takes a redis-py style client (get, set with px, delete, scan_iter).
+    Entries expire through Redis key TTLs; the size bound is left to the
+    server's maxmemory-policy (e.g. allkeys-lru).
+    """
+    
+    def __init__(self, client, prefix: str = "market:"):
+        self.client = client
+        self.prefix = prefix
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        return CacheEntry(data["value"], data["stored_at"])
+    
+    def set(self, key: str, entry: CacheEntry, expire_seconds: float) -> int:
+        self.client.set(
+            self.prefix + key,
+            json.dumps({"value": entry.value, "stored_at": entry.stored_at}),
+            px=max(int(expire_seconds * 1000), 1)
+        )
+        return 0
+    
+    def delete(self, key: str) -> None:
+        self.client.delete(self.prefix + key)
+    
+    def clear(self) -> None:
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+    
+    def size(self) -> int:
+        return sum(1 for _ in self.client.scan_iter(match=self.prefix + "*"))
+
+
+def create_cache_backend() -> CacheBackend:
+    """Create the cache backend selected by MARKET_CACHE_BACKEND."""
+    backend = settings.MARKET_CACHE_BACKEND
+    if backend == "memory":
+        return InMemoryCacheBackend(settings.MARKET_CACHE_MAX_ENTRIES)
+    if backend == "sqlite":
+        return SQLiteCacheBackend(settings.MARKET_CACHE_URL or "market_cache.db", settings.MARKET_CACHE_MAX_ENTRIES)
+    if backend == "redis":
+        # Optional dependency, only needed when Redis is selected
+        import redis
+        return RedisCacheBackend(redis.Redis.from_url(settings.MARKET_CACHE_URL or "redis://localhost:6379/0"))
+    raise ValueError(f"Unknown MARKET_CACHE_BACKEND: {backend}")
+
+
+class MarketDataCache:
+    """LRU + TTL cache with single-flight fetches and stale-while-revalidate.
+    
+    Entries are fresh for ttl seconds. After that, for up to stale_ttl more
+    seconds, the stale value is still served while one background refresh
+    replaces it. Misses for unknown keys (a fetch returning None) are cached
+    for negative_ttl seconds. Concurrent misses for a key in this process
+    share one fetch. Entries live in a pluggable backend, so workers can
+    share them; the default in-memory backend evicts the least recently
+    used entries beyond max_entries.
+    """
+    
+    def __init__(
+        self,
+        ttl_minutes: int = 15,
+        max_entries: int = 1024,
+        stale_ttl_minutes: int = 60,
+        negative_ttl_minutes: int = 5,
+        clock: Callable[[], float] = time.time,
+        backend: Optional[CacheBackend] = None
+    ):
+        self.backend = backend or InMemoryCacheBackend(max_entries)
+        self.ttl = ttl_minutes * 60
+        self.stale_ttl = stale_ttl_minutes * 60
+        self.negative_ttl = negative_ttl_minutes * 60
+        self.max_entries = max_entries
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self.counters = {
+            "hits": 0,
+            "stale_hits": 0,
+            "negative_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "fetches": 0,
+            "fetch_errors": 0,
+        }
+    
+    def _lookup(self, key: str) -> Optional[CacheEntry]:
+        """Get an entry that is fresh or still servable stale."""
+        entry = self.backend.get(key)
+        if entry is None:
+            return None
+        if self.clock() - entry.stored_at >= self._lifetime(entry.value):
+            self.backend.delete(key)
+            return None
+        return entry
+    
+    def _lifetime(self, value: Optional[Dict]) -> float:
+        """Get how long after storing an entry can still be served."""
+        return self.negative_ttl if value is None else self.ttl + self.stale_ttl
+    
+    def _store(self, key: str, value: Optional[Dict]) -> None:
+        """Store a value and count any evictions it caused."""
+        evicted = self.backend.set(key, CacheEntry(value, self.clock()), self._lifetime(value))
+        if evicted:
+            with self._lock:
+                self.counters["evictions"] += evicted
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """Get cached data if not expired."""
+        entry = self._lookup(key)
+        if entry is not None and self.clock() - entry.stored_at < self.ttl:
+            return entry.value
+        return None
+    
+    def set(self, key: str, data: Dict):
+        """Set cache data with timestamp."""
+        self._store(key, data)
+    
+    def get_or_fetch(self, key: str, fetch: Callable[[], Optional[Dict]]) -> Optional[Dict]:
+        """Get cached data, fetching it at most once across concurrent callers.
+        
+        Args:
+            key: Cache key
+            fetch: Loads the value; returns None for an unknown key and
+                raises on transient errors, which are not cached
+        
+        Returns:
+            The cached or fetched value, or None for an unknown key
+        """
+        entry = self._lookup(key)
+        
+        with self._lock:
+            if entry is not None:
+                if entry.value is None:
+                    self.counters["negative_hits"] += 1
+                    return None
+                if self.clock() - entry.stored_at < self.ttl:
+                    self.counters["hits"] += 1
+                    return entry.value
+                # Stale: serve it and let one background refresh replace it
+                self.counters["stale_hits"] += 1
+                if key not in self._in_flight:
+                    self._in_flight[key] = Future()
+                    threading.Thread(target=self._fetch, args=(key, fetch), daemon=True).start()
+                return entry.value
+            
+            self.counters["misses"] += 1
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+        
+        if leader:
+            self._fetch(key, fetch)
+        return future.result()
+    
+    def _fetch(self, key: str, fetch: Callable[[], Optional[Dict]]) -> None:
+        """Run a fetch and publish its outcome to the key's waiters."""
+        with self._lock:
+            future = self._in_flight[key]
+            self.counters["fetches"] += 1
+        try:
+            value = fetch()
+            self._store(key, value)
+        except Exception as e:
+            with self._lock:
+                self.counters["fetch_errors"] += 1
+                del self._in_flight[key]
+            future.set_exception(e)
+            return
+        
+        with self._lock:
+            del self._in_flight[key]
+        future.set_result(value)
+    
+    def stats(self) -> Dict:
+        """Get cache counters and current size."""
+        with self._lock:
+            counters = dict(self.counters)
+        return {
+            **counters,
+            "size": self.backend.size(),
+            "max_entries": self.max_entries,
+            "backend": type(self.backend).__name__,
+        }
+    
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self.backend.clear()
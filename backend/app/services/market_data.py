@@ -1,34 +1,30 @@
 """Market data service using yfinance."""
+import argparse
+import uuid
 import yfinance as yf
-from typing import Optional, Dict
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Iterable
+from datetime import datetime
 from decimal import Decimal
+from sqlalchemy.orm import Session
+from sqlalchemy import case, insert, update
+from app.config import get_settings
+from app.models.investment import Investment
+from app.models.price_snapshot import PriceSnapshot
+from app.services.market_cache import MarketDataCache, create_cache_backend
+from app.services.portfolio_service import recompute_portfolio_summaries
+from app.services.price_sources import PriceSource, get_price_source
 
-
-class MarketDataCache:
-    """Simple in-memory cache for market data."""
-    
-    def __init__(self, ttl_minutes: int = 15):
-        self.cache: Dict[str, tuple] = {}
-        self.ttl = timedelta(minutes=ttl_minutes)
-    
-    def get(self, key: str) -> Optional[Dict]:
-        """Get cached data if not expired."""
-        if key in self.cache:
-            data, timestamp = self.cache[key]
-            if datetime.now() - timestamp < self.ttl:
-                return data
-            else:
-                del self.cache[key]
-        return None
-    
-    def set(self, key: str, data: Dict):
-        """Set cache data with timestamp."""
-        self.cache[key] = (data, datetime.now())
-
+settings = get_settings()
 
 # Global cache instance
-market_cache = MarketDataCache()
+market_cache = MarketDataCache(
+    ttl_minutes=settings.MARKET_CACHE_TTL_MINUTES,
+    max_entries=settings.MARKET_CACHE_MAX_ENTRIES,
+    stale_ttl_minutes=settings.MARKET_CACHE_STALE_MINUTES,
+    negative_ttl_minutes=settings.MARKET_CACHE_NEGATIVE_MINUTES,
+    backend=create_cache_backend()
+)
 
 
 def get_stock_price(ticker_symbol: str, exchange: str = "NS") -> Optional[Dict]:
@@ -44,47 +40,46 @@ def get_stock_price(ticker_symbol: str, exchange: str = "NS") -> Optional[Dict]:
     """
     cache_key = f"{ticker_symbol}.{exchange}"
     
-    # Check cache first
-    cached_data = market_cache.get(cache_key)
-    if cached_data:
-        return cached_data
-    
     try:
-        # Fetch from yfinance
-        ticker = yf.Ticker(f"{ticker_symbol}.{exchange}")
-        hist = ticker.history(period="1d")
-        
-        if hist.empty:
-            return None
-        
-        latest = hist.iloc[-1]
-        info = ticker.info
-        
-        data = {
-            "symbol": ticker_symbol,
-            "exchange": exchange,
-            "current_price": float(latest["Close"]),
-            "open": float(latest["Open"]),
-            "high": float(latest["High"]),
-            "low": float(latest["Low"]),
-            "volume": int(latest["Volume"]),
-            "previous_close": float(info.get("previousClose", latest["Close"])),
-            "change": float(latest["Close"] - info.get("previousClose", latest["Close"])),
-            "change_percent": float(((latest["Close"] - info.get("previousClose", latest["Close"])) / info.get("previousClose", latest["Close"])) * 100),
-            "currency": "INR",
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        # Cache the result
-        market_cache.set(cache_key, data)
-        
-        return data
-    
+        return market_cache.get_or_fetch(cache_key, lambda: fetch_stock_price(ticker_symbol, exchange))
     except Exception as e:
         print(f"Error fetching stock price for {ticker_symbol}: {e}")
         return None
 
 
+def fetch_stock_price(ticker_symbol: str, exchange: str = "NS") -> Optional[Dict]:
+    """
+    Fetch current stock price from yfinance, bypassing the cache.
+    
+    Returns None for an unknown ticker and raises on fetch errors, so the
+    cache remembers unknown tickers but retries failures.
+    """
+    ticker = yf.Ticker(f"{ticker_symbol}.{exchange}")
+    hist = ticker.history(period="1d")
+    
+    if hist.empty:
+        return None
+    
+    latest = hist.iloc[-1]
+    info = ticker.info
+    previous_close = info.get("previousClose", latest["Close"])
+    
+    return {
+        "symbol": ticker_symbol,
+        "exchange": exchange,
+        "current_price": float(latest["Close"]),
+        "open": float(latest["Open"]),
+        "high": float(latest["High"]),
+        "low": float(latest["Low"]),
+        "volume": int(latest["Volume"]),
+        "previous_close": float(previous_close),
+        "change": float(latest["Close"] - previous_close),
+        "change_percent": float(((latest["Close"] - previous_close) / previous_close) * 100),
+        "currency": "INR",
+        "timestamp": datetime.now().isoformat()
+    }
+
+
 def get_mutual_fund_nav(scheme_code: str) -> Optional[Dict]:
     """
     Get mutual fund NAV.
@@ -99,34 +94,154 @@ def get_mutual_fund_nav(scheme_code: str) -> Optional[Dict]:
     """
     # For now, return placeholder
     # In production, integrate with AMFI or other MF data APIs
-    return {
-        "scheme_code": scheme_code,
-        "nav": None,
-        "date": datetime.now().date().isoformat(),
-        "message": "Mutual fund NAV data not available via yfinance. Integrate with AMFI API."
-    }
+    def fetch():
+        return {
+            "scheme_code": scheme_code,
+            "nav": None,
+            "date": datetime.now().date().isoformat(),
+            "message": "Mutual fund NAV data not available via yfinance. Integrate with AMFI API."
+        }
+    
+    return market_cache.get_or_fetch(f"MF:{scheme_code}", fetch)
 
 
-def update_investment_values(investments: list) -> list:
+def fetch_latest_prices(
+    ticker_symbols: Iterable[str],
+    exchange: str = "NS",
+    price_source: Optional[PriceSource] = None
+) -> Dict[str, Decimal]:
+    """
+    Fetch latest prices for many tickers in batches.
+    
+    Tickers are de-duplicated and split into batches of MARKET_BATCH_SIZE
+    symbols, each fetched with one multi-symbol call, with up to
+    MARKET_FETCH_WORKERS batches in flight. A failed batch is logged and
+    its tickers left out rather than failing the whole refresh.
+    
+    Args:
+        ticker_symbols: Stock ticker symbols (e.g., "RELIANCE")
+        exchange: Exchange suffix ("NS" for NSE, "BO" for BSE)
+        price_source: Source to fetch from (default: MARKET_PRICE_SOURCE)
+    
+    Returns:
+        Dictionary of ticker symbol to latest price
+    """
+    source = price_source or get_price_source()
+    symbols = sorted({f"{ticker}.{exchange}" for ticker in ticker_symbols if ticker})
+    if not symbols:
+        return {}
+    
+    size = settings.MARKET_BATCH_SIZE
+    batches = [symbols[i:i + size] for i in range(0, len(symbols), size)]
+    
+    def fetch_batch(batch):
+        try:
+            return source.fetch_prices(batch)
+        except Exception as e:
+            print(f"Error fetching prices for {len(batch)} symbols: {e}")
+            return {}
+    
+    prices = {}
+    with ThreadPoolExecutor(max_workers=min(settings.MARKET_FETCH_WORKERS, len(batches))) as pool:
+        for batch_prices in pool.map(fetch_batch, batches):
+            for symbol, price in batch_prices.items():
+                prices[symbol[:-len(exchange) - 1]] = price
+    
+    return prices
+
+
+def update_investment_values(investments: list, price_source: Optional[PriceSource] = None) -> list:
     """
     Update current values for investments with ticker symbols.
     
     Args:
         investments: List of investment objects
+        price_source: Source to fetch from (default: MARKET_PRICE_SOURCE)
     
     Returns:
         Updated list of investments
     """
-    for investment in investments:
-        if investment.ticker_symbol and investment.is_active:
-            # Determine exchange based on investment type
-            exchange = "NS"  # Default to NSE
-            
-            price_data = get_stock_price(investment.ticker_symbol, exchange)
-            if price_data:
-                # Update current value based on amount invested and current price
-                # This is a simplified calculation
-                # In production, track quantity separately
-                investment.current_value = Decimal(str(price_data["current_price"]))
+    active = [inv for inv in investments if inv.ticker_symbol and inv.is_active]
+    
+    # Default to NSE; every distinct ticker is fetched once, in batches
+    prices = fetch_latest_prices((inv.ticker_symbol for inv in active), "NS", price_source)
+    
+    for investment in active:
+        price = prices.get(investment.ticker_symbol)
+        if price is not None:
+            # Update current value based on current price
+            # This is a simplified calculation
+            # In production, track quantity separately
+            investment.current_value = price
     
     return investments
+
+
+def refresh_investment_prices(db: Session, price_source: Optional[PriceSource] = None) -> Dict:
+    """
+    Refresh current values of all users' active ticker investments.
+    
+    Distinct tickers are fetched once in batches and written back with a
+    single UPDATE keyed on ticker symbol. Each price is also recorded as a
+    price snapshot, and the portfolio summaries of affected users are
+    recomputed. Commits on success.
+    
+    Args:
+        db: Database session
+        price_source: Source to fetch from (default: MARKET_PRICE_SOURCE)
+    
+    Returns:
+        Counts of tickers requested, tickers priced, investments updated
+        and portfolio summaries recomputed
+    """
+    tickers = [
+        row.ticker_symbol for row in db.query(Investment.ticker_symbol).filter(
+            Investment.is_active == True,
+            Investment.ticker_symbol.isnot(None)
+        ).distinct()
+    ]
+    prices = fetch_latest_prices(tickers, "NS", price_source)
+    
+    updated = 0
+    summaries = 0
+    if prices:
+        captured_at = datetime.utcnow()
+        updated = db.execute(
+            update(Investment).where(
+                Investment.is_active == True,
+                Investment.ticker_symbol.in_(list(prices))
+            ).values(
+                current_value=case(prices, value=Investment.ticker_symbol),
+                updated_at=captured_at
+            ).execution_options(synchronize_session=False)
+        ).rowcount
+        
+        db.execute(insert(PriceSnapshot), [
+            {"id": uuid.uuid4(), "ticker_symbol": ticker, "exchange": "NS", "price": price, "captured_at": captured_at}
+            for ticker, price in prices.items()
+        ])
+        
+        user_ids = [
+            row.user_id for row in db.query(Investment.user_id).filter(
+                Investment.is_active == True,
+                Investment.ticker_symbol.in_(list(prices))
+            ).distinct()
+        ]
+        summaries = recompute_portfolio_summaries(db, user_ids)
+    db.commit()
+    
+    return {"tickers": len(tickers), "priced": len(prices), "updated": updated, "summaries": summaries}
+
+
+if __name__ == "__main__":
+    from app.database import SessionLocal
+    
+    parser = argparse.ArgumentParser(description="Refresh investment values from market prices.")
+    parser.parse_args()
+    
+    session = SessionLocal()
+    try:
+        result = refresh_investment_prices(session)
+        print(f"Priced {result['priced']} of {result['tickers']} tickers, updated {result['updated']} investments")
+    finally:
+        session.close()
@@ -0,0 +1,78 @@
+"""Password hashing on a dedicated, bounded process pool."""
+import asyncio
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Optional, Tuple
+from app.config import get_settings
+from app.services.auth_service import get_password_hash, verify_and_update_password
+
+settings = get_settings()
+
+
+class HasherBusyError(Exception):
+    """Raised when too many password hashes are already queued."""
+
+
+class PasswordHasher:
+    """Runs bcrypt in worker processes, off the event loop and threadpool.
+    
+    At most max_pending hashes may be queued or running at once; beyond
+    that, work is refused right away with HasherBusyError, so a burst of
+    logins fails fast instead of queueing for seconds.
+    """
+    
+    def __init__(self, workers: int = 0, max_pending: int = 0):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 4
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def pending(self) -> int:
+        """Number of hashes queued or running."""
+        return self._pending
+    
+    def _release(self, _: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+    
+    def _submit(self, fn, *args) -> Future:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise HasherBusyError(f"{self._pending} password hashes pending")
+            self._pending += 1
+        
+        try:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            future = self._pool.submit(fn, *args)
+        except Exception:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return future
+    
+    async def hash(self, password: str) -> str:
+        """Hash a password in a worker process."""
+        return await asyncio.wrap_future(self._submit(get_password_hash, password))
+    
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify a password in a worker process.
+        
+        Returns:
+            Whether the password matches, and a new hash to store if the
+            stored one was made with other cost parameters, else None
+        """
+        return await asyncio.wrap_future(self._submit(verify_and_update_password, password, hashed_password))
+    
+    def shutdown(self) -> None:
+        """Shut down the worker processes if they were started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+
+# Global hasher instance, shut down from the app lifespan
+password_hasher = PasswordHasher(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_PENDING)
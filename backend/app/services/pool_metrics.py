@@ -0,0 +1,170 @@
+"""Connection pool instrumentation fed by pool events."""
+import threading
+import time
+from typing import Dict, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+from app.utils.metrics import COUNT_BUCKETS, LATENCY_BUCKETS, Histogram, format_labels, histogram_lines
+
+
+class PoolMetrics:
+    """Checkout waits, occupancy and connection churn of one engine's pool.
+    
+    Occupancy (connections checked out, and overflow connections open) is
+    sampled into histograms at every checkout, so bursts show up even when
+    the pool is idle by the time metrics are read.
+    """
+    
+    def __init__(self):
+        self.wait_seconds = Histogram(LATENCY_BUCKETS)
+        self.checked_out = Histogram(COUNT_BUCKETS)
+        self.overflow = Histogram(COUNT_BUCKETS)
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self._lock = threading.Lock()
+    
+    def count(self, name: str) -> None:
+        """Add one to a counter."""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+    
+    def observe_checkout(self, pool: Pool) -> None:
+        """Record a checkout and the pool's occupancy after it."""
+        self.count("checkouts")
+        if isinstance(pool, QueuePool):
+            self.checked_out.observe(pool.checkedout())
+            self.overflow.observe(max(pool.overflow(), 0))
+    
+    def snapshot(self, pool: Pool) -> Dict:
+        """Get the pool's current state along with the recorded metrics."""
+        state = {}
+        if isinstance(pool, QueuePool):
+            state = {
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+            }
+        
+        return {
+            **state,
+            "checkouts": self.checkouts,
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "wait_seconds": self.wait_seconds.snapshot(),
+            "checked_out_at_checkout": self.checked_out.snapshot(),
+            "overflow_at_checkout": self.overflow.snapshot(),
+        }
+
+
+class InstrumentedPoolMixin:
+    """Times every checkout of a pool into its PoolMetrics.
+    
+    The time covers waiting for a free connection, opening an overflow
+    connection and the pre-ping, which is what a request waits before its
+    first query can run.
+    """
+    
+    metrics: Optional[PoolMetrics] = None
+    
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.count("timeouts")
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.wait_seconds.observe(time.perf_counter() - start)
+    
+    def recreate(self):
+        # Engine.dispose() swaps in a recreated pool; keep feeding the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    """QueuePool with checkout timing."""
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool with checkout timing."""
+
+
+# Instrumented engines by name, with their metrics
+instrumented_engines: Dict[str, tuple] = {}
+
+
+def instrument_engine(engine: Engine, name: str) -> PoolMetrics:
+    """Feed an engine's pool events into a new PoolMetrics.
+    
+    Args:
+        engine: Engine to instrument (for an AsyncEngine, its sync_engine)
+        name: Name the metrics are reported under
+    
+    Returns:
+        The engine's metrics
+    """
+    metrics = PoolMetrics()
+    engine.pool.metrics = metrics
+    
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        metrics.count("connects")
+    
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.observe_checkout(engine.pool)
+    
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.count("invalidations")
+    
+    instrumented_engines[name] = (engine, metrics)
+    return metrics
+
+
+def get_pool_metrics() -> Dict[str, Dict]:
+    """Get the metrics of every instrumented engine by name."""
+    return {name: metrics.snapshot(engine.pool) for name, (engine, metrics) in instrumented_engines.items()}
+
+
+def render_pool_metrics() -> List[str]:
+    """Format the metrics of every instrumented engine in Prometheus text format."""
+    snapshots = get_pool_metrics()
+    lines = []
+    gauges = (
+        ("db_pool_checked_out", "checked_out", "Connections currently checked out."),
+        ("db_pool_overflow", "overflow", "Overflow connections currently open."),
+    )
+    for name, key, help_text in gauges:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+        lines += [
+            f"{name}{format_labels({'engine': engine})} {snapshot[key]}"
+            for engine, snapshot in snapshots.items() if key in snapshot
+        ]
+    
+    counters = (
+        ("db_pool_checkouts_total", "checkouts", "Connections checked out."),
+        ("db_pool_timeouts_total", "timeouts", "Checkouts that timed out waiting for a connection."),
+    )
+    for name, key, help_text in counters:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        lines += [
+            f"{name}{format_labels({'engine': engine})} {snapshot[key]}"
+            for engine, snapshot in snapshots.items()
+        ]
+    
+    name = "db_pool_checkout_wait_seconds"
+    lines += [f"# HELP {name} Time to get a connection from the pool.", f"# TYPE {name} histogram"]
+    for engine, snapshot in snapshots.items():
+        lines += histogram_lines(name, {"engine": engine}, snapshot["wait_seconds"])
+    return lines
@@ -0,0 +1,187 @@
+"""Portfolio performance analytics over stored daily price history."""
+from datetime import date, timedelta
+from typing import Dict, Optional
+import numpy as np
+from sqlalchemy.orm import Session
+from app.models.investment import Investment, AssetLiabilityCategory
+from app.services.price_history import PriceHistoryStore, ensure_history, price_history_store
+from app.services.price_sources import PriceSource
+
+
+class ValueSeries:
+    """Daily portfolio value and amount invested on a business-day grid."""
+    
+    def __init__(self, dates: np.ndarray, values: np.ndarray, invested: np.ndarray, flows: list):
+        self.dates = dates
+        self.values = values
+        self.invested = invested
+        self.flows = flows  # (date, amount invested) per holding in the window
+
+
+def portfolio_value_series(
+    db: Session,
+    user_id,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    store: PriceHistoryStore = price_history_store,
+    price_source: Optional[PriceSource] = None
+) -> ValueSeries:
+    """Value a user's active asset holdings on every business day of a window.
+    
+    Holdings with a ticker are valued as the units bought with
+    amount_invested at the first close on or after start_date, times each
+    day's close (carried forward over holidays). Other holdings grow from
+    amount_invested at annual_return_pct, or stay flat without one. All
+    holdings are valued together as one matrix, one row per holding.
+    
+    Args:
+        db: Database session
+        user_id: Owner of the holdings
+        start_date: First day (default: first holding's start date)
+        end_date: Last day (default and maximum: yesterday, the last full close)
+    
+    Returns:
+        Value series; empty if there are no holdings in the window
+    """
+    holdings = db.query(
+        Investment.ticker_symbol,
+        Investment.amount_invested,
+        Investment.start_date,
+        Investment.annual_return_pct
+    ).filter(
+        Investment.user_id == user_id,
+        Investment.is_active == True,
+        Investment.rich_dad_category == AssetLiabilityCategory.ASSET
+    ).all()
+    
+    yesterday = date.today() - timedelta(days=1)
+    end_date = min(end_date or yesterday, yesterday)
+    holdings = [h for h in holdings if h.start_date <= end_date]
+    if not holdings:
+        return ValueSeries(np.array([], dtype="datetime64[D]"), np.array([]), np.array([]), [])
+    
+    start_date = start_date or min(h.start_date for h in holdings)
+    grid = np.arange(np.datetime64(start_date, "D"), np.datetime64(end_date, "D") + 1)
+    grid = grid[np.is_busday(grid)]
+    
+    amounts = np.array([float(h.amount_invested) for h in holdings])
+    starts = np.array([h.start_date for h in holdings], dtype="datetime64[D]")
+    held = grid[None, :] >= starts[:, None]
+    
+    # Default valuation: amount invested compounded at the expected annual return
+    rates = np.array([float(h.annual_return_pct or 0) / 100 for h in holdings])
+    years = np.maximum((grid[None, :] - starts[:, None]).astype(np.float64), 0) / 365
+    values = amounts[:, None] * (1 + rates[:, None]) ** years
+    
+    # Market valuation of ticker holdings from the stored closes
+    symbols = sorted({f"{h.ticker_symbol}.NS" for h in holdings if h.ticker_symbol})
+    if symbols:
+        history_start = min(min(h.start_date for h in holdings if h.ticker_symbol), start_date)
+        ensure_history(store, symbols, history_start, end_date, price_source)
+        
+        for symbol in symbols:
+            rows = np.array([bool(h.ticker_symbol) and f"{h.ticker_symbol}.NS" == symbol for h in holdings])
+            dates, closes = store.closes(symbol, history_start, end_date)
+            if not len(dates):
+                continue
+            
+            # Close on or before each grid day, and first close on or after each purchase
+            on_or_before = np.searchsorted(dates, grid, side="right") - 1
+            daily = np.where(on_or_before >= 0, closes[np.maximum(on_or_before, 0)], np.nan)
+            bought_at = np.searchsorted(dates, starts[rows], side="left")
+            priced = bought_at < len(dates)
+            units = np.where(priced, amounts[rows] / closes[np.minimum(bought_at, len(dates) - 1)], np.nan)
+            
+            market = units[:, None] * daily[None, :]
+            values[rows] = np.where(np.isnan(market), values[rows], market)
+    
+    values = np.where(held, values, 0.0)
+    flows = [(h.start_date, float(h.amount_invested)) for h in holdings]
+    return ValueSeries(grid, values.sum(axis=0), np.where(held, amounts[:, None], 0.0).sum(axis=0), flows)
+
+
+def xirr(amounts: np.ndarray, dates: np.ndarray) -> Optional[float]:
+    """Annualized internal rate of return of dated cash flows.
+    
+    Args:
+        amounts: Cash flows; investments negative, proceeds positive
+        dates: Dates of the flows (datetime64[D])
+    
+    Returns:
+        Rate as a fraction (0.12 for 12%), or None if it does not exist
+    """
+    if not ((amounts < 0).any() and (amounts > 0).any()):
+        return None
+    
+    years = (dates - dates.min()).astype(np.float64) / 365
+    
+    def npv(rate: float) -> float:
+        return float(np.sum(amounts / (1 + rate) ** years))
+    
+    # Newton's method on the NPV curve, with bisection as the fallback
+    rate = 0.1
+    for _ in range(50):
+        discount = (1 + rate) ** years
+        value = np.sum(amounts / discount)
+        slope = np.sum(-years * amounts / (discount * (1 + rate)))
+        if slope == 0:
+            break
+        step = value / slope
+        rate -= step
+        if rate <= -1:
+            break
+        if abs(step) < 1e-10:
+            return float(rate)
+    
+    low, high = -0.9999, 100.0
+    if npv(low) * npv(high) > 0:
+        return None
+    for _ in range(200):
+        mid = (low + high) / 2
+        if npv(low) * npv(mid) <= 0:
+            high = mid
+        else:
+            low = mid
+        if high - low < 1e-10:
+            break
+    return (low + high) / 2
+
+
+def portfolio_xirr(series: ValueSeries) -> Optional[float]:
+    """XIRR of a portfolio: every purchase against the final value."""
+    if not len(series.dates):
+        return None
+    amounts = np.array([-amount for _, amount in series.flows] + [series.values[-1]])
+    dates = np.array([flow_date for flow_date, _ in series.flows] + [series.dates[-1]], dtype="datetime64[D]")
+    return xirr(amounts, dates)
+
+
+def drawdown(series: ValueSeries) -> Dict:
+    """Maximum and current drawdown of a portfolio's time-weighted returns.
+    
+    New purchases are taken out of each day's change, so buying more does
+    not look like a gain nor hide a loss.
+    
+    Returns:
+        max_drawdown and current_drawdown as negative fractions, with the
+        peak and trough dates of the maximum drawdown
+    """
+    if len(series.dates) < 2:
+        return {"max_drawdown": 0.0, "current_drawdown": 0.0, "peak_date": None, "trough_date": None}
+    
+    previous = series.values[:-1]
+    contributions = np.diff(series.invested)
+    returns = np.where(previous > 0, (series.values[1:] - contributions) / np.where(previous > 0, previous, 1), 1.0)
+    index = np.concatenate([[1.0], np.cumprod(returns)])
+    
+    peaks = np.maximum.accumulate(index)
+    drawdowns = index / peaks - 1
+    trough = int(np.argmin(drawdowns))
+    peak = int(np.argmax(index[:trough + 1]))
+    
+    return {
+        "max_drawdown": float(drawdowns[trough]),
+        "current_drawdown": float(drawdowns[-1]),
+        "peak_date": series.dates[peak].astype(object) if drawdowns[trough] < 0 else None,
+        "trough_date": series.dates[trough].astype(object) if drawdowns[trough] < 0 else None,
+    }
@@ -0,0 +1,88 @@
+"""Portfolio service for precomputed investment valuations."""
+from decimal import Decimal
+from typing import List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import func, case
+from app.database import UPSERT_INSERTS
+from app.models.investment import Investment, AssetLiabilityCategory
+from app.models.portfolio_summary import PortfolioSummary
+
+
+def recompute_portfolio_summaries(db: Session, user_ids: Optional[List] = None) -> int:
+    """Recompute asset and liability totals from active investments.
+    
+    An investment is valued at current_value, or amount_invested when no
+    current value is known. The rows are written in the caller's session,
+    which must commit.
+    
+    Args:
+        db: Database session
+        user_ids: Recompute only these users (default: all users)
+    
+    Returns:
+        Number of summary rows written
+    """
+    db.flush()
+    
+    value = func.coalesce(func.nullif(Investment.current_value, 0), Investment.amount_invested)
+    is_asset = Investment.rich_dad_category == AssetLiabilityCategory.ASSET
+    is_liability = Investment.rich_dad_category == AssetLiabilityCategory.LIABILITY
+    
+    query = db.query(
+        Investment.user_id,
+        func.sum(case((is_asset, value), else_=0)).label("assets"),
+        func.sum(case((is_liability, value), else_=0)).label("liabilities"),
+        func.sum(case((is_asset, 1), else_=0)).label("asset_count"),
+        func.sum(case((is_liability, 1), else_=0)).label("liability_count")
+    ).filter(Investment.is_active == True)
+    
+    if user_ids is not None:
+        if not user_ids:
+            return 0
+        query = query.filter(Investment.user_id.in_(user_ids))
+    
+    rows = {
+        row.user_id: {
+            "user_id": row.user_id,
+            "total_assets_value": row.assets or Decimal("0"),
+            "total_liabilities_value": row.liabilities or Decimal("0"),
+            "asset_count": row.asset_count or 0,
+            "liability_count": row.liability_count or 0,
+        }
+        for row in query.group_by(Investment.user_id)
+    }
+    
+    # Requested users without active investments get an explicit empty summary
+    for user_id in user_ids or []:
+        rows.setdefault(user_id, {
+            "user_id": user_id,
+            "total_assets_value": Decimal("0"),
+            "total_liabilities_value": Decimal("0"),
+            "asset_count": 0,
+            "liability_count": 0,
+        })
+    
+    # A full recompute also drops summaries of users with no active investments
+    if user_ids is None:
+        active_users = db.query(Investment.user_id).filter(Investment.is_active == True)
+        db.query(PortfolioSummary).filter(
+            PortfolioSummary.user_id.not_in(active_users.scalar_subquery())
+        ).delete(synchronize_session=False)
+    
+    # Upsert so concurrent recomputes for the same user cannot collide on the key
+    if rows:
+        dialect_insert = UPSERT_INSERTS[db.get_bind().dialect.name]
+        stmt = dialect_insert(PortfolioSummary)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PortfolioSummary.user_id],
+            set_={
+                "total_assets_value": stmt.excluded.total_assets_value,
+                "total_liabilities_value": stmt.excluded.total_liabilities_value,
+                "asset_count": stmt.excluded.asset_count,
+                "liability_count": stmt.excluded.liability_count,
+                "updated_at": stmt.excluded.updated_at,
+            }
+        )
+        db.execute(stmt, list(rows.values()))
+    
+    return len(rows)
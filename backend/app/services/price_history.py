@@ -0,0 +1,141 @@
+"""Local daily price-history store in a columnar NumPy layout."""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+import numpy as np
+from app.config import get_settings
+from app.services.price_sources import PriceSource, empty_history, get_price_source
+
+settings = get_settings()
+
+HISTORY_COLUMNS = ("date", "open", "high", "low", "close", "volume")
+
+
+class PriceHistoryStore:
+    """Daily OHLCV bars per symbol, one .npz file of column arrays each.
+    
+    Besides the bars, each file records the date range already fetched
+    (its coverage), so ranges without trading days such as weekends are not
+    requested again. Files are replaced atomically, so several workers can
+    share a directory; loaded columns are cached until the file changes.
+    """
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._loaded: Dict[str, tuple] = {}
+    
+    def _path(self, symbol: str) -> str:
+        return os.path.join(self.directory, f"{symbol.replace('/', '_')}.npz")
+    
+    def load(self, symbol: str) -> Tuple[Dict[str, np.ndarray], Optional[Tuple[date, date]]]:
+        """Get the stored columns of a symbol and the date range they cover."""
+        path = self._path(symbol)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return empty_history(), None
+        
+        with self._lock:
+            cached = self._loaded.get(symbol)
+            if cached and cached[0] == (stat.st_mtime_ns, stat.st_size):
+                return cached[1], cached[2]
+        
+        with np.load(path) as data:
+            columns = {column: data[column] for column in HISTORY_COLUMNS}
+            start, end = data["coverage"].astype(object)
+        
+        with self._lock:
+            self._loaded[symbol] = ((stat.st_mtime_ns, stat.st_size), columns, (start, end))
+        return columns, (start, end)
+    
+    def save(self, symbol: str, columns: Dict[str, np.ndarray], coverage: Tuple[date, date]) -> None:
+        """Replace the stored columns of a symbol."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(symbol)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, coverage=np.array(coverage, dtype="datetime64[D]"), **columns)
+        os.replace(tmp_path, path)
+    
+    def missing_ranges(self, symbol: str, start: date, end: date) -> list:
+        """Get the date ranges to fetch so coverage spans start to end.
+        
+        Ranges always border the current coverage, so coverage stays one
+        contiguous range.
+        """
+        _, coverage = self.load(symbol)
+        if coverage is None:
+            return [(start, end)]
+        
+        ranges = []
+        if start < coverage[0]:
+            ranges.append((start, coverage[0] - timedelta(days=1)))
+        if end > coverage[1]:
+            ranges.append((coverage[1] + timedelta(days=1), end))
+        return ranges
+    
+    def update(self, symbol: str, start: date, end: date, source: PriceSource) -> int:
+        """Fetch and store the bars of a symbol missing between start and end.
+        
+        Returns:
+            Number of bars added
+        """
+        ranges = self.missing_ranges(symbol, start, end)
+        if not ranges:
+            return 0
+        
+        columns, coverage = self.load(symbol)
+        fetched = [source.fetch_history(symbol, range_start, range_end) for range_start, range_end in ranges]
+        
+        # Sorted by date, keeping the newest bar if a source repeats a stored date
+        parts = fetched + [columns]
+        merged = {column: np.concatenate([part[column] for part in parts]) for column in HISTORY_COLUMNS}
+        _, keep = np.unique(merged["date"], return_index=True)
+        merged = {column: values[keep] for column, values in merged.items()}
+        
+        if coverage is not None:
+            start, end = min(start, coverage[0]), max(end, coverage[1])
+        self.save(symbol, merged, (start, end))
+        return len(merged["date"]) - len(columns["date"])
+    
+    def closes(self, symbol: str, start: date, end: date) -> Tuple[np.ndarray, np.ndarray]:
+        """Get stored dates and closes of a symbol between two dates, inclusive."""
+        columns, _ = self.load(symbol)
+        dates = columns["date"]
+        lo = np.searchsorted(dates, np.datetime64(start, "D"), side="left")
+        hi = np.searchsorted(dates, np.datetime64(end, "D"), side="right")
+        return dates[lo:hi], columns["close"][lo:hi]
+
+
+def ensure_history(
+    store: PriceHistoryStore,
+    symbols: Iterable[str],
+    start: date,
+    end: date,
+    price_source: Optional[PriceSource] = None
+) -> None:
+    """Fill the stored history of several symbols up to the requested range.
+    
+    Symbols are updated concurrently on up to MARKET_FETCH_WORKERS threads.
+    A symbol that fails to update is logged and served from what is stored.
+    """
+    source = price_source or get_price_source()
+    symbols = sorted(set(symbols))
+    if not symbols:
+        return
+    
+    def update(symbol):
+        try:
+            store.update(symbol, start, end, source)
+        except Exception as e:
+            print(f"Error updating price history for {symbol}: {e}")
+    
+    with ThreadPoolExecutor(max_workers=min(settings.MARKET_FETCH_WORKERS, len(symbols))) as pool:
+        list(pool.map(update, symbols))
+
+
+# Global store instance
+price_history_store = PriceHistoryStore(settings.PRICE_HISTORY_DIR)
@@ -0,0 +1,94 @@
+"""Background scheduler that keeps investment prices fresh."""
+import asyncio
+from datetime import datetime, time, timedelta
+from typing import Callable, Dict, Optional
+from zoneinfo import ZoneInfo
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.price_snapshot import PriceSnapshot
+from app.services.market_data import refresh_investment_prices
+from app.services.price_sources import PriceSource
+
+settings = get_settings()
+
+
+def is_market_open(now: datetime) -> bool:
+    """Check whether a timezone-aware time falls in market hours on a weekday."""
+    local = now.astimezone(ZoneInfo(settings.MARKET_TIMEZONE))
+    opens = time.fromisoformat(settings.MARKET_HOURS_START)
+    closes = time.fromisoformat(settings.MARKET_HOURS_END)
+    return local.weekday() < 5 and opens <= local.time() <= closes
+
+
+def run_scheduled_refresh(price_source: Optional[PriceSource] = None) -> Optional[Dict]:
+    """Refresh prices unless another worker did so within the last half interval.
+    
+    Every uvicorn worker runs its own scheduler; checking the latest price
+    snapshot first keeps them from refreshing the same tickers back to back.
+    
+    Returns:
+        Refresh counts, or None if the refresh was skipped
+    """
+    db = SessionLocal()
+    try:
+        last_captured = db.query(func.max(PriceSnapshot.captured_at)).scalar()
+        min_age = timedelta(seconds=settings.PRICE_REFRESH_INTERVAL_SECONDS / 2)
+        if last_captured and datetime.utcnow() - last_captured < min_age:
+            return None
+        return refresh_investment_prices(db, price_source)
+    finally:
+        db.close()
+
+
+class PriceRefreshScheduler:
+    """Runs a price refresh job on an interval during market hours."""
+    
+    def __init__(
+        self,
+        interval_seconds: int,
+        job: Callable[[], Optional[Dict]] = run_scheduled_refresh,
+        market_open: Callable[[datetime], bool] = is_market_open
+    ):
+        self.interval_seconds = interval_seconds
+        self.job = job
+        self.market_open = market_open
+        self.last_result: Optional[Dict] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self) -> None:
+        """Start the refresh loop on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """Cancel the refresh loop and wait for it to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def run_once(self) -> Optional[Dict]:
+        """Run the job in the threadpool if the market is open."""
+        if not self.market_open(datetime.now(ZoneInfo("UTC"))):
+            return None
+        try:
+            # The job does blocking network and database work
+            self.last_result = await run_in_threadpool(self.job)
+        except Exception as e:
+            print(f"Error refreshing prices: {e}")
+            return None
+        return self.last_result
+    
+    async def _run(self) -> None:
+        while True:
+            await self.run_once()
+            await asyncio.sleep(self.interval_seconds)
+
+
+# Global scheduler instance, started from the app lifespan
+price_scheduler = PriceRefreshScheduler(settings.PRICE_REFRESH_INTERVAL_SECONDS)
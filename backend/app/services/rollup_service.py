@@ -0,0 +1,199 @@
+"""Monthly rollup service for pre-aggregated transaction totals."""
+import argparse
+from datetime import date
+from decimal import Decimal
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import func, extract, insert
+from app.database import UPSERT_INSERTS
+from app.models.transaction import Transaction
+from app.models.monthly_rollup import MonthlyRollup
+
+
+def month_start(value: date) -> date:
+    """Get the first day of the month for a date."""
+    return value.replace(day=1)
+
+
+def apply_rollup_delta(
+    db: Session,
+    user_id,
+    transaction_type,
+    category: str,
+    rich_dad_category,
+    transaction_date: date,
+    amount: Decimal,
+    count: int
+) -> None:
+    """Add an amount and count to the rollup row for a transaction's key.
+    
+    The common case updates the existing row in place. When the key has no
+    row yet it is inserted with ON CONFLICT DO UPDATE, so a concurrent writer
+    that created the same key first gets the delta added to its row instead
+    of a duplicate. The change is flushed in the caller's session, so it
+    commits or rolls back together with the transaction write that caused it.
+    """
+    month = month_start(transaction_date)
+    updated = db.query(MonthlyRollup).filter(
+        MonthlyRollup.user_id == user_id,
+        MonthlyRollup.month == month,
+        MonthlyRollup.type == transaction_type,
+        MonthlyRollup.category == category,
+        MonthlyRollup.rich_dad_category == rich_dad_category
+    ).update(
+        {
+            MonthlyRollup.total_amount: MonthlyRollup.total_amount + amount,
+            MonthlyRollup.transaction_count: MonthlyRollup.transaction_count + count,
+        },
+        synchronize_session=False
+    )
+    
+    if not updated:
+        dialect_insert = UPSERT_INSERTS[db.get_bind().dialect.name]
+        stmt = dialect_insert(MonthlyRollup).values(
+            user_id=user_id,
+            month=month,
+            type=transaction_type,
+            category=category,
+            rich_dad_category=rich_dad_category,
+            total_amount=amount,
+            transaction_count=count
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                MonthlyRollup.user_id,
+                MonthlyRollup.month,
+                MonthlyRollup.type,
+                MonthlyRollup.category,
+                MonthlyRollup.rich_dad_category,
+            ],
+            set_={
+                "total_amount": MonthlyRollup.total_amount + stmt.excluded.total_amount,
+                "transaction_count": MonthlyRollup.transaction_count + stmt.excluded.transaction_count,
+                "updated_at": stmt.excluded.updated_at,
+            }
+        )
+        db.execute(stmt)
+
+
+def add_to_rollup(db: Session, transaction: Transaction) -> None:
+    """Record a new transaction in the monthly rollups."""
+    apply_rollup_delta(
+        db,
+        transaction.user_id,
+        transaction.type,
+        transaction.category,
+        transaction.rich_dad_category,
+        transaction.transaction_date,
+        transaction.amount,
+        1
+    )
+
+
+def remove_from_rollup(db: Session, transaction: Transaction) -> None:
+    """Remove a transaction's current values from the monthly rollups."""
+    apply_rollup_delta(
+        db,
+        transaction.user_id,
+        transaction.type,
+        transaction.category,
+        transaction.rich_dad_category,
+        transaction.transaction_date,
+        -transaction.amount,
+        -1
+    )
+
+
+def add_many_to_rollup(db: Session, rows: List[Dict]) -> None:
+    """Record a batch of new transaction rows in the monthly rollups.
+    
+    Rows are summed per rollup key first, so a batch costs one upsert per
+    distinct (month, type, category, rich_dad_category) rather than per row.
+    """
+    deltas = {}
+    for row in rows:
+        key = (
+            row["user_id"],
+            month_start(row["transaction_date"]),
+            row["type"],
+            row["category"],
+            row.get("rich_dad_category"),
+        )
+        amount, count = deltas.get(key, (Decimal("0"), 0))
+        deltas[key] = (amount + row["amount"], count + 1)
+    
+    for (user_id, month, transaction_type, category, rich_dad_category), (amount, count) in deltas.items():
+        apply_rollup_delta(db, user_id, transaction_type, category, rich_dad_category, month, amount, count)
+
+
+def rebuild_monthly_rollups(db: Session, user_id: Optional[str] = None) -> int:
+    """Rebuild monthly rollups from the transactions table.
+    
+    Args:
+        db: Database session
+        user_id: Rebuild only this user's rollups (default: all users)
+    
+    Returns:
+        Number of rollup rows written
+    """
+    year = extract("year", Transaction.transaction_date)
+    month = extract("month", Transaction.transaction_date)
+    
+    query = db.query(
+        Transaction.user_id,
+        year.label("year"),
+        month.label("month"),
+        Transaction.type,
+        Transaction.category,
+        Transaction.rich_dad_category,
+        func.sum(Transaction.amount).label("total"),
+        func.count(Transaction.id).label("count")
+    )
+    delete_query = db.query(MonthlyRollup)
+    
+    if user_id:
+        query = query.filter(Transaction.user_id == user_id)
+        delete_query = delete_query.filter(MonthlyRollup.user_id == user_id)
+    
+    rows = query.group_by(
+        Transaction.user_id,
+        year,
+        month,
+        Transaction.type,
+        Transaction.category,
+        Transaction.rich_dad_category
+    ).all()
+    
+    delete_query.delete(synchronize_session=False)
+    
+    if rows:
+        db.execute(insert(MonthlyRollup), [
+            {
+                "user_id": row.user_id,
+                "month": date(int(row.year), int(row.month), 1),
+                "type": row.type,
+                "category": row.category,
+                "rich_dad_category": row.rich_dad_category,
+                "total_amount": row.total,
+                "transaction_count": row.count,
+            }
+            for row in rows
+        ])
+    
+    db.commit()
+    return len(rows)
+
+
+if __name__ == "__main__":
+    from app.database import SessionLocal
+    
+    parser = argparse.ArgumentParser(description="Rebuild monthly transaction rollups.")
+    parser.add_argument("--user-id", help="Rebuild only this user's rollups")
+    args = parser.parse_args()
+    
+    session = SessionLocal()
+    try:
+        written = rebuild_monthly_rollups(session, args.user_id)
+        print(f"Rebuilt {written} monthly rollup rows")
+    finally:
+        session.close()
@@ -0,0 +1,144 @@
+"""Parallel and streaming SMS parsing on a shared process pool."""
+import asyncio
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, Dict, List, Optional
+from app.config import get_settings
+from app.services.sms_parser import parse_multiple_sms
+
+settings = get_settings()
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_worker_count() -> int:
+    """Get the configured number of parser processes."""
+    return settings.SMS_PARSE_WORKERS or os.cpu_count() or 1
+
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    """Get the shared parser process pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=get_worker_count())
+    return _pool
+
+
+def shutdown_parse_pool() -> None:
+    """Shut down the shared parser process pool if it was started."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
+
+
+def parse_sms_chunk(sms_list: List[str]) -> List[Dict]:
+    """Parse a chunk of SMS messages into result dicts (runs in a worker process)."""
+    return [result.to_dict() for result in parse_multiple_sms(sms_list)]
+
+
+def chunked(items: List[str], size: int) -> List[List[str]]:
+    """Split a list into consecutive chunks of at most size items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+async def parse_sms_parallel(sms_list: List[str], chunk_size: Optional[int] = None) -> List[Dict]:
+    """Parse a large batch of SMS messages across the process pool.
+    
+    Returns the same successful-result dicts, in input order, as
+    parse_multiple_sms followed by to_dict.
+    """
+    loop = asyncio.get_running_loop()
+    pool = get_parse_pool()
+    chunks = chunked(sms_list, chunk_size or settings.SMS_PARSE_CHUNK_SIZE)
+    
+    chunk_results = await asyncio.gather(*[
+        loop.run_in_executor(pool, parse_sms_chunk, chunk) for chunk in chunks
+    ])
+    return [result for results in chunk_results for result in results]
+
+
+async def iter_body(body: bytes, size: int) -> AsyncIterator[bytes]:
+    """Wrap an already-read request body as a stream of slices of at most size bytes."""
+    view = memoryview(body)
+    for start in range(0, len(view), size):
+        yield bytes(view[start:start + size])
+
+
+async def iter_ndjson_sms(stream: AsyncIterator[bytes]) -> AsyncIterator[object]:
+    """Decode an NDJSON byte stream into SMS texts.
+    
+    Each line may be a JSON string or an object with an "sms_text" key.
+    Lines that cannot be decoded are yielded as an error dict instead.
+    """
+    buffer = b""
+    line_number = 0
+    
+    def decode(line: bytes):
+        try:
+            value = json.loads(line)
+        except ValueError:
+            return {"line": line_number, "error": "Invalid JSON"}
+        if isinstance(value, dict):
+            value = value.get("sms_text")
+        if not isinstance(value, str):
+            return {"line": line_number, "error": "Expected a string or an object with sms_text"}
+        return value
+    
+    async for data in stream:
+        buffer += data
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield decode(line)
+    
+    if buffer.strip():
+        line_number += 1
+        yield decode(buffer)
+
+
+async def stream_parse_sms(
+    stream: AsyncIterator[bytes],
+    chunk_size: Optional[int] = None
+) -> AsyncIterator[str]:
+    """Parse an NDJSON stream of SMS messages, yielding NDJSON results.
+    
+    Messages are batched into chunks and parsed on the process pool with a
+    bounded number of chunks in flight, so the parsed-but-unsent results
+    stay bounded however long the input is. The input itself is held by
+    the caller; the endpoint caps it at SMS_STREAM_MAX_BYTES. Parse results
+    keep input order; undecodable lines are reported as an error dict as
+    soon as they are read.
+    """
+    loop = asyncio.get_running_loop()
+    pool = get_parse_pool()
+    size = chunk_size or settings.SMS_PARSE_CHUNK_SIZE
+    max_in_flight = get_worker_count() * 2
+    
+    pending = deque()
+    chunk: List[str] = []
+    
+    def submit():
+        pending.append(loop.run_in_executor(pool, parse_sms_chunk, chunk))
+    
+    async for item in iter_ndjson_sms(stream):
+        if isinstance(item, dict):
+            yield json.dumps(item) + "\n"
+            continue
+        
+        chunk.append(item)
+        if len(chunk) >= size:
+            submit()
+            chunk = []
+            if len(pending) >= max_in_flight:
+                for result in await pending.popleft():
+                    yield json.dumps(result) + "\n"
+    
+    if chunk:
+        submit()
+    while pending:
+        for result in await pending.popleft():
+            yield json.dumps(result) + "\n"
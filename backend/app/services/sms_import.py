@@ -0,0 +1,97 @@
+"""SMS import service for turning bank SMS into transactions."""
+import hashlib
+from datetime import date, datetime
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session
+from app.models.transaction import TransactionType, TransactionSource
+from app.services.sms_parser import SMSParseResult, parse_sms
+from app.services.transaction_service import insert_new_sms_transactions
+from app.utils.constants import SMS_DATE_FORMATS
+
+# Category given to imported transactions until the user recategorizes them
+SMS_IMPORT_CATEGORY = "Other"
+
+
+def parse_sms_date(value: Optional[str]) -> Optional[date]:
+    """Parse a date captured from an SMS, or None if no format matches."""
+    if not value:
+        return None
+    for date_format in SMS_DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).date()
+        except ValueError:
+            continue
+    return None
+
+
+def sms_fingerprint(result: SMSParseResult, transaction_date: date) -> str:
+    """Build the dedup fingerprint of a parsed SMS.
+    
+    The bank reference number identifies a transaction on its own; without
+    one, the amount, date and account together stand in for it.
+    """
+    if result.reference_number:
+        key = f"ref:{result.reference_number}"
+    else:
+        key = f"{result.amount}|{transaction_date.isoformat()}|{result.account_last4 or ''}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def sms_result_to_row(result: SMSParseResult) -> Optional[Dict]:
+    """Map a successful SMS parse result to transaction column values.
+    
+    Returns:
+        Column values, or None if the result lacks an amount, type or date
+    """
+    transaction_date = parse_sms_date(result.date)
+    if not result.amount or not result.transaction_type or transaction_date is None:
+        return None
+    
+    return {
+        "type": TransactionType.EXPENSE if result.transaction_type == "DEBIT" else TransactionType.INCOME,
+        "category": SMS_IMPORT_CATEGORY,
+        "amount": result.amount,
+        "currency": "INR",
+        "description": f"{result.bank} SMS",
+        "merchant_name": result.merchant,
+        "source": TransactionSource.SMS,
+        "account_identifier": result.account_last4,
+        "transaction_date": transaction_date,
+        "is_recurring": False,
+        "sms_fingerprint": sms_fingerprint(result, transaction_date),
+    }
+
+
+def import_sms(db: Session, user_id, sms_list: List[str]) -> Dict:
+    """Parse SMS messages and insert the new transactions they describe.
+    
+    Messages already imported for the user are skipped, so re-syncing an
+    inbox only writes what is new. Commits on success.
+    
+    Args:
+        db: Database session
+        user_id: Owner of the transactions
+        sms_list: Raw SMS texts
+    
+    Returns:
+        Counts of imported, duplicate and unparsed messages, and the new ids
+    """
+    rows = {}
+    unparsed = 0
+    for sms_text in sms_list:
+        result = parse_sms(sms_text)
+        row = sms_result_to_row(result) if result.success else None
+        if row is None:
+            unparsed += 1
+            continue
+        rows.setdefault(row["sms_fingerprint"], row)
+    
+    ids = insert_new_sms_transactions(db, user_id, list(rows.values()))
+    db.commit()
+    
+    return {
+        "imported": len(ids),
+        "duplicates": len(sms_list) - unparsed - len(ids),
+        "unparsed": unparsed,
+        "transaction_ids": ids,
+    }
@@ -3,7 +3,12 @@ import re
 from datetime import datetime
 from decimal import Decimal
 from typing import Dict, Optional, List
-from app.utils.constants import SMS_PATTERNS
+from app.utils.constants import (
+    SMS_PATTERNS,
+    SMS_ANCHORS,
+    SMS_FIELD_GROUPS,
+    SMS_FIXED_TRANSACTION_TYPES,
+)
 
 
 class SMSParseResult:
@@ -56,64 +61,69 @@ def clean_amount(amount_str: str) -> Decimal:
     return Decimal(cleaned)
 
 
+def parse_transaction_type(value: str) -> str:
+    """Map a debited/credited capture to a transaction type."""
+    return "DEBIT" if "debited" in value.lower() else "CREDIT"
+
+
+# Conversion applied to captured text per result field (default: keep as is)
+FIELD_CONVERTERS = {
+    "amount": clean_amount,
+    "available_balance": clean_amount,
+    "transaction_type": parse_transaction_type,
+}
+
+
+class CompiledSMSPattern:
+    """A bank SMS pattern compiled once, with its anchor and field mapping."""
+    
+    def __init__(self, bank: str, pattern: str, anchor: str, groups: Dict[str, int], fixed_type: Optional[str] = None):
+        self.bank = bank
+        self.regex = re.compile(pattern, re.IGNORECASE)
+        self.anchor = anchor.casefold()
+        self.groups = groups
+        self.fixed_type = fixed_type
+    
+    def apply(self, result: SMSParseResult, match: re.Match) -> None:
+        """Fill a parse result from a match of this pattern."""
+        result.bank = self.bank
+        result.success = True
+        
+        for field, group in self.groups.items():
+            value = match.group(group)
+            if value is not None:
+                converter = FIELD_CONVERTERS.get(field)
+                setattr(result, field, converter(value) if converter else value)
+        
+        if self.fixed_type:
+            result.transaction_type = self.fixed_type
+
+
+# Compiled patterns in priority order; the first matching pattern wins
+COMPILED_SMS_PATTERNS = [
+    CompiledSMSPattern(
+        bank,
+        pattern,
+        SMS_ANCHORS[bank],
+        SMS_FIELD_GROUPS[bank],
+        SMS_FIXED_TRANSACTION_TYPES.get(bank)
+    )
+    for bank, pattern in SMS_PATTERNS.items()
+]
+
+
 def parse_sms(sms_text: str) -> SMSParseResult:
     """Parse SMS text and extract transaction details."""
     result = SMSParseResult(raw_sms=sms_text)
+    folded = sms_text.casefold()
     
-    # Try each bank pattern
-    for bank, pattern in SMS_PATTERNS.items():
-        match = re.search(pattern, sms_text, re.IGNORECASE)
+    # Only run the regex of banks whose anchor text appears in the message
+    for compiled in COMPILED_SMS_PATTERNS:
+        if compiled.anchor not in folded:
+            continue
+        match = compiled.regex.search(sms_text)
         if match:
-            result.bank = bank
-            result.success = True
-            
-            if bank == "HDFC":
-                result.amount = clean_amount(match.group(1))
-                result.transaction_type = "DEBIT" if "debited" in match.group(2).lower() else "CREDIT"
-                result.account_last4 = match.group(3)
-                result.date = match.group(4)
-                result.merchant = match.group(5) if match.group(5) is not None else None
-                result.reference_number = match.group(6) if match.group(6) is not None else None
-                result.available_balance = clean_amount(match.group(7)) if match.group(7) is not None else None
-            
-            elif bank == "SBI":
-                result.account_last4 = match.group(1)
-                result.transaction_type = "DEBIT" if "debited" in match.group(2).lower() else "CREDIT"
-                result.amount = clean_amount(match.group(3))
-                result.date = match.group(4)
-                result.reference_number = match.group(5) if match.group(5) is not None else None
-            
-            elif bank == "ICICI":
-                result.account_last4 = match.group(1)
-                result.transaction_type = "DEBIT" if "debited" in match.group(2).lower() else "CREDIT"
-                result.amount = clean_amount(match.group(3))
-                result.date = match.group(4)
-                result.merchant = match.group(5) if match.group(5) is not None else None
-                result.reference_number = match.group(6) if match.group(6) is not None else None
-            
-            elif bank == "AXIS":
-                result.amount = clean_amount(match.group(1))
-                result.account_last4 = match.group(2)
-                result.merchant = match.group(3) if match.group(3) is not None else None
-                result.date = match.group(4)
-                result.reference_number = match.group(5)
-                result.transaction_type = "DEBIT"  # Axis pattern is for sent money
-            
-            elif bank == "KOTAK":
-                result.amount = clean_amount(match.group(1))
-                result.transaction_type = "DEBIT" if "debited" in match.group(2).lower() else "CREDIT"
-                result.account_last4 = match.group(3)
-                result.date = match.group(4)
-                result.merchant = match.group(5) if match.group(5) is not None else None
-                result.available_balance = clean_amount(match.group(6)) if match.group(6) is not None else None
-            
-            elif bank == "CREDIT_CARD":
-                result.account_last4 = match.group(1)
-                result.amount = clean_amount(match.group(2))
-                result.merchant = match.group(3)
-                result.date = match.group(4)
-                result.transaction_type = "DEBIT"  # Credit card usage is debit
-            
+            compiled.apply(result, match)
             break
     
     return result
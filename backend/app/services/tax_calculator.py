@@ -1,31 +1,35 @@
 """Tax calculator service for Indian tax calculations."""
-from decimal import Decimal
-from typing import List, Tuple
+from decimal import Decimal, ROUND_FLOOR
+from math import gcd
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 from sqlalchemy.orm import Session
 from app.models.user import User
 from app.models.investment import Investment
 from app.models.transaction import Transaction, TransactionType
-from app.utils.constants import (
-    TAX_80C_LIMIT,
-    TAX_80CCD_1B_LIMIT,
-    TAX_80D_INDIVIDUAL_LIMIT,
-    TAX_80D_SENIOR_CITIZEN_LIMIT,
-    NEW_TAX_REGIME_SLABS,
-    NEW_REGIME_STANDARD_DEDUCTION,
-    NEW_REGIME_REBATE_LIMIT,
-    OLD_TAX_REGIME_SLABS,
-    OLD_REGIME_REBATE_LIMIT,
-)
+from app.services.deduction_service import get_deduction_totals
+from app.services.tax_rules import TaxRules, get_tax_rules, to_basis_points, to_paisa
+from app.utils.constants import DEFAULT_FINANCIAL_YEAR
 from app.schemas.tax import (
     Section80CResponse,
     Section80DResponse,
-    TaxSlabBreakdown,
     TaxCalculationResponse,
     TaxComparisonResponse,
+    TaxSummaryResponse,
+    TaxBatchRegimeResult,
+    TaxBatchResponse,
+    TaxSectionAllocation,
+    TaxOptimizationResponse,
 )
 
 
-def calculate_80c(db: Session, user_id: str, financial_year: str, tax_bracket: Decimal = Decimal("0.30")) -> Section80CResponse:
+def calculate_80c(
+    db: Session,
+    user_id: str,
+    financial_year: str,
+    tax_bracket: Decimal = Decimal("0.30"),
+    totals: Optional[Dict[str, Decimal]] = None
+) -> Section80CResponse:
     """Calculate Section 80C utilization and savings.
     
     Args:
@@ -33,18 +37,16 @@ def calculate_80c(db: Session, user_id: str, financial_year: str, tax_bracket: D
         user_id: User ID
         financial_year: Financial year (e.g., "2025-26")
         tax_bracket: User's marginal tax rate (default: 30%)
+        totals: Deduction totals already fetched with get_deduction_totals
     """
-    # Query investments marked as 80C
-    investments = db.query(Investment).filter(
-        Investment.user_id == user_id,
-        Investment.tax_section == "80C",
-        Investment.is_active == True
-    ).all()
-    
-    total_invested = sum(inv.amount_invested for inv in investments)
-    utilized = min(total_invested, TAX_80C_LIMIT)
-    remaining = TAX_80C_LIMIT - utilized
-    percentage_used = float((utilized / TAX_80C_LIMIT) * 100)
+    limit = get_tax_rules(financial_year).deduction_limits["80C"]
+    if totals is None:
+        totals = get_deduction_totals(db, user_id, financial_year)
+    
+    total_invested = totals.get("80C", Decimal("0"))
+    utilized = min(total_invested, limit)
+    remaining = limit - utilized
+    percentage_used = float((utilized / limit) * 100)
     
     # Calculate tax saved based on provided tax bracket
     tax_saved = utilized * tax_bracket
@@ -55,11 +57,18 @@ def calculate_80c(db: Session, user_id: str, financial_year: str, tax_bracket: D
         remaining=remaining,
         percentage_used=percentage_used,
         tax_saved=tax_saved,
-        limit=TAX_80C_LIMIT
+        limit=limit
     )
 
 
-def calculate_80d(db: Session, user_id: str, financial_year: str, is_senior: bool = False, tax_bracket: Decimal = Decimal("0.30")) -> Section80DResponse:
+def calculate_80d(
+    db: Session,
+    user_id: str,
+    financial_year: str,
+    is_senior: bool = False,
+    tax_bracket: Decimal = Decimal("0.30"),
+    totals: Optional[Dict[str, Decimal]] = None
+) -> Section80DResponse:
     """Calculate Section 80D utilization and savings.
     
     Args:
@@ -68,19 +77,17 @@ def calculate_80d(db: Session, user_id: str, financial_year: str, is_senior: boo
         financial_year: Financial year (e.g., "2025-26")
         is_senior: Whether user is senior citizen
         tax_bracket: User's marginal tax rate (default: 30%)
+        totals: Deduction totals already fetched with get_deduction_totals
     """
-    # Query investments marked as 80D
-    investments = db.query(Investment).filter(
-        Investment.user_id == user_id,
-        Investment.tax_section == "80D",
-        Investment.is_active == True
-    ).all()
+    limits = get_tax_rules(financial_year).deduction_limits
+    if totals is None:
+        totals = get_deduction_totals(db, user_id, financial_year)
     
-    individual_limit = TAX_80D_SENIOR_CITIZEN_LIMIT if is_senior else TAX_80D_INDIVIDUAL_LIMIT
-    parents_limit = TAX_80D_SENIOR_CITIZEN_LIMIT  # Assuming parents are senior
+    individual_limit = limits["80D_SENIOR"] if is_senior else limits["80D"]
+    parents_limit = limits["80D_SENIOR"]  # Assuming parents are senior
     
     # For simplicity, split investments equally between individual and parents
-    total_invested = sum(inv.amount_invested for inv in investments)
+    total_invested = totals.get("80D", Decimal("0"))
     individual_invested = total_invested / 2
     parents_invested = total_invested / 2
     
@@ -105,48 +112,43 @@ def calculate_80d(db: Session, user_id: str, financial_year: str, is_senior: boo
     )
 
 
-def calculate_tax_new_regime(gross_income: Decimal, standard_deduction: Decimal) -> TaxCalculationResponse:
-    """Calculate tax under new regime."""
-    taxable_income = gross_income - standard_deduction
-    
-    slabs: List[TaxSlabBreakdown] = []
-    tax_before_rebate = Decimal("0")
-    previous_limit = Decimal("0")
-    
-    for limit, rate in NEW_TAX_REGIME_SLABS:
-        if taxable_income <= previous_limit:
-            break
-        
-        slab_end = Decimal(str(limit)) if limit != float("inf") else None
-        taxable_in_slab = min(taxable_income, Decimal(str(limit)) if limit != float("inf") else taxable_income) - previous_limit
-        
-        if taxable_in_slab > 0:
-            tax_amount = taxable_in_slab * rate
-            tax_before_rebate += tax_amount
-            
-            slabs.append(TaxSlabBreakdown(
-                slab_start=previous_limit,
-                slab_end=slab_end,
-                rate=rate,
-                taxable_in_slab=taxable_in_slab,
-                tax_amount=tax_amount
-            ))
-        
-        previous_limit = Decimal(str(limit)) if limit != float("inf") else previous_limit
+def units_to_paisa(units: np.ndarray, multiplier_bp: int = 10000) -> np.ndarray:
+    """Scale non-negative tax amounts and round them to whole paisa, half up.
+    
+    Args:
+        units: Amounts in ten-thousandths of a paisa
+        multiplier_bp: Share of the amounts to keep, in basis points (10400 for +4%)
+    """
+    divisor = gcd(multiplier_bp, 10000 ** 2)
+    numerator, denominator = multiplier_bp // divisor, 10000 ** 2 // divisor
+    return (units * (2 * numerator) + denominator) // (2 * denominator)
+
+
+def calculate_tax(
+    rules: TaxRules,
+    gross_income: Decimal,
+    standard_deduction: Decimal,
+    total_deductions: Decimal,
+    regime: str
+) -> TaxCalculationResponse:
+    """Calculate tax for one income under a regime ("NEW" or "OLD") of a year's rules."""
+    table = rules.new_regime if regime == "NEW" else rules.old_regime
+    taxable_income = gross_income - total_deductions
+    slabs, tax_before_rebate = table.breakdown(taxable_income)
     
     # Apply rebate under 87A
     rebate_87a = Decimal("0")
-    if taxable_income <= NEW_REGIME_REBATE_LIMIT:
+    if taxable_income <= table.rebate_limit:
         rebate_87a = tax_before_rebate
     
     total_tax = tax_before_rebate - rebate_87a
-    cess = total_tax * Decimal("0.04")  # 4% cess
+    cess = total_tax * rules.cess_rate
     final_tax = total_tax + cess
     
     return TaxCalculationResponse(
         gross_income=gross_income,
         standard_deduction=standard_deduction,
-        total_deductions=standard_deduction,
+        total_deductions=total_deductions,
         taxable_income=taxable_income,
         tax_before_rebate=tax_before_rebate,
         rebate_87a=rebate_87a,
@@ -154,72 +156,125 @@ def calculate_tax_new_regime(gross_income: Decimal, standard_deduction: Decimal)
         cess=cess,
         final_tax=final_tax,
         slabs=slabs,
-        regime="NEW"
+        regime=regime
     )
 
 
-def calculate_tax_old_regime(gross_income: Decimal, deductions: Decimal) -> TaxCalculationResponse:
+def calculate_tax_new_regime(
+    gross_income: Decimal,
+    standard_deduction: Decimal,
+    financial_year: str = DEFAULT_FINANCIAL_YEAR
+) -> TaxCalculationResponse:
+    """Calculate tax under new regime."""
+    return calculate_tax(get_tax_rules(financial_year), gross_income, standard_deduction, standard_deduction, "NEW")
+
+
+def calculate_tax_old_regime(
+    gross_income: Decimal,
+    deductions: Decimal,
+    financial_year: str = DEFAULT_FINANCIAL_YEAR
+) -> TaxCalculationResponse:
     """Calculate tax under old regime."""
-    taxable_income = gross_income - deductions
-    
-    slabs: List[TaxSlabBreakdown] = []
-    tax_before_rebate = Decimal("0")
-    previous_limit = Decimal("0")
-    
-    for limit, rate in OLD_TAX_REGIME_SLABS:
-        if taxable_income <= previous_limit:
-            break
-        
-        slab_end = Decimal(str(limit)) if limit != float("inf") else None
-        taxable_in_slab = min(taxable_income, Decimal(str(limit)) if limit != float("inf") else taxable_income) - previous_limit
-        
-        if taxable_in_slab > 0:
-            tax_amount = taxable_in_slab * rate
-            tax_before_rebate += tax_amount
-            
-            slabs.append(TaxSlabBreakdown(
-                slab_start=previous_limit,
-                slab_end=slab_end,
-                rate=rate,
-                taxable_in_slab=taxable_in_slab,
-                tax_amount=tax_amount
-            ))
-        
-        previous_limit = Decimal(str(limit)) if limit != float("inf") else previous_limit
+    return calculate_tax(get_tax_rules(financial_year), gross_income, Decimal("0"), deductions, "OLD")
+
+
+def calculate_regime_batch(
+    rules: TaxRules,
+    regime: str,
+    gross_paisa: np.ndarray,
+    deductions: Decimal
+) -> Dict[str, np.ndarray]:
+    """Calculate tax on an array of incomes under one regime.
     
-    # Apply rebate under 87A
-    rebate_87a = Decimal("0")
-    if taxable_income <= OLD_REGIME_REBATE_LIMIT:
-        rebate_87a = tax_before_rebate
+    Amounts are integers throughout, so every result is the exact tax
+    rounded half up to the paisa.
     
+    Args:
+        rules: Tax rules of the financial year
+        regime: "NEW" or "OLD"
+        gross_paisa: Gross incomes in paisa
+        deductions: Deductions from every income
+    
+    Returns:
+        Dictionary of paisa arrays: taxable_income, tax_before_rebate,
+        rebate_87a, total_tax, cess and final_tax
+    """
+    table = rules.new_regime if regime == "NEW" else rules.old_regime
+    taxable_paisa = gross_paisa - to_paisa(deductions)
+    tax_before_rebate = table.tax_units(taxable_paisa)
+    rebate_87a = np.where(taxable_paisa <= table.rebate_limit_paisa, tax_before_rebate, 0)
     total_tax = tax_before_rebate - rebate_87a
-    cess = total_tax * Decimal("0.04")  # 4% cess
-    final_tax = total_tax + cess
+    cess_bp = to_basis_points(rules.cess_rate)
     
-    return TaxCalculationResponse(
-        gross_income=gross_income,
-        standard_deduction=Decimal("0"),
-        total_deductions=deductions,
-        taxable_income=taxable_income,
-        tax_before_rebate=tax_before_rebate,
-        rebate_87a=rebate_87a,
-        total_tax=total_tax,
-        cess=cess,
-        final_tax=final_tax,
-        slabs=slabs,
-        regime="OLD"
+    return {
+        "taxable_income": taxable_paisa,
+        "tax_before_rebate": units_to_paisa(tax_before_rebate),
+        "rebate_87a": units_to_paisa(rebate_87a),
+        "total_tax": units_to_paisa(total_tax),
+        "cess": units_to_paisa(total_tax, cess_bp),
+        "final_tax": units_to_paisa(total_tax, 10000 + cess_bp),
+    }
+
+
+def calculate_tax_batch(
+    gross_incomes: List[Decimal],
+    old_regime_deductions: Decimal,
+    financial_year: str = DEFAULT_FINANCIAL_YEAR
+) -> TaxBatchResponse:
+    """Calculate tax on many incomes under both regimes in one pass.
+    
+    Args:
+        gross_incomes: Gross incomes, rounded to the paisa
+        old_regime_deductions: Deductions under the old regime
+        financial_year: Financial year of the tax rules (e.g., "2025-26")
+    
+    Returns:
+        Per-regime result columns, aligned with gross_incomes
+    """
+    rules = get_tax_rules(financial_year)
+    gross_paisa = np.array([to_paisa(income) for income in gross_incomes], dtype=np.int64)
+    new_regime = calculate_regime_batch(rules, "NEW", gross_paisa, rules.new_regime_standard_deduction)
+    old_regime = calculate_regime_batch(rules, "OLD", gross_paisa, old_regime_deductions)
+    
+    def rupees(paisa: np.ndarray) -> List[Decimal]:
+        return [Decimal(value).scaleb(-2) for value in paisa.tolist()]
+    
+    new_is_lower = new_regime["final_tax"] < old_regime["final_tax"]
+    return TaxBatchResponse(
+        gross_income=rupees(gross_paisa),
+        new_regime=TaxBatchRegimeResult(
+            total_deductions=rules.new_regime_standard_deduction,
+            **{field: rupees(values) for field, values in new_regime.items()}
+        ),
+        old_regime=TaxBatchRegimeResult(
+            total_deductions=old_regime_deductions,
+            **{field: rupees(values) for field, values in old_regime.items()}
+        ),
+        recommended_regime=np.where(new_is_lower, "NEW", "OLD").tolist(),
+        savings_with_recommended=rupees(np.abs(new_regime["final_tax"] - old_regime["final_tax"]))
     )
 
 
-def compare_tax_regimes(db: Session, user_id: str, gross_income: Decimal, financial_year: str) -> TaxComparisonResponse:
-    """Compare tax under new and old regimes."""
+def compare_tax_regimes(
+    db: Session,
+    user_id: str,
+    gross_income: Decimal,
+    financial_year: str,
+    totals: Optional[Dict[str, Decimal]] = None
+) -> TaxComparisonResponse:
+    """Compare tax under new and old regimes.
+    
+    Args:
+        totals: Deduction totals already fetched with get_deduction_totals
+    """
     # Calculate 80C for old regime
-    section_80c = calculate_80c(db, user_id, financial_year)
+    section_80c = calculate_80c(db, user_id, financial_year, totals=totals)
     total_deductions = section_80c.utilized
     
     # Calculate tax under both regimes
-    new_regime_tax = calculate_tax_new_regime(gross_income, NEW_REGIME_STANDARD_DEDUCTION)
-    old_regime_tax = calculate_tax_old_regime(gross_income, total_deductions)
+    rules = get_tax_rules(financial_year)
+    new_regime_tax = calculate_tax(rules, gross_income, rules.new_regime_standard_deduction, rules.new_regime_standard_deduction, "NEW")
+    old_regime_tax = calculate_tax(rules, gross_income, Decimal("0"), total_deductions, "OLD")
     
     # Determine recommended regime
     if new_regime_tax.final_tax < old_regime_tax.final_tax:
@@ -235,3 +290,115 @@ def compare_tax_regimes(db: Session, user_id: str, gross_income: Decimal, financ
         recommended_regime=recommended_regime,
         savings_with_recommended=savings
     )
+
+
+def calculate_tax_summary(
+    db: Session,
+    user_id: str,
+    gross_income: Decimal,
+    financial_year: str,
+    is_senior: bool = False
+) -> TaxSummaryResponse:
+    """Calculate 80C, 80D and both regimes from one deduction query."""
+    totals = get_deduction_totals(db, user_id, financial_year)
+    
+    return TaxSummaryResponse(
+        financial_year=financial_year,
+        section_80c=calculate_80c(db, user_id, financial_year, totals=totals),
+        section_80d=calculate_80d(db, user_id, financial_year, is_senior, totals=totals),
+        comparison=compare_tax_regimes(db, user_id, gross_income, financial_year, totals=totals)
+    )
+
+
+def optimize_deductions(
+    gross_income: Decimal,
+    claimed: Dict[str, Decimal],
+    is_senior: bool = False,
+    financial_year: str = DEFAULT_FINANCIAL_YEAR
+) -> TaxOptimizationResponse:
+    """Find the old regime break-even deduction and the best use of deduction limits.
+    
+    The old regime tax only falls as deductions grow, piecewise linearly
+    per slab, until taxable income reaches the 87A rebate limit where it
+    drops to zero. Both answers are therefore solved directly from the slab
+    table instead of by trying deduction amounts:
+    
+    - break-even: the smallest total deduction at which the old regime
+      costs no more than the new one
+    - allocation: the extra investment per section, within its remaining
+      limit, that minimizes tax; deductions past the rebate limit save
+      nothing, and none are suggested unless the old regime ends up
+      strictly cheaper
+    
+    Args:
+        gross_income: Gross annual income
+        claimed: Deduction totals per section, from get_deduction_totals
+        is_senior: Whether user is senior citizen (raises the 80D limit)
+        financial_year: Financial year of the tax rules (e.g., "2025-26")
+    """
+    rules = get_tax_rules(financial_year)
+    rule_limits = rules.deduction_limits
+    limits = {
+        "80C": rule_limits["80C"],
+        "80CCD_1B": rule_limits["80CCD_1B"],
+        # Self and parents, with parents assumed senior as in calculate_80d
+        "80D": (rule_limits["80D_SENIOR"] if is_senior else rule_limits["80D"]) + rule_limits["80D_SENIOR"],
+    }
+    utilized = {section: min(claimed.get(section, Decimal("0")), limit) for section, limit in limits.items()}
+    current_deductions = sum(utilized.values())
+    max_deductions = sum(limits.values())
+    
+    standard_deduction = rules.new_regime_standard_deduction
+    new_regime_tax = calculate_tax(rules, gross_income, standard_deduction, standard_deduction, "NEW").final_tax
+    old_regime_tax = calculate_tax(rules, gross_income, Decimal("0"), current_deductions, "OLD").final_tax
+    table = rules.old_regime
+    
+    # Largest taxable income the old regime taxes no more than the new one
+    max_taxable = table.max_income_for_tax(new_regime_tax / (1 + rules.cess_rate))
+    if max_taxable is None:
+        break_even = Decimal("0")
+    else:
+        max_taxable = max(max_taxable, table.rebate_limit).quantize(Decimal("0.01"), rounding=ROUND_FLOOR)
+        break_even = max(gross_income - max_taxable, Decimal("0"))
+    
+    # Deductions beyond the rebate limit do not lower the tax any further
+    useful_deductions = max(gross_income - table.rebate_limit, Decimal("0"))
+    optimized_deductions = max(current_deductions, min(max_deductions, useful_deductions))
+    optimized_old_regime_tax = calculate_tax(rules, gross_income, Decimal("0"), optimized_deductions, "OLD").final_tax
+    
+    # Suggest investing more only if it makes the old regime strictly cheaper
+    if old_regime_tax <= new_regime_tax or optimized_old_regime_tax < new_regime_tax:
+        recommended_regime = "OLD"
+        optimized_tax = optimized_old_regime_tax
+    else:
+        recommended_regime = "NEW"
+        optimized_tax = new_regime_tax
+        optimized_deductions = current_deductions
+    
+    allocations = []
+    remaining = optimized_deductions - current_deductions
+    for section, limit in limits.items():
+        additional = min(limit - utilized[section], remaining)
+        remaining -= additional
+        allocations.append(TaxSectionAllocation(
+            section=section,
+            limit=limit,
+            claimed=claimed.get(section, Decimal("0")),
+            additional=additional
+        ))
+    
+    return TaxOptimizationResponse(
+        gross_income=gross_income,
+        new_regime_tax=new_regime_tax,
+        old_regime_tax=old_regime_tax,
+        current_deductions=current_deductions,
+        max_deductions=max_deductions,
+        marginal_rate=table.marginal_rate(gross_income - current_deductions),
+        break_even_deduction=break_even,
+        break_even_achievable=break_even <= max_deductions,
+        allocations=allocations,
+        optimized_deductions=optimized_deductions,
+        recommended_regime=recommended_regime,
+        optimized_tax=optimized_tax,
+        savings=min(new_regime_tax, old_regime_tax) - optimized_tax
+    )
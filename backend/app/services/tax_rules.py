@@ -0,0 +1,217 @@
+"""Versioned tax rules per financial year, loaded from data files.
+
+Each financial year has one JSON file in app/data/tax_rules (e.g.
+2025-26.json) with its slabs, rebate limits, cess and deduction limits.
+Supporting a new financial year is a matter of adding its file.
+"""
+import json
+import os
+import threading
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_HALF_UP
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+import numpy as np
+from app.schemas.tax import TaxSlabBreakdown
+
+TAX_RULES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "tax_rules")
+
+
+class UnknownFinancialYearError(ValueError):
+    """Raised for a financial year without tax rules."""
+
+
+class SlabTable:
+    """Tax slabs of one regime, precomputed for repeated evaluation.
+    
+    Slab bounds are compiled once, along with the cumulative tax due at
+    each slab's lower bound, so the tax on any income
+    is one lookup plus one multiplication. For arrays of incomes the table
+    is also kept as integers (bounds in paisa, rates in basis points),
+    exact to a fraction of a paisa. Tables are read-only once built.
+    
+    Args:
+        slabs: (upper limit, rate) per slab in order; the last limit is None
+        rebate_limit: Taxable income up to which the 87A rebate applies
+    """
+    
+    def __init__(self, slabs: List[Tuple[Optional[Decimal], Decimal]], rebate_limit: Decimal):
+        if not slabs or slabs[-1][0] is not None:
+            raise ValueError("The last tax slab must have no upper limit")
+        
+        compiled = []
+        base_taxes = []
+        lower = Decimal("0")
+        base_tax = Decimal("0")
+        for upper, rate in slabs:
+            compiled.append((lower, upper, rate))
+            base_taxes.append(base_tax)
+            if upper is not None:
+                base_tax += (upper - lower) * rate
+            lower = upper
+        
+        self.rebate_limit = rebate_limit
+        self.slabs: Tuple[Tuple[Decimal, Optional[Decimal], Decimal], ...] = tuple(compiled)
+        self.base_tax: Tuple[Decimal, ...] = tuple(base_taxes)
+        
+        self.lower_paisa = np.array([to_paisa(lower) for lower, _, _ in self.slabs], dtype=np.int64)
+        self.rate_bp = np.array([to_basis_points(rate) for _, _, rate in self.slabs], dtype=np.int64)
+        self.base_tax_units = np.concatenate([[0], np.cumsum(np.diff(self.lower_paisa) * self.rate_bp[:-1])])
+        self.rebate_limit_paisa = to_paisa(rebate_limit)
+        for array in (self.lower_paisa, self.rate_bp, self.base_tax_units):
+            array.setflags(write=False)
+    
+    def breakdown(self, taxable_income: Decimal) -> Tuple[List[TaxSlabBreakdown], Decimal]:
+        """Split a taxable income across slabs.
+        
+        Returns:
+            Tuple of slab breakdown and tax before rebate
+        """
+        slabs: List[TaxSlabBreakdown] = []
+        tax_before_rebate = Decimal("0")
+        
+        for lower, upper, rate in self.slabs:
+            if taxable_income <= lower:
+                break
+            
+            taxable_in_slab = (taxable_income if upper is None else min(taxable_income, upper)) - lower
+            tax_amount = taxable_in_slab * rate
+            tax_before_rebate += tax_amount
+            
+            slabs.append(TaxSlabBreakdown(
+                slab_start=lower,
+                slab_end=upper,
+                rate=rate,
+                taxable_in_slab=taxable_in_slab,
+                tax_amount=tax_amount
+            ))
+        
+        return slabs, tax_before_rebate
+    
+    def max_income_for_tax(self, tax: Decimal) -> Optional[Decimal]:
+        """Get the largest taxable income whose tax before rebate is at most tax.
+        
+        Returns:
+            Taxable income, or None if every income is taxed at most tax
+        """
+        for (lower, upper, rate), base_tax in zip(self.slabs, self.base_tax):
+            if upper is None or base_tax + (upper - lower) * rate > tax:
+                return lower + (tax - base_tax) / rate if rate else None
+        return None
+    
+    def marginal_rate(self, taxable_income: Decimal) -> Decimal:
+        """Get the rate of the slab a taxable income ends in."""
+        for lower, upper, rate in self.slabs:
+            if upper is None or taxable_income <= upper:
+                return rate if taxable_income > lower else Decimal("0")
+        return Decimal("0")
+    
+    def tax_units(self, taxable_paisa: np.ndarray) -> np.ndarray:
+        """Tax before rebate on taxable incomes in paisa, in ten-thousandths of a paisa."""
+        taxable_paisa = np.maximum(taxable_paisa, 0)
+        slab = np.searchsorted(self.lower_paisa, taxable_paisa, side="right") - 1
+        return self.base_tax_units[slab] + (taxable_paisa - self.lower_paisa[slab]) * self.rate_bp[slab]
+
+
+def to_paisa(amount: Decimal) -> int:
+    """Convert rupees to whole paisa, rounding half up."""
+    return int((amount * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def to_basis_points(rate: Decimal) -> int:
+    """Convert a rate to basis points; rates finer than a basis point are rejected."""
+    basis_points = rate * 10000
+    if basis_points != basis_points.to_integral_value():
+        raise ValueError(f"Tax rate {rate} is finer than one basis point")
+    return int(basis_points)
+
+
+@dataclass(frozen=True)
+class TaxRules:
+    """Compiled tax rules of one financial year."""
+    financial_year: str
+    new_regime: SlabTable
+    old_regime: SlabTable
+    new_regime_standard_deduction: Decimal
+    cess_rate: Decimal
+    deduction_limits: Mapping[str, Decimal]  # "80C", "80CCD_1B", "80D", "80D_SENIOR", "80D_PREVENTIVE"
+
+
+def compile_tax_rules(data: Dict) -> TaxRules:
+    """Compile the parsed contents of a tax rules file.
+    
+    Args:
+        data: Rules with numbers as Decimal
+    """
+    def slab_table(regime: Dict) -> SlabTable:
+        return SlabTable([(slab["up_to"], slab["rate"]) for slab in regime["slabs"]], regime["rebate_limit"])
+    
+    return TaxRules(
+        financial_year=data["financial_year"],
+        new_regime=slab_table(data["new_regime"]),
+        old_regime=slab_table(data["old_regime"]),
+        new_regime_standard_deduction=data["new_regime"]["standard_deduction"],
+        cess_rate=data["cess_rate"],
+        deduction_limits=MappingProxyType(dict(data["deduction_limits"]))
+    )
+
+
+def load_tax_rules(path: str) -> TaxRules:
+    """Load and compile one tax rules file."""
+    with open(path) as f:
+        # Parse every number as Decimal so rates and limits stay exact
+        data = json.load(f, parse_float=Decimal, parse_int=Decimal)
+    
+    financial_year = os.path.splitext(os.path.basename(path))[0]
+    if data.get("financial_year") != financial_year:
+        raise ValueError(f"{path} holds rules for {data.get('financial_year')}, not {financial_year}")
+    return compile_tax_rules(data)
+
+
+class TaxRulesRegistry:
+    """Tax rules of every financial year in a directory, compiled on first use."""
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._rules: Optional[Dict[str, TaxRules]] = None
+    
+    def _load(self) -> Dict[str, TaxRules]:
+        with self._lock:
+            if self._rules is None:
+                self._rules = {
+                    rules.financial_year: rules
+                    for rules in (
+                        load_tax_rules(os.path.join(self.directory, name))
+                        for name in sorted(os.listdir(self.directory))
+                        if name.endswith(".json")
+                    )
+                }
+            return self._rules
+    
+    def get(self, financial_year: str) -> TaxRules:
+        """Get the rules of a financial year (e.g., "2025-26")."""
+        rules = self._rules if self._rules is not None else self._load()
+        try:
+            return rules[financial_year]
+        except KeyError:
+            raise UnknownFinancialYearError(f"No tax rules for financial year {financial_year}") from None
+    
+    def financial_years(self) -> List[str]:
+        """Get the financial years with rules, oldest first."""
+        rules = self._rules if self._rules is not None else self._load()
+        return sorted(rules)
+    
+    def reload(self) -> None:
+        """Drop compiled rules so the files are read again on next use."""
+        with self._lock:
+            self._rules = None
+
+
+# Global registry instance
+tax_rules_registry = TaxRulesRegistry(TAX_RULES_DIR)
+
+
+def get_tax_rules(financial_year: str) -> TaxRules:
+    """Get the compiled tax rules of a financial year."""
+    return tax_rules_registry.get(financial_year)
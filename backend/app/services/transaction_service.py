@@ -0,0 +1,131 @@
+"""Transaction service for batched transaction writes."""
+import uuid
+from datetime import date, datetime
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import Select, insert, select, tuple_
+from app.database import UPSERT_INSERTS
+from app.models.transaction import Transaction, TransactionType
+from app.schemas.transaction import TransactionCreate
+from app.services.rollup_service import add_many_to_rollup
+from app.utils.pagination import encode_cursor, decode_cursor
+
+
+def transaction_page_query(
+    user_id,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    transaction_type: Optional[TransactionType] = None,
+    category: Optional[str] = None,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None
+) -> Select:
+    """Build the query for one page of a user's transactions, newest first.
+    
+    With a cursor, the page continues after the last row by
+    (transaction_date, id) and skip is ignored.
+    
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    query = select(Transaction).where(Transaction.user_id == user_id)
+    
+    if transaction_type:
+        query = query.where(Transaction.type == transaction_type)
+    if category:
+        query = query.where(Transaction.category == category)
+    if start_date:
+        query = query.where(Transaction.transaction_date >= start_date)
+    if end_date:
+        query = query.where(Transaction.transaction_date <= end_date)
+    
+    if cursor:
+        last_date, last_id = decode_cursor(cursor, 2)
+        last_key = (date.fromisoformat(last_date), uuid.UUID(last_id))
+        query = query.where(tuple_(Transaction.transaction_date, Transaction.id) < last_key)
+        skip = 0
+    
+    return query.order_by(
+        Transaction.transaction_date.desc(),
+        Transaction.id.desc()
+    ).offset(skip).limit(limit)
+
+
+def next_page_cursor(transactions: List[Transaction], limit: int) -> Optional[str]:
+    """Get the cursor of the page after a full page of transactions, or None."""
+    if transactions and len(transactions) == limit:
+        last = transactions[-1]
+        return encode_cursor(last.transaction_date.isoformat(), last.id)
+    return None
+
+
+def bulk_insert_transactions(db: Session, user_id, items: List[TransactionCreate]) -> List[uuid.UUID]:
+    """Insert many transactions for a user with batched INSERTs.
+    
+    Ids and timestamps are assigned up front so no RETURNING round trip is
+    needed, and the monthly rollups are adjusted once per distinct key. The
+    caller owns the surrounding database transaction and must commit.
+    
+    Args:
+        db: Database session
+        user_id: Owner of the transactions
+        items: Validated transaction payloads
+    
+    Returns:
+        Ids of the inserted transactions, in input order
+    """
+    if not items:
+        return []
+    
+    now = datetime.utcnow()
+    rows = []
+    for item in items:
+        row = item.dict()
+        row.update(id=uuid.uuid4(), user_id=user_id, created_at=now, updated_at=now)
+        rows.append(row)
+    
+    # A list of parameter sets runs as executemany, which SQLAlchemy batches
+    # into multi-row INSERT statements on PostgreSQL
+    db.execute(insert(Transaction), rows)
+    add_many_to_rollup(db, rows)
+    
+    return [row["id"] for row in rows]
+
+
+def insert_new_sms_transactions(db: Session, user_id, rows: List[Dict]) -> List[uuid.UUID]:
+    """Insert SMS transaction rows for a user, skipping known fingerprints.
+    
+    Rows whose sms_fingerprint already exists for the user (or repeats
+    earlier in the batch) are dropped by ON CONFLICT DO NOTHING against the
+    fingerprint unique index, so concurrent re-imports stay idempotent. Only
+    rows actually inserted are added to the monthly rollups. The caller
+    owns the surrounding database transaction and must commit.
+    
+    Args:
+        db: Database session
+        user_id: Owner of the transactions
+        rows: Transaction column values, each with an sms_fingerprint
+    
+    Returns:
+        Ids of the inserted transactions
+    """
+    if not rows:
+        return []
+    
+    now = datetime.utcnow()
+    rows = [
+        dict(row, id=uuid.uuid4(), user_id=user_id, created_at=now, updated_at=now)
+        for row in rows
+    ]
+    
+    dialect_insert = UPSERT_INSERTS[db.get_bind().dialect.name]
+    stmt = dialect_insert(Transaction).on_conflict_do_nothing(
+        index_elements=[Transaction.user_id, Transaction.sms_fingerprint]
+    ).returning(Transaction.id)
+    inserted = set(db.execute(stmt, rows).scalars())
+    
+    new_rows = [row for row in rows if row["id"] in inserted]
+    add_many_to_rollup(db, new_rows)
+    
+    return [row["id"] for row in new_rows]
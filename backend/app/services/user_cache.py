@@ -0,0 +1,61 @@
+"""Per-process cache of authenticated user principals."""
+import time
+from typing import Callable, Optional
+from sqlalchemy import event
+from app.config import get_settings
+from app.models.user import User
+from app.schemas.user import UserResponse
+from app.services.market_cache import CacheEntry, InMemoryCacheBackend
+
+settings = get_settings()
+
+
+class UserPrincipalCache:
+    """TTL cache of user principals keyed by token subject (the user id).
+    
+    Principals are read-only snapshots of the user row, so they can be
+    shared across requests and threads. Changes to a user made through the
+    ORM in this process drop its entry straight away; changes made by other
+    processes are picked up once the entry expires.
+    """
+    
+    def __init__(self, ttl_seconds: float, max_entries: int, clock: Callable[[], float] = time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.backend = InMemoryCacheBackend(max_entries)
+    
+    def get(self, subject: str) -> Optional[UserResponse]:
+        """Get the cached principal of a token subject, if still fresh."""
+        if self.ttl_seconds <= 0:
+            return None
+        entry = self.backend.get(subject)
+        if entry is None:
+            return None
+        if self.clock() - entry.stored_at >= self.ttl_seconds:
+            self.backend.delete(subject)
+            return None
+        return entry.value
+    
+    def set(self, subject: str, principal: UserResponse) -> None:
+        """Cache the principal of a token subject."""
+        if self.ttl_seconds > 0:
+            self.backend.set(subject, CacheEntry(principal, self.clock()), self.ttl_seconds)
+    
+    def invalidate(self, subject: str) -> None:
+        """Drop the cached principal of a token subject."""
+        self.backend.delete(subject)
+    
+    def clear(self) -> None:
+        """Drop all cached principals."""
+        self.backend.clear()
+
+
+# Global cache instance
+user_cache = UserPrincipalCache(settings.AUTH_USER_CACHE_TTL_SECONDS, settings.AUTH_USER_CACHE_MAX_ENTRIES)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def invalidate_cached_user(mapper, connection, target: User) -> None:
+    """Drop a user's cached principal when the row is updated or deleted."""
+    user_cache.invalidate(str(target.id))
@@ -1,35 +1,25 @@
 """Constants for the application."""
 from decimal import Decimal
 
-# Tax limits for Financial Year 2025-26
-TAX_80C_LIMIT = Decimal("150000")
-TAX_80CCD_1B_LIMIT = Decimal("50000")
-TAX_80D_INDIVIDUAL_LIMIT = Decimal("25000")
-TAX_80D_SENIOR_CITIZEN_LIMIT = Decimal("50000")
-TAX_80D_PREVENTIVE_LIMIT = Decimal("5000")
-
-# New Tax Regime Slabs (FY 2025-26)
-NEW_TAX_REGIME_SLABS = [
-    (Decimal("300000"), Decimal("0")),
-    (Decimal("700000"), Decimal("0.05")),
-    (Decimal("1000000"), Decimal("0.10")),
-    (Decimal("1200000"), Decimal("0.15")),
-    (Decimal("1500000"), Decimal("0.20")),
-    (float("inf"), Decimal("0.30")),
-]
-
-NEW_REGIME_STANDARD_DEDUCTION = Decimal("75000")
-NEW_REGIME_REBATE_LIMIT = Decimal("700000")
-
-# Old Tax Regime Slabs
-OLD_TAX_REGIME_SLABS = [
-    (Decimal("250000"), Decimal("0")),
-    (Decimal("500000"), Decimal("0.05")),
-    (Decimal("1000000"), Decimal("0.20")),
-    (float("inf"), Decimal("0.30")),
-]
-
-OLD_REGIME_REBATE_LIMIT = Decimal("500000")
+# Financial year used when a tax calculation does not name one. Slabs,
+# rebates and deduction limits per year live in app/data/tax_rules.
+DEFAULT_FINANCIAL_YEAR = "2025-26"
+
+# Maximum number of incomes accepted by the batch tax endpoint, and the
+# largest income it accepts (keeps its integer paisa arithmetic in range)
+TAX_BATCH_LIMIT = 10000
+TAX_BATCH_MAX_INCOME = Decimal("100000000000")
+
+# Maximum number of items accepted by bulk transaction endpoints
+BULK_TRANSACTION_LIMIT = 5000
+
+# Maximum number of messages accepted by the SMS import endpoint
+SMS_IMPORT_LIMIT = 20000
+
+# Largest NDJSON body accepted by the SMS stream endpoint, and the slice size
+# it is fed to the line decoder in
+SMS_STREAM_MAX_BYTES = 32 * 1024 * 1024
+SMS_STREAM_READ_SIZE = 64 * 1024
 
 # SMS Parser Regex Patterns for Indian Banks
 SMS_PATTERNS = {
@@ -41,6 +31,37 @@ SMS_PATTERNS = {
     "CREDIT_CARD": r"Credit Card XX(\d{4}).*?transaction of INR\s+([0-9,]+\.\d{2}).*?at\s+(.+?)\s+on\s+(\d{2}-\d{2}-\d{4})",
 }
 
+# Literal text each SMS pattern requires (compared case-insensitively). A
+# pattern is only run against messages containing its anchor, so these must
+# be substrings every match of the pattern is guaranteed to contain.
+SMS_ANCHORS = {
+    "HDFC": "avl bal rs.",
+    "SBI": "your a/c no.",
+    "ICICI": "icici bank acct xx",
+    "AXIS": "axis bank a/c no.",
+    "KOTAK": "amt of rs.",
+    "CREDIT_CARD": "credit card xx",
+}
+
+# Capture group number of each SMSParseResult field, per SMS pattern
+SMS_FIELD_GROUPS = {
+    "HDFC": {"amount": 1, "transaction_type": 2, "account_last4": 3, "date": 4, "merchant": 5, "reference_number": 6, "available_balance": 7},
+    "SBI": {"account_last4": 1, "transaction_type": 2, "amount": 3, "date": 4, "reference_number": 5},
+    "ICICI": {"account_last4": 1, "transaction_type": 2, "amount": 3, "date": 4, "merchant": 5, "reference_number": 6},
+    "AXIS": {"amount": 1, "account_last4": 2, "merchant": 3, "date": 4, "reference_number": 5},
+    "KOTAK": {"amount": 1, "transaction_type": 2, "account_last4": 3, "date": 4, "merchant": 5, "available_balance": 6},
+    "CREDIT_CARD": {"account_last4": 1, "amount": 2, "merchant": 3, "date": 4},
+}
+
+# Transaction type for patterns that only match one direction
+SMS_FIXED_TRANSACTION_TYPES = {
+    "AXIS": "DEBIT",  # Axis pattern is for sent money
+    "CREDIT_CARD": "DEBIT",  # Credit card usage is debit
+}
+
+# Date formats captured by the SMS patterns, tried in order
+SMS_DATE_FORMATS = ["%d-%m-%y", "%d-%m-%Y", "%d%b%y", "%d-%b-%y"]
+
 # Default categories
 INCOME_CATEGORIES = ["Salary", "Freelance", "Business", "Investment Returns", "Rental Income", "Dividends", "Interest", "Other"]
 EXPENSE_CATEGORIES = ["Rent", "Groceries", "Transportation", "Utilities", "Healthcare", "Entertainment", "Shopping", "Food", "Education", "Insurance", "Investment", "EMI", "Other"]
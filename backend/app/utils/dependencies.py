@@ -1,5 +1,6 @@
 """Dependency injection utilities."""
 from typing import Generator
+from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
@@ -7,33 +8,69 @@ from sqlalchemy.orm import Session
 from app.database import get_db
 from app.config import get_settings
 from app.models.user import User
+from app.schemas.user import UserResponse
+from app.services.user_cache import user_cache
 
 settings = get_settings()
 security = HTTPBearer()
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """Get current authenticated user from JWT token."""
-    credentials_exception = HTTPException(
+def credentials_exception() -> HTTPException:
+    """Build the 401 error for a missing, invalid or unknown token."""
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+async def get_token_subject(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
+    """Get the subject (user id) of a valid JWT access token.
     
+    Async only because it does no I/O: it then runs on the event loop
+    instead of taking a threadpool slot for every request.
+    """
     try:
         token = credentials.credentials
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
         user_id: str = payload.get("sub")
         if user_id is None:
-            raise credentials_exception
+            raise credentials_exception()
     except JWTError:
-        raise credentials_exception
+        raise credentials_exception()
+    
+    return user_id
+
+
+async def get_current_user_id(user_id: str = Depends(get_token_subject)) -> UUID:
+    """Get the current user's id from the JWT alone, without a database query.
+    
+    For routes that only scope queries by user. The signed token is trusted
+    until it expires; use get_current_user where the user row must exist.
+    """
+    try:
+        return UUID(user_id)
+    except ValueError:
+        raise credentials_exception()
+
+
+def get_current_user(
+    user_id: str = Depends(get_token_subject),
+    db: Session = Depends(get_db)
+) -> UserResponse:
+    """Get current authenticated user from JWT token.
+    
+    The user is looked up once per AUTH_USER_CACHE_TTL_SECONDS and served
+    from the per-process user cache in between.
+    """
+    principal = user_cache.get(user_id)
+    if principal is not None:
+        return principal
     
     user = db.query(User).filter(User.id == user_id).first()
     if user is None:
-        raise credentials_exception
+        raise credentials_exception()
     
-    return user
+    principal = UserResponse.model_validate(user)
+    user_cache.set(user_id, principal)
+    return principal
@@ -0,0 +1,41 @@
+"""Conditional GET utilities based on entity tags."""
+import hashlib
+from typing import Any
+from fastapi import Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+ETAG_HEADER = "ETag"
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check whether an If-None-Match header matches an entity tag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return etag.removeprefix("W/") in tags
+
+
+def etag_response(request: Request, content: Any) -> Response:
+    """Render content as JSON with an ETag, or 304 if the client has it already.
+    
+    The tag is a hash of the rendered body, so it changes exactly when the
+    payload does. Clients are asked to revalidate before reusing it.
+    
+    Args:
+        request: Incoming request, for its If-None-Match header
+        content: Response model or JSON-compatible data
+    """
+    response = JSONResponse(jsonable_encoder(content))
+    etag = f'"{hashlib.sha256(response.body).hexdigest()[:32]}"'
+    headers = {ETAG_HEADER: etag, "Cache-Control": "private, no-cache"}
+    
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    response.headers.update(headers)
+    return response
@@ -0,0 +1,125 @@
+"""In-process metric types and Prometheus text formatting."""
+import bisect
+import threading
+from typing import Dict, List, Optional, Sequence, Union
+
+# Upper bounds for latency histograms, in seconds
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Upper bounds for histograms of connection counts
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 30, 50, 100)
+
+
+class Histogram:
+    """Counts of observed values per bucket upper bound, with their sum.
+    
+    Buckets are reported cumulatively, each counting the observations less
+    than or equal to its bound, as in a Prometheus histogram.
+    """
+    
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+    
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+    
+    def snapshot(self) -> Dict:
+        """Get the cumulative bucket counts, total count and sum."""
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        
+        cumulative = {}
+        running = 0
+        for bound, count in zip(self.buckets, counts):
+            running += count
+            cumulative[str(bound)] = running
+        return {"buckets": cumulative, "count": running + counts[-1], "sum": total}
+
+
+# Upper bounds for response size histograms, in bytes
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+class Counter:
+    """A monotonically increasing count."""
+    
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+    
+    def inc(self, amount: float = 1) -> None:
+        """Add to the count."""
+        with self._lock:
+            self.value += amount
+
+
+class MetricFamily:
+    """A named metric with one series per label combination.
+    
+    Series are Histograms with the given buckets, or Counters without.
+    """
+    
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str], buckets: Optional[Sequence[float]] = None):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = buckets
+        self._children: Dict[tuple, Union[Counter, Histogram]] = {}
+        self._lock = threading.Lock()
+    
+    def labels(self, *values: str) -> Union[Counter, Histogram]:
+        """Get the series for a label combination, creating it on first use."""
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = Histogram(self.buckets) if self.buckets else Counter()
+                    self._children[values] = child
+        return child
+    
+    def render(self) -> List[str]:
+        """Format every series of the family in Prometheus text format."""
+        with self._lock:
+            children = list(self._children.items())
+        
+        kind = "histogram" if self.buckets else "counter"
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {kind}"]
+        for values, child in children:
+            labels = dict(zip(self.label_names, values))
+            if isinstance(child, Histogram):
+                lines.extend(histogram_lines(self.name, labels, child.snapshot()))
+            else:
+                lines.append(f"{self.name}{format_labels(labels)} {child.value}")
+        return lines
+
+
+def format_labels(labels: Dict[str, object]) -> str:
+    """Format labels as a Prometheus label set, escaping values."""
+    if not labels:
+        return ""
+    
+    def escape(value) -> str:
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    
+    return "{" + ",".join(f'{name}="{escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def histogram_lines(name: str, labels: Dict[str, object], snapshot: Dict) -> List[str]:
+    """Format a histogram snapshot as Prometheus bucket, sum and count samples."""
+    lines = [
+        f"{name}_bucket{format_labels({**labels, 'le': bound})} {count}"
+        for bound, count in snapshot["buckets"].items()
+    ]
+    lines.append(f"{name}_bucket{format_labels({**labels, 'le': '+Inf'})} {snapshot['count']}")
+    lines.append(f"{name}_sum{format_labels(labels)} {snapshot['sum']}")
+    lines.append(f"{name}_count{format_labels(labels)} {snapshot['count']}")
+    return lines
@@ -0,0 +1,32 @@
+"""Keyset pagination utilities."""
+import base64
+import json
+from typing import List
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(*values) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    payload = json.dumps([str(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[str]:
+    """Decode a cursor back into its sort key values.
+    
+    Raises:
+        ValueError: If the cursor is malformed, has the wrong number of values
+            or holds anything other than strings
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Malformed cursor") from e
+    
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Malformed cursor")
+    if not all(isinstance(value, str) for value in values):
+        raise ValueError("Malformed cursor")
+    return values
@@ -0,0 +1,300 @@
+"""Opt-in profiling of individual requests with their SQL timeline."""
+import asyncio
+import cProfile
+import functools
+import hmac
+import itertools
+import pstats
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Callable, List, Optional
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.config import get_settings
+from app.schemas.profiling import ProfileFunctionStat, ProfileSqlStatement, RequestProfile
+
+settings = get_settings()
+
+# Request header asking for a profile; its value must be the admin token
+PROFILE_HEADER = "X-Profile"
+
+# Response header carrying the id of the stored profile
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+# Response header set when a requested profile could not be taken
+PROFILE_SKIPPED_HEADER = "X-Profile-Skipped"
+
+# How long a requested profile waits for the profiler, and how often it checks
+PROFILE_LOCK_WAIT_SECONDS = 2.0
+PROFILE_LOCK_POLL_SECONDS = 0.01
+
+# Functions kept per profile, by cumulative time
+PROFILE_TOP_FUNCTIONS = 40
+
+# Longest SQL statement text kept on a timeline
+PROFILE_STATEMENT_CHARS = 500
+
+
+def is_admin_token(token: Optional[str]) -> bool:
+    """Check a token against ADMIN_TOKEN; always False when none is configured.
+    
+    Both sides are compared as UTF-8 bytes, since compare_digest rejects
+    non-ASCII strings and header values may contain any Latin-1 character.
+    """
+    if not settings.ADMIN_TOKEN or token is None:
+        return False
+    return hmac.compare_digest(token.encode(), settings.ADMIN_TOKEN.encode())
+
+
+class ProfileSession:
+    """Profiler and SQL timeline of one request being profiled."""
+    
+    def __init__(self):
+        self.profiler = cProfile.Profile()
+        self.start = time.perf_counter()
+        self.sql_timeline: List[ProfileSqlStatement] = []
+    
+    def offset_ms(self, instant: float) -> float:
+        """Get milliseconds from the start of the request to an instant."""
+        return (instant - self.start) * 1000
+    
+    def function_stats(self) -> List[ProfileFunctionStat]:
+        """Get the functions with the most cumulative time."""
+        self.profiler.create_stats()
+        if not self.profiler.stats:
+            return []
+        
+        stats = pstats.Stats(self.profiler).stats
+        top = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:PROFILE_TOP_FUNCTIONS]
+        return [
+            ProfileFunctionStat(
+                function=pstats.func_std_string(function),
+                calls=calls,
+                total_ms=round(total * 1000, 3),
+                cumulative_ms=round(cumulative * 1000, 3)
+            )
+            for function, (_, calls, total, cumulative, _) in top
+        ]
+
+
+# Profile of the request being handled, if it is profiled
+current_profile: ContextVar[Optional[ProfileSession]] = ContextVar("current_profile", default=None)
+
+# cProfile hooks one profiler per thread; this keeps to one profiled request at a time
+_profiler_lock = threading.Lock()
+
+# Header-requested profiles waiting for the lock; threshold profiling yields to them
+_header_waiters = 0
+
+
+async def acquire_profiler_for_header() -> bool:
+    """Wait up to PROFILE_LOCK_WAIT_SECONDS for the profiler lock.
+    
+    While this waits, threshold profiling does not start, so the lock goes
+    to the requested profile as soon as the current one finishes.
+    
+    Returns:
+        True if the lock was acquired and must be released by the caller
+    """
+    global _header_waiters
+    _header_waiters += 1
+    try:
+        deadline = time.monotonic() + PROFILE_LOCK_WAIT_SECONDS
+        while not _profiler_lock.acquire(blocking=False):
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(PROFILE_LOCK_POLL_SECONDS)
+        return True
+    finally:
+        _header_waiters -= 1
+
+
+def acquire_profiler_for_threshold() -> bool:
+    """Take the profiler lock if it is free and no requested profile is waiting."""
+    return not _header_waiters and _profiler_lock.acquire(blocking=False)
+
+
+def with_header(message: Message, name: str, value: str) -> Message:
+    """Add a header to an http.response.start message."""
+    headers = list(message.get("headers", []))
+    headers.append((name.lower().encode(), value.encode()))
+    return {**message, "headers": headers}
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_profiled_statement(conn, cursor, statement, parameters, context, executemany):
+    if current_profile.get() is not None:
+        conn.info.setdefault("profile_statement_starts", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_profiled_statement(conn, cursor, statement, parameters, context, executemany):
+    session = current_profile.get()
+    starts = conn.info.get("profile_statement_starts")
+    if session is not None and starts:
+        start = starts.pop()
+        session.sql_timeline.append(ProfileSqlStatement(
+            start_ms=round(session.offset_ms(start), 3),
+            duration_ms=round((time.perf_counter() - start) * 1000, 3),
+            statement=statement[:PROFILE_STATEMENT_CHARS]
+        ))
+
+
+def profiled(endpoint: Callable) -> Callable:
+    """Wrap a route endpoint to run under the request's profiler, if any.
+    
+    Sync endpoints are profiled in the threadpool thread they run on; async
+    endpoints on the event loop, where work of concurrent requests between
+    awaits is included too.
+    """
+    if asyncio.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            session = current_profile.get()
+            if session is None:
+                return await endpoint(*args, **kwargs)
+            session.profiler.enable()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                session.profiler.disable()
+        return async_wrapper
+    
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        session = current_profile.get()
+        if session is None:
+            return endpoint(*args, **kwargs)
+        session.profiler.enable()
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            session.profiler.disable()
+    return wrapper
+
+
+def instrument_routes(app: FastAPI) -> None:
+    """Make every API route of an app profileable; call after including routers."""
+    for route in app.routes:
+        if isinstance(route, APIRoute):
+            route.dependant.call = profiled(route.dependant.call)
+
+
+class ProfileBuffer:
+    """The most recent request profiles, oldest dropped first."""
+    
+    def __init__(self, max_profiles: int):
+        self._profiles: deque = deque(maxlen=max_profiles)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+    
+    def next_id(self) -> int:
+        """Reserve the id of a new profile."""
+        return next(self._ids)
+    
+    def add(self, profile: RequestProfile) -> None:
+        """Store a profile, dropping the oldest if the buffer is full."""
+        with self._lock:
+            self._profiles.append(profile)
+    
+    def list(self) -> List[RequestProfile]:
+        """Get the stored profiles, newest first."""
+        with self._lock:
+            return list(reversed(self._profiles))
+    
+    def get(self, profile_id: int) -> Optional[RequestProfile]:
+        """Get a stored profile by id, or None if it was dropped."""
+        with self._lock:
+            return next((profile for profile in self._profiles if profile.id == profile_id), None)
+    
+    def clear(self) -> None:
+        """Drop every stored profile."""
+        with self._lock:
+            self._profiles.clear()
+
+
+# Global profile buffer instance
+profile_buffer = ProfileBuffer(settings.PROFILE_BUFFER_SIZE)
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling requests on demand or when they run slow.
+    
+    A request is profiled when it sends the X-Profile header with the admin
+    token, and then always stored. With PROFILE_SLOW_REQUEST_MS set, other
+    requests are profiled too (one at a time) and stored only if they take
+    at least that long.
+    
+    Requested profiles take priority: they wait up to
+    PROFILE_LOCK_WAIT_SECONDS for a profile in progress to finish, and no
+    threshold profile starts meanwhile. If the profiler is still busy, the
+    request runs unprofiled and the response carries X-Profile-Skipped: busy.
+    """
+    
+    def __init__(self, app: ASGIApp, buffer: ProfileBuffer = profile_buffer):
+        self.app = app
+        self.buffer = buffer
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        requested = is_admin_token(Headers(scope=scope).get(PROFILE_HEADER))
+        threshold_ms = settings.PROFILE_SLOW_REQUEST_MS
+        if requested:
+            acquired = await acquire_profiler_for_header()
+        else:
+            acquired = threshold_ms > 0 and acquire_profiler_for_threshold()
+        
+        if not acquired:
+            async def skipped_send(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    message = with_header(message, PROFILE_SKIPPED_HEADER, "busy")
+                await send(message)
+            
+            await self.app(scope, receive, skipped_send if requested else send)
+            return
+        
+        session = ProfileSession()
+        token = current_profile.set(session)
+        profile_id = self.buffer.next_id()
+        started_at = datetime.utcnow()
+        status_code = 500
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if requested:
+                    message = with_header(message, PROFILE_ID_HEADER, str(profile_id))
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration_ms = session.offset_ms(time.perf_counter())
+            current_profile.reset(token)
+            _profiler_lock.release()
+            
+            if requested or duration_ms >= threshold_ms:
+                self.buffer.add(RequestProfile(
+                    id=profile_id,
+                    method=scope["method"],
+                    path=scope["path"],
+                    status_code=status_code,
+                    trigger="header" if requested else "threshold",
+                    started_at=started_at,
+                    duration_ms=round(duration_ms, 3),
+                    sql_statements=len(session.sql_timeline),
+                    sql_ms=round(sum(statement.duration_ms for statement in session.sql_timeline), 3),
+                    functions=session.function_stats(),
+                    sql_timeline=session.sql_timeline
+                ))
@@ -0,0 +1,117 @@
+"""Per-route latency, SQL and response-size metrics for every request."""
+import time
+from contextvars import ContextVar
+from typing import Dict, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.utils.metrics import COUNT_BUCKETS, LATENCY_BUCKETS, SIZE_BUCKETS, MetricFamily
+
+# Route label of requests that matched no route, so unknown paths add no series
+UNMATCHED_ROUTE = "unmatched"
+
+REQUESTS = MetricFamily(
+    "http_requests_total", "Requests handled, by route and status code.", ("method", "route", "status")
+)
+REQUEST_DURATION = MetricFamily(
+    "http_request_duration_seconds", "Time to handle a request.", ("method", "route"), LATENCY_BUCKETS
+)
+REQUEST_SQL_STATEMENTS = MetricFamily(
+    "http_request_sql_statements", "SQL statements executed per request.", ("method", "route"), COUNT_BUCKETS
+)
+REQUEST_SQL_DURATION = MetricFamily(
+    "http_request_sql_duration_seconds", "Time spent executing SQL per request.", ("method", "route"), LATENCY_BUCKETS
+)
+RESPONSE_SIZE = MetricFamily(
+    "http_response_size_bytes", "Response body size.", ("method", "route"), SIZE_BUCKETS
+)
+
+REQUEST_METRIC_FAMILIES = (REQUESTS, REQUEST_DURATION, REQUEST_SQL_STATEMENTS, REQUEST_SQL_DURATION, RESPONSE_SIZE)
+
+
+class RequestStats:
+    """SQL work done while handling one request."""
+    
+    def __init__(self):
+        self.statements = 0
+        self.sql_seconds = 0.0
+
+
+# Stats of the request being handled; context is copied into threadpool
+# workers and async-session greenlets, so their statements are counted too
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_statement_timer(conn, cursor, statement, parameters, context, executemany):
+    if current_request_stats.get() is not None:
+        conn.info.setdefault("request_statement_starts", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_statement(conn, cursor, statement, parameters, context, executemany):
+    stats = current_request_stats.get()
+    starts = conn.info.get("request_statement_starts")
+    if stats is not None and starts:
+        stats.statements += 1
+        stats.sql_seconds += time.perf_counter() - starts.pop()
+
+
+class RequestMetricsMiddleware:
+    """ASGI middleware recording per-route request metrics.
+    
+    Routes are labelled by their path template (e.g. /transactions/{transaction_id}),
+    so the number of series stays bounded.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._route_paths: Dict[object, str] = {}
+    
+    def route_path(self, scope: Scope) -> str:
+        """Get the path template of the route that handled a request."""
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            for route in scope["app"].routes:
+                if getattr(route, "endpoint", None) is endpoint:
+                    path = route.path
+                    break
+            self._route_paths[endpoint] = path = path or UNMATCHED_ROUTE
+        return path
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        status_code = 500
+        body_bytes = 0
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, body_bytes
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                body_bytes += len(message.get("body", b""))
+            await send(message)
+        
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            current_request_stats.reset(token)
+            
+            method = scope["method"]
+            route = self.route_path(scope)
+            REQUESTS.labels(method, route, str(status_code)).inc()
+            REQUEST_DURATION.labels(method, route).observe(elapsed)
+            REQUEST_SQL_STATEMENTS.labels(method, route).observe(stats.statements)
+            REQUEST_SQL_DURATION.labels(method, route).observe(stats.sql_seconds)
+            RESPONSE_SIZE.labels(method, route).observe(body_bytes)
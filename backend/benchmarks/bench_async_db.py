@@ -0,0 +1,148 @@
+"""Load test the sync and async database routers for latency under concurrency.
+
+Seeds a throwaway user with transactions and budgets in the configured
+database, then sends a mix of GET /transactions/, /budgets/ and
+/dashboard/ requests with a fixed number in flight, first to the sync
+routers (each request holds a threadpool slot while it waits on the
+database) and then to the async routers on an asyncpg (or aiosqlite)
+engine. Reports throughput and p50/p99 latency for each.
+
+Usage:
+    python -m benchmarks.bench_async_db --requests 2000 --concurrency 200
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from app.config import get_settings
+from app.database import SessionLocal, get_async_db, get_async_database_url, get_pool_options
+from app.models.budget import Budget
+from app.models.monthly_rollup import MonthlyRollup
+from app.models.transaction import Transaction, TransactionType
+from app.models.user import User
+from app.routers import async_budget, async_dashboard, async_transactions, budget, dashboard, transactions
+from app.services.auth_service import create_access_token
+from app.services.rollup_service import rebuild_monthly_rollups
+
+settings = get_settings()
+
+PATHS = ["/transactions/?limit=50", "/budgets/", "/dashboard/"]
+CATEGORIES = ["Food", "Rent", "Travel", "Shopping"]
+
+
+def seed(db, user: User, rows: int) -> None:
+    """Give the user a year of transactions, a budget per category and rollups."""
+    db.execute(insert(Transaction), [
+        {
+            "id": uuid.uuid4(),
+            "user_id": user.id,
+            "type": TransactionType.EXPENSE,
+            "category": CATEGORIES[i % len(CATEGORIES)],
+            "amount": Decimal("10.00"),
+            "transaction_date": date.today() - timedelta(days=i % 365),
+        }
+        for i in range(rows)
+    ])
+    db.execute(insert(Budget), [
+        {"id": uuid.uuid4(), "user_id": user.id, "category": category, "monthly_limit": Decimal("5000"), "financial_year": "2025-26"}
+        for category in CATEGORIES
+    ])
+    db.commit()
+    rebuild_monthly_rollups(db, str(user.id))
+
+
+def build_app(async_mode: bool) -> FastAPI:
+    """Build an app serving only the sync or only the async routers."""
+    app = FastAPI()
+    routers = (async_transactions, async_budget, async_dashboard) if async_mode else (transactions, budget, dashboard)
+    for module in routers:
+        app.include_router(module.router)
+    
+    if async_mode:
+        engine = create_async_engine(
+            get_async_database_url(settings.DATABASE_URL),
+            poolclass=AsyncAdaptedQueuePool,
+            **get_pool_options()
+        )
+        sessions = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+        
+        async def get_bench_async_db():
+            async with sessions() as db:
+                yield db
+        
+        app.dependency_overrides[get_async_db] = get_bench_async_db
+        app.state.engine = engine
+    return app
+
+
+async def load(app: FastAPI, headers: dict, requests: int, concurrency: int) -> dict:
+    """Send requests round-robin over PATHS with at most concurrency in flight."""
+    latencies = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app, raise_app_exceptions=False), base_url="http://bench", timeout=None) as client:
+        async def request(i: int):
+            nonlocal errors
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(PATHS[i % len(PATHS)], headers=headers)
+                latencies.append(time.perf_counter() - start)
+                errors += response.status_code != 200
+        
+        start = time.perf_counter()
+        await asyncio.gather(*[request(i) for i in range(requests)])
+        elapsed = time.perf_counter() - start
+    
+    if hasattr(app.state, "engine"):
+        await app.state.engine.dispose()
+    
+    latencies.sort()
+    return {
+        "throughput": requests / elapsed,
+        "p50": latencies[len(latencies) // 2] * 1000,
+        "p99": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "errors": errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    user = User(email=f"bench-{uuid.uuid4().hex}@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(user_id)})}"}
+    
+    try:
+        seed(db, user, args.rows)
+        db.close()
+        
+        print(f"{'mode':>6} {'req/s':>10} {'p50 ms':>10} {'p99 ms':>10} {'errors':>8}")
+        for name, async_mode in (("sync", False), ("async", True)):
+            result = asyncio.run(load(build_app(async_mode), headers, args.requests, args.concurrency))
+            print(f"{name:>6} {result['throughput']:>10.1f} {result['p50']:>10.1f} {result['p99']:>10.1f} {result['errors']:>8}")
+    finally:
+        db.rollback()
+        for model in (Transaction, Budget, MonthlyRollup):
+            db.query(model).filter(model.user_id == user_id).delete(synchronize_session=False)
+        db.query(User).filter(User.id == user_id).delete(synchronize_session=False)
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Benchmark login throughput and event-loop health under a burst of logins.
+
+Seeds a throwaway user in the configured database and sends concurrent
+logins through the app in-process, while probing /health. The inline
+baseline verifies passwords in the request threadpool, as login used to;
+the pooled run uses the dedicated hashing processes, refusing logins
+beyond the queue limit with 503. The probe latency shows how much the
+burst stalls unrelated requests.
+
+Usage:
+    python -m benchmarks.bench_login --logins 200 --concurrency 50
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+import httpx
+from fastapi.concurrency import run_in_threadpool
+from app.database import SessionLocal
+from app.main import app
+from app.models.user import User
+from app.routers import auth
+from app.services.auth_service import get_password_hash, verify_and_update_password
+from app.services.password_hasher import password_hasher
+
+PASSWORD = "benchmark-password"
+
+
+class InlineHasher:
+    """Hashes in the request threadpool, kept as the benchmark baseline."""
+    
+    async def hash(self, password: str) -> str:
+        return await run_in_threadpool(get_password_hash, password)
+    
+    async def verify_and_update(self, password: str, hashed_password: str):
+        return await run_in_threadpool(verify_and_update_password, password, hashed_password)
+
+
+async def burst(email: str, logins: int, concurrency: int) -> dict:
+    """Send logins with bounded concurrency while probing /health."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        semaphore = asyncio.Semaphore(concurrency)
+        statuses = []
+        probes = []
+        done = asyncio.Event()
+        
+        async def login():
+            async with semaphore:
+                response = await client.post("/auth/login", json={"email": email, "password": PASSWORD})
+                statuses.append(response.status_code)
+        
+        async def probe():
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/health")
+                probes.append(time.perf_counter() - start)
+                await asyncio.sleep(0.01)
+        
+        prober = asyncio.create_task(probe())
+        start = time.perf_counter()
+        await asyncio.gather(*[login() for _ in range(logins)])
+        elapsed = time.perf_counter() - start
+        done.set()
+        await prober
+    
+    probes.sort()
+    return {
+        "elapsed": elapsed,
+        "ok": statuses.count(200),
+        "busy": statuses.count(503),
+        "probe_p50": statistics.median(probes) * 1000,
+        "probe_max": probes[-1] * 1000,
+    }
+
+
+def report(name: str, result: dict) -> None:
+    print(
+        f"{name}: {result['ok'] / result['elapsed']:.1f} logins/s ({result['ok']} ok, {result['busy']} busy), "
+        f"/health p50 {result['probe_p50']:.1f}ms max {result['probe_max']:.1f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--max-pending", type=int, default=0, help="Hash queue limit (default: PASSWORD_HASH_MAX_PENDING)")
+    args = parser.parse_args()
+    if args.max_pending:
+        password_hasher.max_pending = args.max_pending
+    
+    db = SessionLocal()
+    user = User(email=f"bench-{uuid.uuid4().hex}@example.com", hashed_password=get_password_hash(PASSWORD))
+    db.add(user)
+    db.commit()
+    
+    try:
+        pooled = auth.password_hasher
+        auth.password_hasher = InlineHasher()
+        report("inline", asyncio.run(burst(user.email, args.logins, args.concurrency)))
+        
+        auth.password_hasher = pooled
+        report("pooled", asyncio.run(burst(user.email, args.logins, args.concurrency)))
+    finally:
+        password_hasher.shutdown()
+        db.delete(user)
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
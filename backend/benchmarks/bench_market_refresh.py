@@ -0,0 +1,101 @@
+"""Benchmark serial per-investment vs batched market price refresh.
+
+Seeds throwaway users holding a shared pool of tickers in the configured
+database, then refreshes their values against the offline stub price
+source with a simulated per-call network latency. The serial baseline
+makes two calls per holding, as the old history-plus-info lookup did; the
+batched refresh fetches each distinct ticker once in multi-symbol batches
+and writes every value back with one UPDATE.
+
+Usage:
+    python -m benchmarks.bench_market_refresh --users 50 --holdings 40 --tickers 500
+"""
+import argparse
+import random
+import time
+import uuid
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import insert
+from app.database import SessionLocal
+from app.models.user import User
+from app.models.investment import Investment, InvestmentType
+from app.services.market_data import refresh_investment_prices
+from app.services.price_sources import StubPriceSource
+
+
+def seed(db, users: list, holdings: int, tickers: int) -> None:
+    """Give each user holdings drawn from a pool of ticker symbols."""
+    rng = random.Random(42)
+    pool = [f"BENCH{i}" for i in range(tickers)]
+    db.execute(insert(Investment), [
+        {
+            "id": uuid.uuid4(),
+            "user_id": user.id,
+            "name": ticker,
+            "investment_type": InvestmentType.STOCK,
+            "amount_invested": Decimal("1000.00"),
+            "start_date": date(2024, 1, 1),
+            "ticker_symbol": ticker,
+        }
+        for user in users
+        for ticker in rng.sample(pool, min(holdings, tickers))
+    ])
+    db.commit()
+
+
+def serial_refresh(db, source: StubPriceSource) -> int:
+    """Refresh values the old way: per investment, two fetches and an ORM write."""
+    investments = db.query(Investment).filter(
+        Investment.is_active == True,
+        Investment.ticker_symbol.isnot(None)
+    ).all()
+    for investment in investments:
+        symbol = f"{investment.ticker_symbol}.NS"
+        price = source.fetch_prices([symbol]).get(symbol)  # history()
+        source.fetch_prices([symbol])  # info
+        if price is not None:
+            investment.current_value = price
+    db.commit()
+    return len(investments)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--holdings", type=int, default=40)
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.005, help="Simulated seconds per upstream call")
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    users = [User(email=f"bench-{uuid.uuid4().hex}@example.com", hashed_password="x") for _ in range(args.users)]
+    db.add_all(users)
+    db.commit()
+    user_ids = [user.id for user in users]
+    
+    try:
+        seed(db, users, args.holdings, args.tickers)
+        
+        source = StubPriceSource(latency=args.latency)
+        start = time.perf_counter()
+        investments = serial_refresh(db, source)
+        serial_s = time.perf_counter() - start
+        print(f"serial:  {investments} investments, {source.calls} upstream calls, {serial_s:.2f}s")
+        
+        source = StubPriceSource(latency=args.latency)
+        start = time.perf_counter()
+        result = refresh_investment_prices(db, source)
+        batched_s = time.perf_counter() - start
+        print(f"batched: {result['updated']} investments, {source.calls} upstream calls, {batched_s:.2f}s")
+        print(f"speedup: {serial_s / batched_s:.1f}x")
+    finally:
+        db.rollback()
+        db.query(Investment).filter(Investment.user_id.in_(user_ids)).delete(synchronize_session=False)
+        db.query(User).filter(User.id.in_(user_ids)).delete(synchronize_session=False)
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark offset vs keyset (cursor) paging of GET /transactions/.
+
+Seeds a throwaway user with N transactions in the configured database,
+then times fetching one page at increasing depths with skip/limit and with
+the cursor returned for the same position. Offset paging grows linearly
+with depth; cursor paging stays flat.
+
+Usage:
+    python -m benchmarks.bench_pagination --rows 200000 --limit 50
+"""
+import argparse
+import time
+import uuid
+from datetime import date, timedelta
+from decimal import Decimal
+from fastapi import Response
+from sqlalchemy import insert
+from app.database import SessionLocal
+from app.models.user import User
+from app.models.transaction import Transaction, TransactionType
+from app.routers.transactions import get_transactions
+from app.utils.pagination import encode_cursor
+
+
+def seed(db, user: User, rows: int) -> None:
+    """Insert rows transactions for the user in batches."""
+    batch = []
+    for i in range(rows):
+        batch.append({
+            "id": uuid.uuid4(),
+            "user_id": user.id,
+            "type": TransactionType.EXPENSE,
+            "category": "Food",
+            "amount": Decimal("10.00"),
+            "transaction_date": date(2020, 1, 1) + timedelta(days=i // 50),
+        })
+        if len(batch) == 10000:
+            db.execute(insert(Transaction), batch)
+            batch = []
+    if batch:
+        db.execute(insert(Transaction), batch)
+    db.commit()
+
+
+def time_page(db, user: User, limit: int, repeat: int, **params) -> float:
+    """Get the best-of-repeat time in milliseconds to fetch one page."""
+    best = float("inf")
+    for _ in range(repeat):
+        db.expunge_all()
+        start = time.perf_counter()
+        get_transactions(Response(), limit=limit, user_id=user.id, db=db, **params)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    db = SessionLocal()
+    user = User(email=f"bench-{uuid.uuid4().hex}@example.com", hashed_password="x")
+    db.add(user)
+    db.commit()
+    
+    try:
+        seed(db, user, args.rows)
+        
+        print(f"{'depth':>10} {'offset ms':>12} {'cursor ms':>12}")
+        depth = args.limit
+        while depth < args.rows:
+            # Key of the row just before the requested page
+            boundary = db.query(Transaction.transaction_date, Transaction.id).filter(
+                Transaction.user_id == user.id
+            ).order_by(
+                Transaction.transaction_date.desc(),
+                Transaction.id.desc()
+            ).offset(depth - 1).limit(1).one()
+            cursor = encode_cursor(boundary.transaction_date.isoformat(), boundary.id)
+            
+            offset_ms = time_page(db, user, args.limit, args.repeat, skip=depth)
+            cursor_ms = time_page(db, user, args.limit, args.repeat, cursor=cursor)
+            print(f"{depth:>10} {offset_ms:>12.2f} {cursor_ms:>12.2f}")
+            depth *= 4
+    finally:
+        db.rollback()
+        db.query(Transaction).filter(Transaction.user_id == user.id).delete(synchronize_session=False)
+        db.query(User).filter(User.id == user.id).delete(synchronize_session=False)
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark SMS parser throughput on a synthetic corpus.
+
+Compares parse_sms (precompiled patterns with anchor dispatch) against the
+previous implementation, which ran re.search with every raw pattern string
+in turn, and checks both produce identical results.
+
+Usage:
+    python -m benchmarks.bench_sms_parser --messages 1000000
+"""
+import argparse
+import re
+import time
+from app.services.sms_parser import SMSParseResult, clean_amount, parse_sms
+from app.utils.constants import SMS_PATTERNS
+from benchmarks.sms_corpus import make_corpus
+
+
+def legacy_parse_sms(sms_text: str) -> SMSParseResult:
+    """Previous parse_sms implementation, kept as the benchmark baseline."""
+    result = SMSParseResult(raw_sms=sms_text)
+    
+    for bank, pattern in SMS_PATTERNS.items():
+        match = re.search(pattern, sms_text, re.IGNORECASE)
+        if match:
+            result.bank = bank
+            result.success = True
+            
+            if bank == "HDFC":
+                result.amount = clean_amount(match.group(1))
+                result.transaction_type = "DEBIT" if "debited" in match.group(2).lower() else "CREDIT"
+                result.account_last4 = match.group(3)
+                result.date = match.group(4)
+                result.merchant = match.group(5) if match.group(5) is not None else None
+                result.reference_number = match.group(6) if match.group(6) is not None else None
+                result.available_balance = clean_amount(match.group(7)) if match.group(7) is not None else None
+            elif bank == "SBI":
+                result.account_last4 = match.group(1)
+                result.transaction_type = "DEBIT" if "debited" in match.group(2).lower() else "CREDIT"
+                result.amount = clean_amount(match.group(3))
+                result.date = match.group(4)
+                result.reference_number = match.group(5) if match.group(5) is not None else None
+            elif bank == "ICICI":
+                result.account_last4 = match.group(1)
+                result.transaction_type = "DEBIT" if "debited" in match.group(2).lower() else "CREDIT"
+                result.amount = clean_amount(match.group(3))
+                result.date = match.group(4)
+                result.merchant = match.group(5) if match.group(5) is not None else None
+                result.reference_number = match.group(6) if match.group(6) is not None else None
+            elif bank == "AXIS":
+                result.amount = clean_amount(match.group(1))
+                result.account_last4 = match.group(2)
+                result.merchant = match.group(3) if match.group(3) is not None else None
+                result.date = match.group(4)
+                result.reference_number = match.group(5)
+                result.transaction_type = "DEBIT"
+            elif bank == "KOTAK":
+                result.amount = clean_amount(match.group(1))
+                result.transaction_type = "DEBIT" if "debited" in match.group(2).lower() else "CREDIT"
+                result.account_last4 = match.group(3)
+                result.date = match.group(4)
+                result.merchant = match.group(5) if match.group(5) is not None else None
+                result.available_balance = clean_amount(match.group(6)) if match.group(6) is not None else None
+            elif bank == "CREDIT_CARD":
+                result.account_last4 = match.group(1)
+                result.amount = clean_amount(match.group(2))
+                result.merchant = match.group(3)
+                result.date = match.group(4)
+                result.transaction_type = "DEBIT"
+            break
+    
+    return result
+
+
+def run(parser, corpus) -> float:
+    """Parse the whole corpus and return elapsed seconds."""
+    start = time.perf_counter()
+    for sms in corpus:
+        parser(sms)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=1000000)
+    parser.add_argument("--noise-ratio", type=float, default=0.3)
+    parser.add_argument("--verify", type=int, default=100000, help="Messages to cross-check against the baseline")
+    args = parser.parse_args()
+    
+    corpus = make_corpus(args.messages, noise_ratio=args.noise_ratio)
+    
+    for sms in corpus[:args.verify]:
+        if parse_sms(sms).to_dict() != legacy_parse_sms(sms).to_dict():
+            raise SystemExit(f"Result mismatch for: {sms}")
+    
+    legacy = run(legacy_parse_sms, corpus)
+    compiled = run(parse_sms, corpus)
+    print(f"messages:  {args.messages}")
+    print(f"baseline:  {legacy:.2f}s ({args.messages / legacy:,.0f} msg/s)")
+    print(f"compiled:  {compiled:.2f}s ({args.messages / compiled:,.0f} msg/s)")
+    print(f"speedup:   {legacy / compiled:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Benchmark batch tax calculation against per-income calculation.
+
+Computes both regimes for a curve of incomes with calculate_tax_batch and
+with one calculate_tax_new_regime/calculate_tax_old_regime call per income,
+and checks the batch results equal the single results rounded to the paisa.
+
+Usage:
+    python -m benchmarks.bench_tax_batch --points 10000
+"""
+import argparse
+import time
+from decimal import Decimal, ROUND_HALF_UP
+from app.services.tax_calculator import calculate_tax_batch, calculate_tax_new_regime, calculate_tax_old_regime
+from app.services.tax_rules import get_tax_rules
+
+DEDUCTIONS = Decimal("150000")
+NEW_REGIME_STANDARD_DEDUCTION = get_tax_rules("2025-26").new_regime_standard_deduction
+
+
+def single(incomes):
+    """Calculate both regimes one income at a time."""
+    return [
+        (calculate_tax_new_regime(income, NEW_REGIME_STANDARD_DEDUCTION), calculate_tax_old_regime(income, DEDUCTIONS))
+        for income in incomes
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=10000)
+    parser.add_argument("--max-income", type=int, default=5000000)
+    args = parser.parse_args()
+    
+    step = Decimal(args.max_income) / args.points
+    incomes = [(step * i).quantize(Decimal("0.01")) for i in range(args.points)]
+    
+    start = time.perf_counter()
+    single_results = single(incomes)
+    single_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    batch = calculate_tax_batch(incomes, DEDUCTIONS)
+    batch_time = time.perf_counter() - start
+    
+    for i, (new, old) in enumerate(single_results):
+        for expected, column in [(new.final_tax, batch.new_regime.final_tax), (old.final_tax, batch.old_regime.final_tax)]:
+            if expected.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP) != column[i]:
+                raise SystemExit(f"Result mismatch for income {incomes[i]}")
+    
+    print(f"incomes:   {args.points}")
+    print(f"single:    {single_time * 1000:.1f}ms")
+    print(f"batch:     {batch_time * 1000:.1f}ms")
+    print(f"speedup:   {single_time / batch_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
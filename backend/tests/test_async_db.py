@@ -0,0 +1,112 @@
+"""Test the async database routers."""
+import pytest
+from datetime import date
+from decimal import Decimal
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+from app.database import get_async_db, get_async_database_url
+from app.models.monthly_rollup import MonthlyRollup
+from app.routers import async_budget, async_dashboard, async_transactions
+from tests.conftest import SQLALCHEMY_TEST_DATABASE_URL
+
+
+@pytest.fixture
+def async_client(db_session):
+    """Create a test client for an app serving the async routers."""
+    async_engine = create_async_engine(get_async_database_url(SQLALCHEMY_TEST_DATABASE_URL), poolclass=NullPool)
+    sessions = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    
+    async def override_get_async_db():
+        async with sessions() as db:
+            yield db
+    
+    app = FastAPI()
+    app.include_router(async_transactions.router)
+    app.include_router(async_budget.router)
+    app.include_router(async_dashboard.router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_async_database_url():
+    """Test database URLs get their asyncio driver."""
+    assert get_async_database_url("postgresql://u:p@db:5432/finance").drivername == "postgresql+asyncpg"
+    assert get_async_database_url("sqlite:///./test.db").drivername == "sqlite+aiosqlite"
+    assert get_async_database_url("postgresql://u:p@db/finance").password == "p"
+
+
+def test_async_transaction_crud_keeps_rollups(async_client, auth_headers, db_session):
+    """Test create, update and delete through the async router adjust rollups."""
+    response = async_client.post(
+        "/transactions/",
+        json={"type": "EXPENSE", "category": "Food", "amount": "250.00", "transaction_date": "2025-06-10"},
+        headers=auth_headers
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    transaction_id = response.json()["id"]
+    
+    response = async_client.put(
+        f"/transactions/{transaction_id}", json={"amount": "300.00"}, headers=auth_headers
+    )
+    assert Decimal(response.json()["amount"]) == Decimal("300.00")
+    
+    rollup = db_session.query(MonthlyRollup).one()
+    assert rollup.total_amount == Decimal("300.00")
+    assert rollup.transaction_count == 1
+    
+    response = async_client.get("/transactions/?limit=1", headers=auth_headers)
+    assert [t["id"] for t in response.json()] == [transaction_id]
+    assert "X-Next-Cursor" in response.headers
+    
+    assert async_client.delete(f"/transactions/{transaction_id}", headers=auth_headers).status_code == status.HTTP_204_NO_CONTENT
+    assert async_client.get(f"/transactions/{transaction_id}", headers=auth_headers).status_code == status.HTTP_404_NOT_FOUND
+    db_session.expire_all()
+    assert db_session.query(MonthlyRollup).one().transaction_count == 0
+
+
+def test_async_bulk_create(async_client, auth_headers):
+    """Test bulk creation reports per-item results through the async router."""
+    response = async_client.post(
+        "/transactions/bulk",
+        json={"transactions": [
+            {"type": "INCOME", "category": "Salary", "amount": "50000", "transaction_date": "2025-06-01"},
+            {"type": "EXPENSE", "category": "Food", "amount": "-1", "transaction_date": "2025-06-02"},
+        ]},
+        headers=auth_headers
+    )
+    
+    data = response.json()
+    assert (data["created"], data["failed"]) == (1, 1)
+    assert [result["status"] for result in data["results"]] == ["created", "invalid"]
+
+
+def test_async_routes_match_sync_routes(client, async_client, auth_headers):
+    """Test budgets and the dashboard read the same through both routers."""
+    this_month = date.today().replace(day=1).isoformat()
+    client.post(
+        "/budgets/",
+        json={"category": "Food", "monthly_limit": "1000.00", "financial_year": "2025-26"},
+        headers=auth_headers
+    )
+    async_client.post(
+        "/transactions/",
+        json={"type": "EXPENSE", "category": "Food", "amount": "400.00", "transaction_date": this_month},
+        headers=auth_headers
+    )
+    async_client.post(
+        "/transactions/",
+        json={"type": "INCOME", "category": "Dividend", "amount": "100.00", "transaction_date": this_month,
+              "rich_dad_category": "PASSIVE_INCOME"},
+        headers=auth_headers
+    )
+    
+    budgets = async_client.get("/budgets/", headers=auth_headers).json()
+    assert Decimal(budgets[0]["spent"]) == Decimal("400.00")
+    assert budgets == client.get("/budgets/", headers=auth_headers).json()
+    
+    dashboard = async_client.get("/dashboard/", headers=auth_headers).json()
+    assert dashboard["financial_freedom_ratio"] == 25.0
+    assert dashboard == client.get("/dashboard/", headers=auth_headers).json()
@@ -1,6 +1,13 @@
 """Test authentication endpoints."""
 import pytest
 from fastapi import status
+from sqlalchemy import event
+from app.config import get_settings
+from app.services.auth_service import pwd_context
+from app.services.password_hasher import password_hasher
+from tests.conftest import engine
+
+settings = get_settings()
 
 
 def test_register_user(client):
@@ -72,3 +79,65 @@ def test_login_non_existent_user(client):
         }
     )
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.fixture
+def user_queries():
+    """Record SQL statements that read the users table."""
+    statements = []
+    
+    def listener(conn, cursor, statement, *args):
+        if "FROM users" in statement:
+            statements.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", listener)
+    yield statements
+    event.remove(engine, "before_cursor_execute", listener)
+
+
+def test_current_user_is_cached(client, auth_headers, user_queries, db_session, test_user):
+    """Test the user row is read once and re-read after it changes."""
+    assert client.get("/auth/me", headers=auth_headers).json()["full_name"] == "Test User"
+    assert client.get("/auth/me", headers=auth_headers).status_code == status.HTTP_200_OK
+    assert len(user_queries) == 1
+    
+    test_user.full_name = "Renamed User"
+    db_session.commit()
+    
+    assert client.get("/auth/me", headers=auth_headers).json()["full_name"] == "Renamed User"
+
+
+def test_id_only_routes_skip_user_lookup(client, auth_headers, user_queries):
+    """Test routes scoped by user id do not query the users table."""
+    response = client.get("/transactions/", headers=auth_headers)
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert user_queries == []
+    
+    response = client.get("/transactions/", headers={"Authorization": "Bearer not-a-token"})
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+def test_login_upgrades_outdated_hash(client, db_session, test_user):
+    """Test a hash made with another cost is replaced on login."""
+    test_user.hashed_password = pwd_context.handler().using(rounds=4).hash("testpassword123")
+    db_session.commit()
+    
+    response = client.post("/auth/login", json={"email": "test@example.com", "password": "testpassword123"})
+    assert response.status_code == status.HTTP_200_OK
+    
+    db_session.refresh(test_user)
+    assert test_user.hashed_password.startswith(f"$2b${settings.BCRYPT_ROUNDS:02d}$")
+    assert not pwd_context.needs_update(test_user.hashed_password)
+    assert pwd_context.verify("testpassword123", test_user.hashed_password)
+
+
+def test_login_fails_fast_when_hasher_is_full(client, test_user, monkeypatch):
+    """Test sign-ins are refused with 503 once the hash queue is full."""
+    monkeypatch.setattr(password_hasher, "max_pending", 0)
+    
+    response = client.post("/auth/login", json={"email": "test@example.com", "password": "testpassword123"})
+    
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+    assert password_hasher.pending == 0
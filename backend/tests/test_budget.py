@@ -0,0 +1,79 @@
+"""Test budget endpoints."""
+import pytest
+from decimal import Decimal
+from datetime import date
+from dateutil.relativedelta import relativedelta
+from fastapi import status
+from sqlalchemy import event
+from tests.conftest import engine
+
+
+def create_budget(client, auth_headers, category, monthly_limit):
+    """Create a budget through the API."""
+    response = client.post(
+        "/budgets/",
+        json={"category": category, "monthly_limit": monthly_limit, "financial_year": "2025-26"},
+        headers=auth_headers
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+
+def create_expense(client, auth_headers, category, amount, transaction_date):
+    """Create an expense transaction through the API."""
+    response = client.post(
+        "/transactions/",
+        json={
+            "type": "EXPENSE",
+            "category": category,
+            "amount": amount,
+            "transaction_date": transaction_date.isoformat()
+        },
+        headers=auth_headers
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+
+def test_get_budgets_with_spending(client, auth_headers):
+    """Test budget spending for the current and a past month."""
+    this_month = date.today().replace(day=1)
+    last_month = this_month - relativedelta(months=1)
+    
+    create_budget(client, auth_headers, "Food", "1000.00")
+    create_budget(client, auth_headers, "Rent", "20000.00")
+    create_expense(client, auth_headers, "Food", "250.00", this_month)
+    create_expense(client, auth_headers, "Food", "150.00", this_month)
+    create_expense(client, auth_headers, "Food", "900.00", last_month)
+    
+    response = client.get("/budgets/", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    budgets = {budget["category"]: budget for budget in response.json()}
+    assert Decimal(budgets["Food"]["spent"]) == Decimal("400.00")
+    assert Decimal(budgets["Food"]["remaining"]) == Decimal("600.00")
+    assert budgets["Food"]["percentage_used"] == 40.0
+    assert Decimal(budgets["Rent"]["spent"]) == Decimal("0")
+    
+    response = client.get(f"/budgets/?month={last_month.isoformat()}", headers=auth_headers)
+    budgets = {budget["category"]: budget for budget in response.json()}
+    assert Decimal(budgets["Food"]["spent"]) == Decimal("900.00")
+
+
+def test_get_budgets_query_count_is_constant(client, auth_headers):
+    """Test budget spending does not issue one query per budget."""
+    for i in range(10):
+        create_budget(client, auth_headers, f"Category {i}", "1000.00")
+    
+    statements = []
+    
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        response = client.get("/budgets/", headers=auth_headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()) == 10
+    budget_statements = [statement for statement in statements if "budgets" in statement]
+    assert len(budget_statements) == 1
@@ -0,0 +1,67 @@
+"""Test dashboard service."""
+import pytest
+from decimal import Decimal
+from datetime import date
+from dateutil.relativedelta import relativedelta
+from app.models.transaction import Transaction, TransactionType, RichDadCategory
+from app.services.dashboard_service import get_rich_dad_dashboard
+from app.services.rollup_service import rebuild_monthly_rollups
+
+
+def add_transaction(db, user, txn_type, amount, txn_date, rich_dad_category=None, category="Other"):
+    """Add a transaction for the given user."""
+    db.add(Transaction(
+        user_id=user.id,
+        type=txn_type,
+        category=category,
+        amount=Decimal(amount),
+        transaction_date=txn_date,
+        rich_dad_category=rich_dad_category
+    ))
+
+
+def test_dashboard_summary_and_trends(db_session, test_user):
+    """Test dashboard totals and monthly trends from grouped aggregation."""
+    today = date.today()
+    last_month = (today - relativedelta(months=1)).replace(day=1)
+    
+    add_transaction(db_session, test_user, TransactionType.INCOME, "50000.00", today, RichDadCategory.ACTIVE_INCOME)
+    add_transaction(db_session, test_user, TransactionType.INCOME, "5000.00", today, RichDadCategory.PASSIVE_INCOME)
+    add_transaction(db_session, test_user, TransactionType.EXPENSE, "10000.00", today, RichDadCategory.NECESSITY)
+    add_transaction(db_session, test_user, TransactionType.EXPENSE, "2500.50", last_month, RichDadCategory.LIABILITY_EXPENSE)
+    add_transaction(db_session, test_user, TransactionType.EXPENSE, "1000.00", last_month)
+    # Outside the window
+    add_transaction(db_session, test_user, TransactionType.INCOME, "99999.00", today - relativedelta(years=2))
+    db_session.commit()
+    rebuild_monthly_rollups(db_session)
+    
+    dashboard = get_rich_dad_dashboard(db_session, str(test_user.id), months=6)
+    summary = dashboard.income_expense_summary
+    
+    assert summary.total_income == Decimal("55000.00")
+    assert summary.active_income == Decimal("50000.00")
+    assert summary.passive_income == Decimal("5000.00")
+    assert summary.total_expenses == Decimal("13500.50")
+    assert summary.necessity_expenses == Decimal("10000.00")
+    assert summary.liability_expenses == Decimal("2500.50")
+    assert dashboard.cash_flow == Decimal("41499.50")
+    
+    assert len(dashboard.monthly_trends) == 6
+    current = dashboard.monthly_trends[-1]
+    previous = dashboard.monthly_trends[-2]
+    assert current.month == today.strftime("%b %Y")
+    assert current.income == Decimal("55000.00")
+    assert current.expenses == Decimal("10000.00")
+    assert previous.expenses == Decimal("3500.50")
+    assert previous.savings == Decimal("-3500.50")
+    assert dashboard.monthly_trends[0].income == Decimal("0")
+
+
+def test_dashboard_without_transactions(db_session, test_user):
+    """Test dashboard for a user with no transactions."""
+    dashboard = get_rich_dad_dashboard(db_session, str(test_user.id), months=3)
+    
+    assert dashboard.income_expense_summary.total_income == Decimal("0")
+    assert dashboard.financial_freedom_ratio == 0.0
+    assert len(dashboard.monthly_trends) == 3
+    assert all(trend.savings == Decimal("0") for trend in dashboard.monthly_trends)
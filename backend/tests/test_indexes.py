@@ -0,0 +1,109 @@
+"""Test that hot queries are served by the composite indexes."""
+import pytest
+from decimal import Decimal
+from datetime import date, timedelta
+from sqlalchemy import text
+from app.models.user import User
+from app.models.transaction import Transaction, TransactionType
+from app.models.investment import Investment, InvestmentType, TaxSection
+from app.utils.constants import EXPENSE_CATEGORIES
+
+
+@pytest.fixture
+def seeded_db(db_session, test_user):
+    """Seed several users with transactions and investments."""
+    users = [test_user]
+    for i in range(4):
+        user = User(email=f"user{i}@example.com", hashed_password="x")
+        db_session.add(user)
+        users.append(user)
+    db_session.flush()
+    
+    categories = EXPENSE_CATEGORIES
+    for user in users:
+        for day in range(200):
+            db_session.add(Transaction(
+                user_id=user.id,
+                type=TransactionType.INCOME if day % 10 == 0 else TransactionType.EXPENSE,
+                category=categories[day % len(categories)],
+                amount=Decimal("100.00"),
+                transaction_date=date(2025, 1, 1) + timedelta(days=day)
+            ))
+        for i in range(20):
+            db_session.add(Investment(
+                user_id=user.id,
+                name=f"Investment {i}",
+                investment_type=InvestmentType.PPF,
+                amount_invested=Decimal("1000.00"),
+                start_date=date(2025, 1, 1),
+                tax_section=TaxSection.SEC_80C if i % 2 else TaxSection.NONE,
+                is_active=i % 5 != 0
+            ))
+    db_session.commit()
+    db_session.execute(text("ANALYZE"))
+    return db_session
+
+
+def query_plan(db, sql: str) -> str:
+    """Get the query plan for a statement as a single string."""
+    if db.bind.dialect.name == "sqlite":
+        rows = db.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+        return "\n".join(row[-1] for row in rows)
+    rows = db.execute(text(f"EXPLAIN {sql}")).all()
+    return "\n".join(row[0] for row in rows)
+
+
+def test_transaction_date_range_uses_index(seeded_db, test_user):
+    """Test user + date range listing uses the user/date index."""
+    plan = query_plan(seeded_db, (
+        f"SELECT * FROM transactions WHERE user_id = '{test_user.id.hex}' "
+        "AND transaction_date >= '2025-03-01' AND transaction_date <= '2025-03-31' "
+        "ORDER BY transaction_date DESC"
+    ))
+    assert "ix_transactions_user_date" in plan
+
+
+def test_transaction_type_filter_uses_index(seeded_db, test_user):
+    """Test user + type + date range uses the user/type/date index."""
+    plan = query_plan(seeded_db, (
+        f"SELECT * FROM transactions WHERE user_id = '{test_user.id.hex}' "
+        "AND type = 'INCOME' AND transaction_date >= '2025-03-01'"
+    ))
+    assert "ix_transactions_user_type_date" in plan
+
+
+def test_category_filter_uses_index(seeded_db, test_user):
+    """Test category filters over a date range use the user/category/date index."""
+    plan = query_plan(seeded_db, (
+        f"SELECT sum(amount) FROM transactions WHERE user_id = '{test_user.id.hex}' "
+        "AND category = 'Food' "
+        "AND transaction_date >= '2025-03-01' AND transaction_date <= '2025-03-31'"
+    ))
+    assert "ix_transactions_user_category_date" in plan
+
+
+def test_active_ticker_lookup_uses_partial_index(seeded_db):
+    """Test the active-ticker scan uses the partial ticker index."""
+    plan = query_plan(seeded_db, (
+        "SELECT DISTINCT ticker_symbol FROM investments "
+        "WHERE is_active AND ticker_symbol IS NOT NULL"
+    ))
+    assert "ix_investments_active_ticker" in plan
+
+
+def test_investment_section_lookup_uses_index(seeded_db, test_user):
+    """Test active investments by tax section use the composite index."""
+    plan = query_plan(seeded_db, (
+        f"SELECT * FROM investments WHERE user_id = '{test_user.id.hex}' "
+        "AND is_active = true AND tax_section = 'SEC_80C'"
+    ))
+    assert "ix_investments_user_active_section" in plan
+
+
+def test_tax_deduction_year_lookup_uses_index(seeded_db, test_user):
+    """Test a user's deductions for one financial year use the composite index."""
+    plan = query_plan(seeded_db, (
+        f"SELECT section, amount FROM tax_deductions WHERE user_id = '{test_user.id.hex}' "
+        "AND financial_year = '2025-26'"
+    ))
+    assert "ix_tax_deductions_user_year" in plan
@@ -0,0 +1,41 @@
+"""Test investment endpoints."""
+import base64
+import pytest
+from fastapi import status
+
+
+def test_investments_keyset_pagination(client, auth_headers):
+    """Test cursor paging walks every active investment exactly once."""
+    created = []
+    for i in range(5):
+        response = client.post(
+            "/investments/",
+            json={
+                "name": f"Fund {i}",
+                "investment_type": "MUTUAL_FUND",
+                "amount_invested": "1000.00",
+                "start_date": "2025-04-01"
+            },
+            headers=auth_headers
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        created.append(response.json()["id"])
+    
+    seen = []
+    url = "/investments/?limit=2"
+    while url:
+        response = client.get(url, headers=auth_headers)
+        assert response.status_code == status.HTTP_200_OK
+        seen.extend(investment["id"] for investment in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        url = f"/investments/?limit=2&cursor={cursor}" if cursor else None
+    
+    assert sorted(seen) == sorted(created)
+    assert len(seen) == len(set(seen))
+
+
+def test_investments_invalid_cursor(client, auth_headers):
+    """Test malformed and non-string cursors are rejected."""
+    for cursor in ["not-a-cursor", base64.urlsafe_b64encode(b"[1,2]").decode()]:
+        response = client.get(f"/investments/?cursor={cursor}", headers=auth_headers)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,300 @@
+"""Test market data service."""
+import asyncio
+import fnmatch
+import threading
+import time
+import pytest
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from app.config import get_settings
+from app.models.investment import Investment, InvestmentType
+from app.models.portfolio_summary import PortfolioSummary
+from app.models.price_snapshot import PriceSnapshot
+from app.services.market_cache import CacheBackend, MarketDataCache, RedisCacheBackend, SQLiteCacheBackend
+from app.services.market_data import fetch_latest_prices, refresh_investment_prices
+from app.services.price_scheduler import PriceRefreshScheduler, is_market_open
+from app.services.price_sources import PriceSource, StubPriceSource, stub_price
+
+
+def test_fetch_latest_prices_dedupes_and_batches(monkeypatch):
+    """Test each distinct ticker is fetched once, in MARKET_BATCH_SIZE batches."""
+    monkeypatch.setattr(get_settings(), "MARKET_BATCH_SIZE", 2)
+    source = StubPriceSource()
+    
+    prices = fetch_latest_prices(["TCS", "INFY", "TCS", "RELIANCE", "INFY", None], price_source=source)
+    
+    assert prices == {ticker: stub_price(f"{ticker}.NS") for ticker in ["TCS", "INFY", "RELIANCE"]}
+    assert source.calls == 2
+
+
+def test_refresh_investment_prices_bulk_updates(db_session, test_user):
+    """Test a refresh prices all users' active holdings and skips the rest."""
+    def holding(ticker, is_active=True):
+        return Investment(
+            user_id=test_user.id,
+            name=ticker or "FD",
+            investment_type=InvestmentType.STOCK,
+            amount_invested=Decimal("1000.00"),
+            start_date=date(2025, 4, 1),
+            ticker_symbol=ticker,
+            is_active=is_active
+        )
+    
+    holdings = [holding("TCS"), holding("TCS"), holding("INFY"), holding("WIPRO", is_active=False), holding(None)]
+    db_session.add_all(holdings)
+    db_session.commit()
+    
+    source = StubPriceSource()
+    result = refresh_investment_prices(db_session, source)
+    
+    assert result == {"tickers": 2, "priced": 2, "updated": 3, "summaries": 1}
+    assert source.calls == 1
+    db_session.expire_all()
+    assert [inv.current_value for inv in holdings] == [
+        stub_price("TCS.NS"), stub_price("TCS.NS"), stub_price("INFY.NS"), None, None
+    ]
+    
+    snapshots = {s.ticker_symbol: s.price for s in db_session.query(PriceSnapshot).all()}
+    assert snapshots == {"TCS": stub_price("TCS.NS"), "INFY": stub_price("INFY.NS")}
+    
+    # Active holdings: two TCS, one INFY and the FD valued at amount invested
+    summary = db_session.query(PortfolioSummary).filter(PortfolioSummary.user_id == test_user.id).one()
+    assert summary.total_assets_value == 2 * stub_price("TCS.NS") + stub_price("INFY.NS") + Decimal("1000.00")
+    assert summary.asset_count == 4
+
+
+def test_investment_writes_maintain_portfolio_summary(client, auth_headers):
+    """Test the dashboard reads asset totals kept current by investment writes."""
+    payload = {
+        "name": "Gold",
+        "investment_type": "GOLD",
+        "amount_invested": "5000.00",
+        "start_date": "2025-04-01"
+    }
+    created = client.post("/investments/", json=payload, headers=auth_headers).json()
+    client.post("/investments/", json={**payload, "name": "Car loan", "rich_dad_category": "LIABILITY"}, headers=auth_headers)
+    client.put(f"/investments/{created['id']}", json={"current_value": "6500.00"}, headers=auth_headers)
+    
+    summary = client.get("/dashboard/", headers=auth_headers).json()["asset_liability_summary"]
+    assert Decimal(summary["total_assets_value"]) == Decimal("6500.00")
+    assert Decimal(summary["net_worth"]) == Decimal("1500.00")
+    assert summary["liability_count"] == 1
+    
+    client.delete(f"/investments/{created['id']}", headers=auth_headers)
+    summary = client.get("/dashboard/", headers=auth_headers).json()["asset_liability_summary"]
+    assert summary["asset_count"] == 0
+    assert Decimal(summary["total_assets_value"]) == Decimal("0")
+
+
+def test_is_market_open():
+    """Test market hours are checked in IST on weekdays."""
+    # 2026-02-16 is a Monday; 04:00 UTC is 09:30 IST
+    assert is_market_open(datetime(2026, 2, 16, 4, 0, tzinfo=timezone.utc))
+    assert not is_market_open(datetime(2026, 2, 16, 11, 0, tzinfo=timezone.utc))
+    assert not is_market_open(datetime(2026, 2, 14, 4, 0, tzinfo=timezone.utc))
+
+
+def test_price_scheduler_runs_only_in_market_hours():
+    """Test the scheduler skips the job outside market hours."""
+    calls = []
+    
+    def job():
+        calls.append(1)
+        return {"updated": 1}
+    
+    closed = PriceRefreshScheduler(60, job=job, market_open=lambda now: False)
+    opened = PriceRefreshScheduler(60, job=job, market_open=lambda now: True)
+    
+    assert asyncio.run(closed.run_once()) is None
+    assert asyncio.run(opened.run_once()) == {"updated": 1}
+    assert len(calls) == 1
+
+
+class FakeClock:
+    """Manually advanced clock for cache expiry tests."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def test_market_cache_ttl_lru_and_negative_caching():
+    """Test expiry, LRU eviction and remembered misses."""
+    clock = FakeClock()
+    cache = MarketDataCache(ttl_minutes=1, max_entries=2, stale_ttl_minutes=0, negative_ttl_minutes=1, clock=clock)
+    fetches = []
+    
+    def fetch(key, value):
+        def load():
+            fetches.append(key)
+            return value
+        return load
+    
+    assert cache.get_or_fetch("A", fetch("A", {"p": 1})) == {"p": 1}
+    assert cache.get_or_fetch("A", fetch("A", {"p": 2})) == {"p": 1}
+    assert cache.get_or_fetch("UNKNOWN", fetch("UNKNOWN", None)) is None
+    assert cache.get_or_fetch("UNKNOWN", fetch("UNKNOWN", None)) is None
+    assert fetches == ["A", "UNKNOWN"]
+    
+    # A third key evicts the least recently used one
+    cache.get_or_fetch("A", fetch("A", {"p": 2}))
+    cache.get_or_fetch("B", fetch("B", {"p": 3}))
+    assert cache.get("A") == {"p": 1}
+    assert cache.get("UNKNOWN") is None and cache.backend.get("UNKNOWN") is None
+    
+    clock.now += 61
+    assert cache.get_or_fetch("A", fetch("A", {"p": 2})) == {"p": 2}
+    
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["negative_hits"] == 1
+    assert stats["misses"] == 4
+    assert stats["evictions"] == 1
+    assert stats["size"] == 2
+
+
+def test_market_cache_single_flight_and_errors():
+    """Test concurrent misses share one fetch and failures are not cached."""
+    cache = MarketDataCache()
+    release = threading.Event()
+    calls = []
+    
+    def slow_fetch():
+        calls.append(1)
+        release.wait(5)
+        return {"p": 1}
+    
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_fetch("A", slow_fetch)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+    
+    assert results == [{"p": 1}] * 8
+    assert len(calls) == 1
+    
+    def failing_fetch():
+        raise RuntimeError("upstream down")
+    
+    with pytest.raises(RuntimeError):
+        cache.get_or_fetch("B", failing_fetch)
+    assert cache.get_or_fetch("B", lambda: {"p": 2}) == {"p": 2}
+    assert cache.stats()["fetch_errors"] == 1
+
+
+def test_market_cache_serves_stale_while_revalidating():
+    """Test an expired entry is served while one background refresh runs."""
+    clock = FakeClock()
+    cache = MarketDataCache(ttl_minutes=1, stale_ttl_minutes=10, clock=clock)
+    cache.get_or_fetch("A", lambda: {"p": 1})
+    clock.now += 120
+    
+    release = threading.Event()
+    calls = []
+    
+    def refresh():
+        calls.append(1)
+        release.wait(5)
+        return {"p": 2}
+    
+    assert cache.get_or_fetch("A", refresh) == {"p": 1}
+    assert cache.get_or_fetch("A", refresh) == {"p": 1}
+    release.set()
+    
+    for _ in range(50):
+        if cache.get("A") == {"p": 2}:
+            break
+        time.sleep(0.01)
+    assert cache.get("A") == {"p": 2}
+    assert len(calls) == 1
+    assert cache.stats()["stale_hits"] == 2
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis-py client methods the cache uses."""
+    
+    def __init__(self):
+        self.data = {}
+    
+    def get(self, name):
+        value, expires_at = self.data.get(name, (None, None))
+        if expires_at is not None and time.time() >= expires_at:
+            del self.data[name]
+            return None
+        return value
+    
+    def set(self, name, value, px=None):
+        self.data[name] = (value.encode(), time.time() + px / 1000 if px else None)
+    
+    def delete(self, *names):
+        for name in names:
+            self.data.pop(name, None)
+    
+    def scan_iter(self, match="*"):
+        return [name for name in list(self.data) if fnmatch.fnmatch(name, match)]
+
+
+@pytest.mark.parametrize("make_backend", [
+    lambda tmp_path: SQLiteCacheBackend(str(tmp_path / "cache.db")),
+    lambda tmp_path: RedisCacheBackend(FakeRedis()),
+], ids=["sqlite", "redis"])
+def test_shared_cache_backends(tmp_path, make_backend):
+    """Test caches in two workers share entries, including remembered misses."""
+    backend = make_backend(tmp_path)
+    worker_a = MarketDataCache(backend=backend)
+    worker_b = MarketDataCache(backend=backend)
+    
+    assert worker_a.get_or_fetch("TCS.NS", lambda: {"current_price": 3500.5}) == {"current_price": 3500.5}
+    assert worker_a.get_or_fetch("NOPE.NS", lambda: None) is None
+    
+    def unexpected_fetch():
+        raise AssertionError("shared entry was not used")
+    
+    assert worker_b.get_or_fetch("TCS.NS", unexpected_fetch) == {"current_price": 3500.5}
+    assert worker_b.get_or_fetch("NOPE.NS", unexpected_fetch) is None
+    assert worker_b.stats()["size"] == 2
+    
+    worker_b.clear()
+    assert worker_a.get("TCS.NS") is None
+
+
+def test_incomplete_cache_backend_cannot_be_created():
+    """Test a backend missing part of the interface fails when instantiated."""
+    class GetOnlyBackend(CacheBackend):
+        def get(self, key):
+            return None
+    
+    with pytest.raises(TypeError):
+        GetOnlyBackend()
+
+
+def test_incomplete_price_source_cannot_be_created():
+    """Test a price source without history support fails when instantiated."""
+    class LatestOnlySource(PriceSource):
+        def fetch_prices(self, symbols):
+            return {}
+    
+    with pytest.raises(TypeError):
+        LatestOnlySource()
+
+
+def test_sqlite_cache_backend_evicts_oldest(tmp_path):
+    """Test the SQLite backend stays within max_entries."""
+    clock = FakeClock()
+    cache = MarketDataCache(backend=SQLiteCacheBackend(str(tmp_path / "cache.db"), max_entries=2), clock=clock)
+    for key in ["A", "B", "C"]:
+        clock.now += 1
+        cache.set(key, {"key": key})
+    
+    assert cache.get("A") is None
+    assert cache.get("B") == {"key": "B"}
+    assert cache.get("C") == {"key": "C"}
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,116 @@
+"""Test metrics endpoints and instrumentation."""
+import pytest
+from fastapi import status
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from app.config import get_settings
+from app.services.pool_metrics import InstrumentedQueuePool, instrument_engine, instrumented_engines
+
+settings = get_settings()
+
+
+@pytest.fixture
+def small_pool(tmp_path):
+    """Create an instrumented engine with one connection and no overflow."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05
+    )
+    metrics = instrument_engine(engine, "test")
+    yield engine, metrics
+    instrumented_engines.pop("test")
+    engine.dispose()
+
+
+def test_pool_metrics_record_checkouts_and_timeouts(small_pool):
+    """Test checkouts, occupancy and a timed-out wait are recorded."""
+    engine, metrics = small_pool
+    
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        assert metrics.snapshot(engine.pool)["checked_out"] == 1
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+    
+    snapshot = metrics.snapshot(engine.pool)
+    assert snapshot["checked_out"] == 0
+    assert (snapshot["checkouts"], snapshot["connects"], snapshot["timeouts"]) == (1, 1, 1)
+    assert snapshot["wait_seconds"]["count"] == 2
+    assert snapshot["wait_seconds"]["sum"] >= 0.05
+    assert snapshot["checked_out_at_checkout"]["buckets"]["1"] == 1
+
+
+def test_pool_metrics_survive_dispose(small_pool):
+    """Test a recreated pool keeps feeding the same metrics."""
+    engine, metrics = small_pool
+    engine.dispose()
+    
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    
+    assert metrics.snapshot(engine.pool)["wait_seconds"]["count"] == 1
+
+
+def test_pool_metrics_endpoint(client, small_pool):
+    """Test the endpoint reports every instrumented engine."""
+    response = client.get("/metrics/pool")
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert {"sync", "test"} <= set(data)
+    assert data["sync"]["pool_size"] == settings.DB_POOL_SIZE
+
+
+def sample(metrics_text: str, line_prefix: str) -> float:
+    """Get the value of the first sample line starting with a prefix."""
+    for line in metrics_text.splitlines():
+        if line.startswith(line_prefix):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"No sample {line_prefix}")
+
+
+def test_request_metrics_count_sql_per_route(client, auth_headers):
+    """Test per-route SQL counts expose the query cost of a request."""
+    before = client.get("/metrics").text
+    route = 'method="GET",route="/budgets/"'
+    try:
+        count_before = sample(before, f"http_request_sql_statements_count{{{route}}}")
+        sum_before = sample(before, f"http_request_sql_statements_sum{{{route}}}")
+    except AssertionError:
+        count_before = sum_before = 0
+    
+    for category in ("Food", "Rent", "Travel"):
+        client.post(
+            "/budgets/",
+            json={"category": category, "monthly_limit": "1000.00", "financial_year": "2025-26"},
+            headers=auth_headers
+        )
+    client.get("/budgets/", headers=auth_headers)
+    client.get("/budgets/", headers=auth_headers)
+    
+    response = client.get("/metrics")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    
+    # One query per listing regardless of the number of budgets
+    assert sample(text, f"http_request_sql_statements_count{{{route}}}") - count_before == 2
+    assert sample(text, f"http_request_sql_statements_sum{{{route}}}") - sum_before == 2
+    assert sample(text, f'http_requests_total{{method="POST",route="/budgets/",status="201"}}') >= 3
+    assert sample(text, f'http_response_size_bytes_count{{{route}}}') >= 2
+    assert "# TYPE http_request_duration_seconds histogram" in text
+    assert 'db_pool_checkout_wait_seconds_bucket{engine="sync",le="+Inf"}' in text
+
+
+def test_request_metrics_label_route_templates(client):
+    """Test unknown paths share one series and path parameters are not labels."""
+    client.get("/no-such-path/123")
+    client.get("/transactions/00000000-0000-0000-0000-000000000000")
+    
+    text = client.get("/metrics").text
+    assert 'route="unmatched",status="404"' in text
+    assert 'route="/transactions/{transaction_id}",status="403"' in text
+    assert "no-such-path" not in text
@@ -0,0 +1,111 @@
+"""Test portfolio performance analytics."""
+import pytest
+import numpy as np
+from pathlib import Path
+from datetime import date, timedelta
+from fastapi import status
+from app.config import get_settings
+from app.models.investment import Investment
+from app.models.portfolio_summary import PortfolioSummary
+from app.services.portfolio_analytics import ValueSeries, xirr, drawdown
+from app.services.portfolio_service import recompute_portfolio_summaries
+from app.services.price_history import price_history_store
+
+
+@pytest.fixture
+def stub_prices(monkeypatch, tmp_path):
+    """Serve offline stub prices from an empty history store."""
+    monkeypatch.setattr(get_settings(), "MARKET_PRICE_SOURCE", "stub")
+    monkeypatch.setattr(price_history_store, "directory", str(tmp_path))
+    monkeypatch.setattr(price_history_store, "_loaded", {})
+
+
+def test_xirr_known_rates():
+    """Test XIRR against flows with a known annual rate."""
+    dates = np.array(["2024-01-01", "2024-12-31"], dtype="datetime64[D]")
+    assert xirr(np.array([-1000.0, 1100.0]), dates) == pytest.approx(0.10, rel=1e-3)
+    
+    dates = np.array(["2023-01-01", "2024-01-01", "2025-01-01"], dtype="datetime64[D]")
+    rate = xirr(np.array([-1000.0, -1000.0, 2310.0]), dates)
+    assert rate == pytest.approx(0.10, abs=1e-3)
+    
+    assert xirr(np.array([-1000.0]), dates[:1]) is None
+
+
+def test_drawdown_ignores_new_purchases():
+    """Test drawdown uses time-weighted returns, not raw value."""
+    dates = np.arange(np.datetime64("2025-01-01"), np.datetime64("2025-01-06"))
+    # 100 -> 120 -> 90, then 100 more is invested and the holdings go flat
+    series = ValueSeries(
+        dates,
+        np.array([100.0, 120.0, 90.0, 190.0, 190.0]),
+        np.array([100.0, 100.0, 100.0, 200.0, 200.0]),
+        []
+    )
+    
+    result = drawdown(series)
+    
+    assert result["max_drawdown"] == pytest.approx(-0.25)
+    assert result["current_drawdown"] == pytest.approx(-0.25)
+    assert result["peak_date"] == date(2025, 1, 2)
+    assert result["trough_date"] == date(2025, 1, 3)
+
+
+def test_portfolio_endpoints(client, auth_headers, stub_prices):
+    """Test value history, XIRR and drawdown over stub price history."""
+    start = date.today() - timedelta(days=400)
+    for payload in [
+        {"name": "TCS", "investment_type": "STOCK", "amount_invested": "10000.00", "ticker_symbol": "TCS"},
+        {"name": "FD", "investment_type": "FD", "amount_invested": "5000.00", "annual_return_pct": "7.00"},
+    ]:
+        response = client.post(
+            "/investments/",
+            json={**payload, "start_date": start.isoformat()},
+            headers=auth_headers
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+    
+    response = client.get("/portfolio/value-history", headers=auth_headers)
+    assert response.status_code == status.HTTP_200_OK
+    points = response.json()["points"]
+    assert points[0]["invested"] == 15000.0
+    assert points[-1]["date"] < date.today().isoformat()
+    assert len(points) > 250
+    
+    xirr_data = client.get("/portfolio/xirr", headers=auth_headers).json()
+    assert xirr_data["total_invested"] == 15000.0
+    assert xirr_data["current_value"] == points[-1]["value"]
+    assert xirr_data["xirr"] is not None
+    
+    drawdown_data = client.get("/portfolio/drawdown", headers=auth_headers).json()
+    assert -1 < drawdown_data["max_drawdown"] <= drawdown_data["current_drawdown"] <= 0
+    
+    # A narrower window is served from the stored history without refetching
+    stored = Path(price_history_store.directory)
+    files = {path.name: path.stat().st_mtime_ns for path in stored.iterdir()}
+    response = client.get(
+        f"/portfolio/value-history?start_date={(start + timedelta(days=30)).isoformat()}",
+        headers=auth_headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert {path.name: path.stat().st_mtime_ns for path in stored.iterdir()} == files
+
+
+def test_recompute_portfolio_summaries_upserts(client, auth_headers, db_session, test_user):
+    """Test recomputes update the summary row in place and a full run drops stale rows."""
+    response = client.post(
+        "/investments/",
+        json={"name": "FD", "investment_type": "FD", "amount_invested": "5000.00", "start_date": date.today().isoformat()},
+        headers=auth_headers
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    
+    assert recompute_portfolio_summaries(db_session, [test_user.id]) == 1
+    assert recompute_portfolio_summaries(db_session) == 1
+    db_session.commit()
+    assert db_session.query(PortfolioSummary).count() == 1
+    
+    db_session.query(Investment).update({Investment.is_active: False})
+    recompute_portfolio_summaries(db_session)
+    db_session.commit()
+    assert db_session.query(PortfolioSummary).count() == 0
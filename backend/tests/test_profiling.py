@@ -0,0 +1,132 @@
+"""Test opt-in request profiling."""
+import time
+from datetime import datetime
+import pytest
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+from app.config import get_settings
+from app.database import get_db
+from app.routers import admin, dashboard
+from app.schemas.profiling import RequestProfile
+from app.utils import profiling
+from app.utils.profiling import PROFILE_ID_HEADER, ProfileBuffer, ProfilingMiddleware, instrument_routes, profile_buffer
+from tests.conftest import override_get_db
+
+settings = get_settings()
+
+
+@pytest.fixture
+def profiled_client(db_session, monkeypatch):
+    """Create a test client for a profiled app with the dashboard and admin routes."""
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "admin-secret")
+    
+    app = FastAPI()
+    app.include_router(dashboard.router)
+    app.include_router(admin.router)
+    
+    @app.get("/slow")
+    def slow():
+        time.sleep(0.05)
+        return {}
+    
+    instrument_routes(app)
+    app.add_middleware(ProfilingMiddleware)
+    app.dependency_overrides[get_db] = override_get_db
+    
+    profile_buffer.clear()
+    with TestClient(app) as test_client:
+        yield test_client
+    profile_buffer.clear()
+
+
+ADMIN = {"X-Admin-Token": "admin-secret"}
+
+
+def test_profile_on_request_header(profiled_client, auth_headers):
+    """Test a request sent with the admin token is profiled with its SQL timeline."""
+    response = profiled_client.get("/dashboard/", headers={**auth_headers, "X-Profile": "admin-secret"})
+    assert response.status_code == status.HTTP_200_OK
+    profile_id = response.headers[PROFILE_ID_HEADER]
+    
+    profile = profiled_client.get(f"/admin/profiles/{profile_id}", headers=ADMIN).json()
+    assert (profile["path"], profile["trigger"], profile["status_code"]) == ("/dashboard/", "header", 200)
+    assert any("get_rich_dad_dashboard" in stat["function"] for stat in profile["functions"])
+    assert profile["sql_statements"] == len(profile["sql_timeline"]) > 0
+    assert profile["sql_timeline"][0]["statement"].lstrip().upper().startswith("SELECT")
+    
+    summaries = profiled_client.get("/admin/profiles", headers=ADMIN).json()
+    assert [summary["id"] for summary in summaries] == [int(profile_id)]
+    assert "functions" not in summaries[0]
+
+
+def test_profile_header_needs_admin_token(profiled_client, auth_headers):
+    """Test the profile header is ignored without the right token."""
+    response = profiled_client.get("/dashboard/", headers={**auth_headers, "X-Profile": "guess"})
+    
+    assert PROFILE_ID_HEADER not in response.headers
+    assert profiled_client.get("/admin/profiles", headers=ADMIN).json() == []
+    assert profiled_client.get("/admin/profiles").status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_profile_tokens_with_non_ascii_characters(profiled_client, auth_headers):
+    """Test non-ASCII token headers are rejected rather than failing the request."""
+    token = "café".encode("latin-1")
+    
+    response = profiled_client.get("/dashboard/", headers={**auth_headers, "X-Profile": token})
+    assert response.status_code == status.HTTP_200_OK
+    assert PROFILE_ID_HEADER not in response.headers
+    
+    response = profiled_client.get("/admin/profiles", headers={"X-Admin-Token": token})
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_profile_slow_requests(profiled_client, monkeypatch):
+    """Test only requests over the latency threshold are kept."""
+    monkeypatch.setattr(settings, "PROFILE_SLOW_REQUEST_MS", 30)
+    
+    profiled_client.get("/slow")
+    profiled_client.get("/admin/profiles", headers=ADMIN)
+    
+    summaries = profiled_client.get("/admin/profiles", headers=ADMIN).json()
+    assert [(summary["path"], summary["trigger"]) for summary in summaries] == [("/slow", "threshold")]
+    assert summaries[0]["duration_ms"] >= 50
+
+
+def test_profile_header_skipped_when_profiler_busy(profiled_client, auth_headers, monkeypatch):
+    """Test a requested profile waits briefly, then reports that it was skipped."""
+    monkeypatch.setattr(profiling, "PROFILE_LOCK_WAIT_SECONDS", 0.05)
+    
+    assert profiling._profiler_lock.acquire(blocking=False)
+    try:
+        response = profiled_client.get("/dashboard/", headers={**auth_headers, "X-Profile": "admin-secret"})
+    finally:
+        profiling._profiler_lock.release()
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers[profiling.PROFILE_SKIPPED_HEADER] == "busy"
+    assert PROFILE_ID_HEADER not in response.headers
+
+
+def test_threshold_profiling_yields_to_waiting_header(profiled_client, monkeypatch):
+    """Test slow-request profiling does not start while a requested profile waits."""
+    monkeypatch.setattr(settings, "PROFILE_SLOW_REQUEST_MS", 30)
+    monkeypatch.setattr(profiling, "_header_waiters", 1)
+    
+    profiled_client.get("/slow")
+    
+    assert profiled_client.get("/admin/profiles", headers=ADMIN).json() == []
+
+
+def test_profile_buffer_keeps_latest():
+    """Test the ring buffer drops the oldest profiles."""
+    buffer = ProfileBuffer(2)
+    for path in ("/a", "/b", "/c"):
+        profile_id = buffer.next_id()
+        buffer.add(RequestProfile(
+            id=profile_id, method="GET", path=path, status_code=200, trigger="header",
+            started_at=datetime.utcnow(), duration_ms=1, sql_statements=0, sql_ms=0,
+            functions=[], sql_timeline=[]
+        ))
+    
+    assert [profile.path for profile in buffer.list()] == ["/c", "/b"]
+    assert buffer.get(1) is None
@@ -1,7 +1,10 @@
 """Test SMS parser service."""
+import json
 import pytest
 from decimal import Decimal
-from app.services.sms_parser import parse_sms
+from app.config import get_settings
+from app.routers import sms_parser as sms_router
+from app.services.sms_parser import parse_sms, parse_multiple_sms
 
 
 def test_parse_hdfc_debit_sms():
@@ -60,3 +63,131 @@ def test_parse_invalid_sms():
     
     assert result.success is False
     assert result.amount is None
+
+
+def test_parse_axis_sms():
+    """Test parsing Axis Bank UPI SMS."""
+    sms = "Rs.2,000.00 sent from Axis Bank A/C no. XX5678 to merchant@okaxis via UPI on 14-02-2026. UPI Ref no: 987654321"
+    result = parse_sms(sms)
+    
+    assert result.success is True
+    assert result.bank == "AXIS"
+    assert result.amount == Decimal("2000.00")
+    assert result.transaction_type == "DEBIT"
+    assert result.account_last4 == "5678"
+    assert result.reference_number == "987654321"
+
+
+def test_parse_kotak_credit_sms():
+    """Test parsing Kotak Bank credit SMS."""
+    sms = "Amt of Rs.1,234.50 credited to A/c XX4321 on 14-02-26 towards SALARY. Avl Bal: Rs.10,000.00"
+    result = parse_sms(sms)
+    
+    assert result.success is True
+    assert result.bank == "KOTAK"
+    assert result.amount == Decimal("1234.50")
+    assert result.transaction_type == "CREDIT"
+    assert result.merchant == "SALARY"
+    assert result.available_balance == Decimal("10000.00")
+
+
+def test_parse_promotional_sms_with_bank_name():
+    """Test promotional SMS mentioning a bank are not parsed as transactions."""
+    sms = "ICICI Bank: Your statement for card XX1234 is ready. Total due Rs 2,500.00, due on 14-Feb-26."
+    result = parse_sms(sms)
+    
+    assert result.success is False
+    assert result.bank is None
+
+
+SAMPLE_SMS = [
+    "Rs.1,500.00 debited from a/c **1234 on 14-02-26 to VPA merchant@upi (UPI Ref No 123456789). Avl Bal Rs.50,000.00",
+    "This is not a bank SMS message",
+    "Your a/c no. XX1234 is debited by Rs.500.00 on 14Feb26 (UPI Ref No 123456). If not done by u, call...",
+    "ICICI Bank Acct XX1234 debited for Rs 2,500.00 on 14-Feb-26; UPI:merchant@bank credited. UPI Ref:123456",
+    "Your HDFC Credit Card XX1234 has been used for a transaction of INR 5,000.00 at MERCHANT on 14-02-2026",
+]
+
+
+def test_parse_bulk_process_pool_matches_serial(client, monkeypatch):
+    """Test the chunked process-pool path returns the serial results in order."""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "SMS_PARALLEL_THRESHOLD", 1)
+    monkeypatch.setattr(settings, "SMS_PARSE_CHUNK_SIZE", 2)
+    monkeypatch.setattr(settings, "SMS_PARSE_WORKERS", 2)
+    
+    response = client.post("/sms/parse-bulk", json=SAMPLE_SMS * 3)
+    
+    assert response.status_code == 200
+    assert response.json() == [result.to_dict() for result in parse_multiple_sms(SAMPLE_SMS * 3)]
+
+
+def test_parse_stream_ndjson(client, monkeypatch):
+    """Test NDJSON streaming parses strings and objects and reports bad lines."""
+    monkeypatch.setattr(get_settings(), "SMS_PARSE_CHUNK_SIZE", 2)
+    lines = [json.dumps(SAMPLE_SMS[0]), json.dumps({"sms_text": SAMPLE_SMS[2]}), "{not json", json.dumps(SAMPLE_SMS[1])]
+    
+    response = client.post(
+        "/sms/parse-stream",
+        content="\n".join(lines) + "\n",
+        headers={"Content-Type": "application/x-ndjson"}
+    )
+    
+    assert response.status_code == 200
+    results = [json.loads(line) for line in response.text.splitlines()]
+    assert {"line": 3, "error": "Invalid JSON"} in results
+    parsed = [result for result in results if "error" not in result]
+    assert [result["bank"] for result in parsed] == ["HDFC", "SBI"]
+
+
+def test_parse_stream_rejects_large_body(client, monkeypatch):
+    """Test NDJSON bodies over the size limit are rejected before parsing."""
+    monkeypatch.setattr(sms_router, "SMS_STREAM_MAX_BYTES", 64)
+    body = "\n".join(json.dumps(sms) for sms in SAMPLE_SMS)
+    
+    response = client.post(
+        "/sms/parse-stream",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert response.status_code == 413
+    
+    # Chunked uploads have no Content-Length and are cut off while reading
+    response = client.post(
+        "/sms/parse-stream",
+        content=iter([body.encode()]),
+        headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert response.status_code == 413
+
+
+def test_import_sms_creates_transactions_once(client, auth_headers, db_session):
+    """Test SMS import maps results to transactions and re-imports are no-ops."""
+    from tests.test_transactions import rollup_totals
+    
+    response = client.post("/sms/import", json={"messages": SAMPLE_SMS}, headers=auth_headers)
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["imported"] == 4
+    assert data["duplicates"] == 0
+    assert data["unparsed"] == 1
+    
+    transactions = client.get("/transactions/", headers=auth_headers).json()
+    assert len(transactions) == 4
+    assert {t["source"] for t in transactions} == {"SMS"}
+    assert {t["account_identifier"] for t in transactions} == {"1234"}
+    assert sum(Decimal(t["amount"]) for t in transactions) == Decimal("9500.00")
+    
+    # Re-syncing the inbox with one new message only imports the new one
+    new_sms = "Your a/c no. XX9876 is credited by Rs.2,000.00 on 15Feb26 (UPI Ref No 654321). If not done by u, call..."
+    response = client.post("/sms/import", json={"messages": SAMPLE_SMS + [new_sms, new_sms]}, headers=auth_headers)
+    
+    data = response.json()
+    assert data["imported"] == 1
+    assert data["duplicates"] == 5
+    assert len(client.get("/transactions/", headers=auth_headers).json()) == 5
+    
+    totals = rollup_totals(db_session)
+    assert sum(amount for (_, kind, _), (amount, _) in totals.items() if kind == "EXPENSE") == Decimal("9500.00")
+    assert sum(amount for (_, kind, _), (amount, _) in totals.items() if kind == "INCOME") == Decimal("2000.00")
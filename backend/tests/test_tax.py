@@ -1,8 +1,16 @@
 """Test tax calculation service."""
 import pytest
-from decimal import Decimal
-from app.services.tax_calculator import calculate_tax_new_regime, calculate_tax_old_regime
-from app.utils.constants import NEW_REGIME_STANDARD_DEDUCTION
+from datetime import date
+from decimal import Decimal, ROUND_HALF_UP
+from fastapi import status
+from sqlalchemy import event
+from app.models.investment import Investment, InvestmentType, TaxSection
+from app.models.tax_deduction import TaxDeduction, TaxDeductionSection
+from app.services.deduction_service import get_deduction_totals
+from app.services.tax_calculator import calculate_tax_new_regime, calculate_tax_old_regime, calculate_tax_batch, optimize_deductions
+from app.services.tax_rules import TAX_RULES_DIR, TaxRulesRegistry, UnknownFinancialYearError, get_tax_rules
+
+NEW_REGIME_STANDARD_DEDUCTION = get_tax_rules("2025-26").new_regime_standard_deduction
 
 
 def test_tax_new_regime_below_exemption():
@@ -48,3 +56,232 @@ def test_tax_old_regime_with_deductions():
     
     assert result.total_deductions == Decimal("150000")
     assert result.taxable_income == Decimal("850000")
+
+
+def test_tax_batch_matches_single_calculation():
+    """Test batch results equal single calculations rounded to the paisa."""
+    incomes = [Decimal(v) for v in [
+        "0", "75000", "300000", "775000", "775000.01", "1075000", "1234567.89",
+        "1575000", "2500000.55", "10000000"
+    ]]
+    deductions = Decimal("150000")
+    
+    result = calculate_tax_batch(incomes, deductions)
+    
+    for i, income in enumerate(incomes):
+        new = calculate_tax_new_regime(income, NEW_REGIME_STANDARD_DEDUCTION)
+        old = calculate_tax_old_regime(income, deductions)
+        for single, batch in [(new, result.new_regime), (old, result.old_regime)]:
+            for field in ["taxable_income", "tax_before_rebate", "rebate_87a", "total_tax", "cess", "final_tax"]:
+                expected = getattr(single, field).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+                assert getattr(batch, field)[i] == expected
+        
+        expected_regime = "NEW" if new.final_tax < old.final_tax else "OLD"
+        assert result.recommended_regime[i] == expected_regime
+
+
+def test_tax_calculate_batch_endpoint(client, auth_headers):
+    """Test batch tax endpoint with explicit old regime deductions."""
+    response = client.post(
+        "/tax/calculate-batch",
+        json={"gross_incomes": ["700000", "1575000"], "old_regime_deductions": "150000"},
+        headers=auth_headers
+    )
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["new_regime"]["final_tax"] == ["0.00", "145600.00"]
+    assert data["old_regime"]["taxable_income"] == ["550000.00", "1425000.00"]
+    assert data["recommended_regime"] == ["NEW", "NEW"]
+    
+    response = client.post("/tax/calculate-batch", json={"gross_incomes": ["-1"]}, headers=auth_headers)
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_optimize_break_even_deduction():
+    """Test break-even deduction makes the old regime exactly competitive."""
+    result = optimize_deductions(Decimal("1200000"), {"80C": Decimal("50000")})
+    
+    # New regime: (20000 + 30000 + 15000) * 1.04
+    assert result.new_regime_tax == Decimal("71500")
+    assert result.break_even_deduction == Decimal("418750")
+    assert calculate_tax_old_regime(Decimal("1200000"), result.break_even_deduction).final_tax == result.new_regime_tax
+    assert not result.break_even_achievable
+    assert result.recommended_regime == "NEW"
+    assert all(allocation.additional == 0 for allocation in result.allocations)
+
+
+def test_optimize_allocates_remaining_limits():
+    """Test allocation fills section limits in order when the old regime can win."""
+    result = optimize_deductions(Decimal("800000"), {"80C": Decimal("100000")})
+    
+    assert result.new_regime_tax == Decimal("23400")
+    assert result.break_even_deduction == Decimal("250000")
+    assert result.break_even_achievable
+    assert [a.additional for a in result.allocations] == [Decimal("50000"), Decimal("50000"), Decimal("75000")]
+    assert result.optimized_deductions == Decimal("275000")
+    assert result.recommended_regime == "OLD"
+    assert result.optimized_tax == Decimal("18200")
+    assert result.savings == Decimal("5200")
+
+
+def test_optimize_stops_at_rebate_limit():
+    """Test no deductions are suggested once taxable income is within the rebate."""
+    result = optimize_deductions(Decimal("650000"), {"80C": Decimal("150000")})
+    
+    assert result.old_regime_tax == Decimal("0")
+    assert result.recommended_regime == "OLD"
+    assert result.optimized_deductions == Decimal("150000")
+    assert all(allocation.additional == 0 for allocation in result.allocations)
+    
+    # Without existing deductions, investing only ties the zero-tax new regime
+    result = optimize_deductions(Decimal("650000"), {})
+    assert result.recommended_regime == "NEW"
+    assert result.optimized_deductions == Decimal("0")
+
+
+def test_optimize_endpoint(client, auth_headers):
+    """Test optimizer endpoint uses the user's 80C investments."""
+    client.post(
+        "/investments/",
+        json={
+            "name": "PPF",
+            "investment_type": "PPF",
+            "amount_invested": "100000.00",
+            "start_date": "2025-04-01",
+            "is_tax_saving": True,
+            "tax_section": "80C"
+        },
+        headers=auth_headers
+    )
+    
+    response = client.get("/tax/optimize?gross_income=800000", headers=auth_headers)
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["current_deductions"] == "100000.00"
+    assert data["recommended_regime"] == "OLD"
+
+
+def test_tax_rules_registry_adds_years_from_files(tmp_path):
+    """Test a new financial year is picked up from its rules file."""
+    rules_text = open(f"{TAX_RULES_DIR}/2025-26.json").read()
+    (tmp_path / "2025-26.json").write_text(rules_text)
+    (tmp_path / "2026-27.json").write_text(
+        rules_text.replace('"2025-26"', '"2026-27"').replace('"standard_deduction": 75000', '"standard_deduction": 100000')
+    )
+    registry = TaxRulesRegistry(str(tmp_path))
+    
+    assert registry.financial_years() == ["2025-26", "2026-27"]
+    rules = registry.get("2026-27")
+    assert rules.new_regime_standard_deduction == Decimal("100000")
+    assert rules.deduction_limits["80C"] == Decimal("150000")
+    assert registry.get("2026-27") is rules
+    
+    with pytest.raises(UnknownFinancialYearError):
+        registry.get("2030-31")
+    with pytest.raises(TypeError):
+        rules.deduction_limits["80C"] = Decimal("0")
+
+
+def test_tax_endpoints_reject_unknown_financial_year(client, auth_headers):
+    """Test tax endpoints return 400 for a year without rules."""
+    response = client.get("/tax/section-80c?financial_year=1999-00", headers=auth_headers)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    
+    response = client.post(
+        "/tax/calculate",
+        json={"financial_year": "1999-00", "gross_income": "800000"},
+        headers=auth_headers
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_deduction_totals_combine_sources_in_one_query(db_session, test_user):
+    """Test per-section totals from investments and recorded deductions."""
+    def investment(section, amount, start_date, is_active=True):
+        row = Investment(
+            user_id=test_user.id,
+            name=f"{section.value} {amount}",
+            investment_type=InvestmentType.OTHER,
+            amount_invested=Decimal(amount),
+            start_date=start_date,
+            tax_section=section,
+            is_active=is_active
+        )
+        db_session.add(row)
+        return row
+    
+    investment(TaxSection.SEC_80C, "50000", date(2025, 6, 1))
+    investment(TaxSection.SEC_80C, "70000", date(2024, 6, 1))  # Previous year
+    investment(TaxSection.SEC_80C, "10000", date(2025, 6, 1), is_active=False)
+    investment(TaxSection.SEC_80CCD, "20000", date(2026, 3, 31))
+    linked = investment(TaxSection.SEC_80D, "30000", date(2025, 7, 1))
+    db_session.flush()
+    
+    for section, amount, year, investment_id in [
+        (TaxDeductionSection.SEC_80C, "15000", "2025-26", None),
+        (TaxDeductionSection.SEC_80D, "30000", "2025-26", linked.id),
+        (TaxDeductionSection.SEC_80E, "40000", "2025-26", None),
+        (TaxDeductionSection.SEC_80C, "99000", "2024-25", None),
+    ]:
+        db_session.add(TaxDeduction(
+            user_id=test_user.id,
+            section=section,
+            amount=Decimal(amount),
+            financial_year=year,
+            investment_id=investment_id
+        ))
+    db_session.commit()
+    user_id = test_user.id
+    
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db_session.bind, "before_cursor_execute", listener)
+    try:
+        totals = get_deduction_totals(db_session, user_id, "2025-26")
+    finally:
+        event.remove(db_session.bind, "before_cursor_execute", listener)
+    
+    assert len(statements) == 1
+    assert totals == {
+        "80C": Decimal("65000"),
+        "80CCD_1B": Decimal("20000"),
+        "80D": Decimal("30000"),
+        "80E": Decimal("40000"),
+    }
+
+
+def test_tax_summary_etag(client, auth_headers):
+    """Test tax summary payload and conditional requests with its ETag."""
+    url = "/tax/summary?gross_income=1000000"
+    response = client.get(url, headers=auth_headers)
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["section_80c"]["utilized"] == "0"
+    assert data["comparison"]["recommended_regime"] == "NEW"
+    etag = response.headers["ETag"]
+    
+    response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+    
+    # A new 80C investment changes the summary and its tag
+    client.post(
+        "/investments/",
+        json={
+            "name": "ELSS",
+            "investment_type": "ELSS",
+            "amount_invested": "50000.00",
+            "start_date": "2025-05-01",
+            "is_tax_saving": True,
+            "tax_section": "80C"
+        },
+        headers=auth_headers
+    )
+    response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+    assert response.json()["section_80c"]["utilized"] == "50000.00"
@@ -0,0 +1,178 @@
+"""Test transaction endpoints."""
+import base64
+import pytest
+from decimal import Decimal
+from datetime import date
+from fastapi import status
+from sqlalchemy.exc import IntegrityError
+from app.models.monthly_rollup import MonthlyRollup
+from app.models.transaction import TransactionType, RichDadCategory
+from app.services.rollup_service import apply_rollup_delta, rebuild_monthly_rollups
+
+
+def rollup_totals(db):
+    """Get rollup totals keyed by (month, type, category)."""
+    db.expire_all()
+    totals = {}
+    for rollup in db.query(MonthlyRollup).all():
+        key = (rollup.month, rollup.type.value, rollup.category)
+        amount, count = totals.get(key, (Decimal("0"), 0))
+        totals[key] = (amount + rollup.total_amount, count + rollup.transaction_count)
+    return {key: value for key, value in totals.items() if value[1]}
+
+
+def test_transaction_writes_maintain_rollups(client, auth_headers, db_session):
+    """Test create, update and delete keep monthly rollups in sync."""
+    month = date.today().replace(day=1)
+    payload = {
+        "type": "EXPENSE",
+        "category": "Food",
+        "amount": "250.00",
+        "transaction_date": month.isoformat()
+    }
+    first = client.post("/transactions/", json=payload, headers=auth_headers)
+    second = client.post("/transactions/", json={**payload, "amount": "100.00"}, headers=auth_headers)
+    assert first.status_code == status.HTTP_201_CREATED
+    assert second.status_code == status.HTTP_201_CREATED
+    
+    assert rollup_totals(db_session) == {(month, "EXPENSE", "Food"): (Decimal("350.00"), 2)}
+    
+    response = client.put(
+        f"/transactions/{second.json()['id']}",
+        json={"category": "Groceries", "amount": "120.00"},
+        headers=auth_headers
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert rollup_totals(db_session) == {
+        (month, "EXPENSE", "Food"): (Decimal("250.00"), 1),
+        (month, "EXPENSE", "Groceries"): (Decimal("120.00"), 1),
+    }
+    
+    response = client.delete(f"/transactions/{first.json()['id']}", headers=auth_headers)
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert rollup_totals(db_session) == {(month, "EXPENSE", "Groceries"): (Decimal("120.00"), 1)}
+    
+    # A rebuild from raw transactions produces the same totals
+    expected = rollup_totals(db_session)
+    rebuild_monthly_rollups(db_session)
+    assert rollup_totals(db_session) == expected
+
+
+def test_rollup_keys_are_unique(db_session, test_user):
+    """Test repeated deltas share one row per key and duplicates are rejected."""
+    month = date(2026, 1, 1)
+    for rich_dad_category in [None, RichDadCategory.PASSIVE_INCOME]:
+        for amount in [Decimal("10.00"), Decimal("5.00")]:
+            apply_rollup_delta(
+                db_session, test_user.id, TransactionType.INCOME, "Dividends",
+                rich_dad_category, month, amount, 1
+            )
+    db_session.commit()
+    
+    rows = db_session.query(MonthlyRollup).filter(MonthlyRollup.user_id == test_user.id).all()
+    assert sorted((row.total_amount, row.transaction_count) for row in rows) == [
+        (Decimal("15.00"), 2),
+        (Decimal("15.00"), 2),
+    ]
+    
+    db_session.add(MonthlyRollup(
+        user_id=test_user.id,
+        month=month,
+        type=TransactionType.INCOME,
+        category="Dividends",
+        rich_dad_category=RichDadCategory.PASSIVE_INCOME,
+        total_amount=Decimal("1.00"),
+        transaction_count=1
+    ))
+    with pytest.raises(IntegrityError):
+        db_session.commit()
+    db_session.rollback()
+
+
+def test_transactions_keyset_pagination(client, auth_headers):
+    """Test cursor paging returns every row once, even with inserts mid-scroll."""
+    created = []
+    for day in [1, 2, 2, 2, 3, 4, 5]:
+        response = client.post(
+            "/transactions/",
+            json={
+                "type": "EXPENSE",
+                "category": "Food",
+                "amount": "10.00",
+                "transaction_date": date(2026, 1, day).isoformat()
+            },
+            headers=auth_headers
+        )
+        created.append(response.json()["id"])
+    
+    seen = []
+    response = client.get("/transactions/?limit=3", headers=auth_headers)
+    while True:
+        assert response.status_code == status.HTTP_200_OK
+        seen.extend(txn["id"] for txn in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        if len(seen) == 3:
+            # A newer import landing between pages must not shift later pages
+            client.post(
+                "/transactions/",
+                json={"type": "EXPENSE", "category": "Food", "amount": "1.00", "transaction_date": "2026-01-06"},
+                headers=auth_headers
+            )
+        response = client.get(f"/transactions/?limit=3&cursor={cursor}", headers=auth_headers)
+    
+    assert sorted(seen) == sorted(created)
+    assert len(seen) == len(set(seen))
+
+
+def test_transactions_invalid_cursor(client, auth_headers):
+    """Test a malformed cursor is rejected."""
+    response = client.get("/transactions/?cursor=not-a-cursor", headers=auth_headers)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    
+    # Well-formed JSON of the right length, but not strings
+    cursor = base64.urlsafe_b64encode(b"[1,2]").decode()
+    response = client.get(f"/transactions/?cursor={cursor}", headers=auth_headers)
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_bulk_create_transactions(client, auth_headers, db_session):
+    """Test bulk creation writes valid items and reports invalid ones."""
+    month = date.today().replace(day=1)
+    items = [
+        {"type": "EXPENSE", "category": "Food", "amount": "100.00", "transaction_date": month.isoformat()},
+        {"type": "EXPENSE", "category": "Food", "amount": "-5.00", "transaction_date": month.isoformat()},
+        {"type": "EXPENSE", "category": "Food", "amount": "50.00", "transaction_date": month.isoformat()},
+        {"type": "INCOME", "category": "Salary", "amount": "1000.00"},
+    ]
+    response = client.post("/transactions/bulk", json={"transactions": items}, headers=auth_headers)
+    
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["created"] == 2
+    assert data["failed"] == 2
+    assert [result["status"] for result in data["results"]] == ["created", "invalid", "created", "invalid"]
+    assert "amount" in data["results"][1]["error"]
+    assert "transaction_date" in data["results"][3]["error"]
+    
+    listed = client.get("/transactions/", headers=auth_headers).json()
+    assert {txn["id"] for txn in listed} == {data["results"][0]["id"], data["results"][2]["id"]}
+    assert rollup_totals(db_session) == {(month, "EXPENSE", "Food"): (Decimal("150.00"), 2)}
+
+
+def test_bulk_create_all_or_nothing(client, auth_headers):
+    """Test all_or_nothing rejects the whole batch when any item is invalid."""
+    items = [
+        {"type": "EXPENSE", "category": "Food", "amount": "100.00", "transaction_date": "2026-01-01"},
+        {"type": "UNKNOWN", "category": "Food", "amount": "100.00", "transaction_date": "2026-01-01"},
+    ]
+    response = client.post(
+        "/transactions/bulk",
+        json={"transactions": items, "all_or_nothing": True},
+        headers=auth_headers
+    )
+    
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert [result["status"] for result in response.json()["detail"]] == ["skipped", "invalid"]
+    assert client.get("/transactions/", headers=auth_headers).json() == []
@@ -16,15 +16,20 @@ class ApiConfig {
   static const String taxSection80D = '/tax/section-80d';
   static const String taxCalculate = '/tax/calculate';
   static const String taxCompare = '/tax/compare';
+  static const String taxSummary = '/tax/summary';
   
   static const String dashboard = '/dashboard';
   
   static const String smsParse = '/sms/parse';
   static const String smsParseBulk = '/sms/parse-bulk';
+  static const String smsImport = '/sms/import';
   
   static const String marketStock = '/market/stock';
   static const String marketMutualFund = '/market/mutual-fund';
   
+  // Pagination
+  static const String nextCursorHeader = 'x-next-cursor';
+  
   // Timeouts
   static const Duration connectTimeout = Duration(seconds: 30);
   static const Duration receiveTimeout = Duration(seconds: 30);
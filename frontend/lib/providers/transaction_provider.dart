@@ -7,15 +7,20 @@ import 'package:indian_finance_app/services/api_service.dart';
 class TransactionProvider with ChangeNotifier {
   final ApiService _apiService = ApiService();
   
+  static const int _pageSize = 50;
+
   List<Transaction> _transactions = [];
+  Map<String, dynamic> _queryParams = {};
+  String? _nextCursor;
   bool _isLoading = false;
   String? _error;
 
   List<Transaction> get transactions => _transactions;
+  bool get hasMore => _nextCursor != null;
   bool get isLoading => _isLoading;
   String? get error => _error;
 
-  /// Fetch all transactions
+  /// Fetch the first page of transactions
   Future<void> fetchTransactions({
     TransactionType? type,
     String? category,
@@ -27,7 +32,7 @@ class TransactionProvider with ChangeNotifier {
     notifyListeners();
 
     try {
-      final queryParams = <String, dynamic>{};
+      final queryParams = <String, dynamic>{'limit': _pageSize};
       if (type != null) queryParams['transaction_type'] = type.name;
       if (category != null) queryParams['category'] = category;
       if (startDate != null) queryParams['start_date'] = startDate.toIso8601String().split('T')[0];
@@ -38,6 +43,8 @@ class TransactionProvider with ChangeNotifier {
         queryParameters: queryParams,
       );
 
+      _queryParams = queryParams;
+      _nextCursor = response.headers.value(ApiConfig.nextCursorHeader);
       _transactions = (response.data as List)
           .map((json) => Transaction.fromJson(json))
           .toList();
@@ -51,6 +58,33 @@ class TransactionProvider with ChangeNotifier {
     }
   }
 
+  /// Fetch the next page of transactions using the server cursor
+  Future<void> fetchMoreTransactions() async {
+    if (_isLoading || _nextCursor == null) return;
+
+    _isLoading = true;
+    _error = null;
+    notifyListeners();
+
+    try {
+      final response = await _apiService.get(
+        ApiConfig.transactions,
+        queryParameters: {..._queryParams, 'cursor': _nextCursor},
+      );
+
+      _nextCursor = response.headers.value(ApiConfig.nextCursorHeader);
+      _transactions.addAll((response.data as List)
+          .map((json) => Transaction.fromJson(json)));
+      
+      _isLoading = false;
+      notifyListeners();
+    } catch (e) {
+      _error = e.toString();
+      _isLoading = false;
+      notifyListeners();
+    }
+  }
+
   /// Add new transaction
   Future<bool> addTransaction(Transaction transaction) async {
     _isLoading = true;